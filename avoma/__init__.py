@@ -4,8 +4,30 @@ Avoma API Client
 A Python client for the Avoma API (https://api.avoma.com/docs).
 """
 
+from .cache import CacheBackend, LRUCache, ResponseCache
 from .client import AvomaClient
+from .instrumentation import MetricsCollector, RequestEvent, RequestHooks
 from .logging import create_logger, DEFAULT_FORMAT
+from .pagination import Paginator
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .sync_client import SyncAvomaClient
+from .transport import TransportConfig
 
 __version__ = "0.1.0"
-__all__ = ["AvomaClient", "create_logger", "DEFAULT_FORMAT"]
+__all__ = [
+    "AvomaClient",
+    "SyncAvomaClient",
+    "create_logger",
+    "DEFAULT_FORMAT",
+    "TokenBucket",
+    "RetryPolicy",
+    "Paginator",
+    "ResponseCache",
+    "LRUCache",
+    "CacheBackend",
+    "TransportConfig",
+    "RequestHooks",
+    "RequestEvent",
+    "MetricsCollector",
+]
@@ -0,0 +1,135 @@
+import asyncio
+from typing import AsyncIterable, AsyncIterator, Iterable, Optional, Sequence, Union
+
+from ..models.bulk import HydratedMeeting
+from ..models.meetings import Meeting
+
+
+class BulkAPI:
+    """Batch operations spanning several endpoints."""
+
+    INCLUDES = ("insights", "sentiments", "transcription", "recording")
+    """Related resources that can be fetched for each meeting"""
+
+    def __init__(self, client):
+        self.client = client
+        self.client.logger.debug("BulkAPI initialized")
+
+    async def hydrate(
+        self,
+        meetings: Union[Iterable[Meeting], AsyncIterable[Meeting]],
+        include: Optional[Sequence[str]] = None,
+        concurrency: int = 10,
+    ) -> AsyncIterator[HydratedMeeting]:
+        """Fetch related resources for many meetings concurrently.
+
+        All sub-requests of a meeting are issued at once and up to
+        ``concurrency`` meetings are hydrated at the same time. Every request
+        goes through the client's rate limiter, so the fan-out saturates the quota
+        without exceeding it. Resources whose readiness flag is false are skipped
+        without making a request:
+
+        * ``insights`` requires ``notes_ready``
+        * ``sentiments`` and ``transcription`` require ``transcript_ready``
+        * ``recording`` requires ``audio_ready`` or ``video_ready``
+
+        A failing sub-request doesn't abort the batch; its error is recorded on
+        the hydrated meeting instead.
+
+        Args:
+            meetings: Meetings to hydrate, e.g. ``client.meetings.iter(...)``
+            include: Resources to fetch (default: all of BulkAPI.INCLUDES)
+            concurrency: Maximum number of meetings hydrated at the same time
+
+        Yields:
+            Hydrated meetings in completion order
+        """
+        include = tuple(include) if include is not None else self.INCLUDES
+        unknown = set(include) - set(self.INCLUDES)
+        if unknown:
+            raise ValueError(f"Unknown includes: {', '.join(sorted(unknown))}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client.logger.debug(
+            "Hydrating meetings with %s (concurrency %s)",
+            ", ".join(include),
+            concurrency,
+        )
+        pending = set()
+        try:
+            async for meeting in _aiter(meetings):
+                if len(pending) >= concurrency:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    for task in done:
+                        yield task.result()
+                pending.add(asyncio.ensure_future(self._hydrate_one(meeting, include)))
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _is_ready(self, meeting: Meeting, resource: str) -> bool:
+        if resource == "insights":
+            return meeting.notes_ready
+        if resource == "transcription":
+            return meeting.transcript_ready and meeting.transcription_uuid is not None
+        if resource == "sentiments":
+            return meeting.transcript_ready
+        return meeting.audio_ready or meeting.video_ready
+
+    def _fetch(self, meeting: Meeting, resource: str):
+        if resource == "insights":
+            return self.client.meetings.get_insights(meeting.uuid)
+        if resource == "sentiments":
+            return self.client.meetings.get_sentiments(meeting.uuid)
+        if resource == "transcription":
+            return self.client.transcriptions.get(meeting.transcription_uuid)
+        return self.client.recordings.get_by_meeting(meeting.uuid)
+
+    async def _hydrate_one(
+        self, meeting: Meeting, include: Sequence[str]
+    ) -> HydratedMeeting:
+        hydrated = HydratedMeeting(meeting=meeting)
+        resources = []
+        for resource in include:
+            if self._is_ready(meeting, resource):
+                resources.append(resource)
+            else:
+                hydrated.skipped.append(resource)
+
+        results = await asyncio.gather(
+            *(self._fetch(meeting, resource) for resource in resources),
+            return_exceptions=True,
+        )
+        for resource, result in zip(resources, results):
+            if isinstance(result, BaseException):
+                self.client.logger.warning(
+                    "Failed to fetch %s for meeting %s: %r",
+                    resource,
+                    meeting.uuid,
+                    result,
+                )
+                hydrated.errors[resource] = repr(result)
+            else:
+                setattr(hydrated, resource, result)
+
+        self.client.logger.debug("Hydrated meeting: %s", meeting.uuid)
+        return hydrated
+
+
+async def _aiter(items):
+    if hasattr(items, "__aiter__"):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
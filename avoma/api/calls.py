@@ -2,6 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from ..models.calls import Call, CallCreate, CallUpdate, CallsList, CallsQuery
+from ..pagination import Paginator
 
 
 class CallsAPI:
@@ -11,6 +12,35 @@ class CallsAPI:
         self.client = client
         self.client.logger.debug("CallsAPI initialized")
 
+    def _list_params(
+        self,
+        from_date: str,
+        to_date: str,
+        host_email: Optional[str] = None,
+        participant_email: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> dict:
+        if host_email:
+            self.client.logger.debug("Filtering by host: %s", host_email)
+        if participant_email:
+            self.client.logger.debug("Filtering by participant: %s", participant_email)
+        if status:
+            self.client.logger.debug("Filtering by status: %s", status)
+
+        query = CallsQuery(
+            from_date=from_date,
+            to_date=to_date,
+            host_email=host_email,
+            participant_email=participant_email,
+            status=status,
+        )
+
+        params = query.model_dump(exclude_none=True)
+        if page_size is not None:
+            params["page_size"] = page_size
+        return params
+
     async def list(
         self,
         from_date: str,
@@ -33,32 +63,72 @@ class CallsAPI:
         Returns:
             Paginated list of calls
         """
-        self.client.logger.debug(f"Listing calls from {from_date} to {to_date}")
-
-        if host_email:
-            self.client.logger.debug(f"Filtering by host: {host_email}")
-        if participant_email:
-            self.client.logger.debug(f"Filtering by participant: {participant_email}")
-        if status:
-            self.client.logger.debug(f"Filtering by status: {status}")
-
-        query = CallsQuery(
-            from_date=from_date,
-            to_date=to_date,
+        self.client.logger.debug("Listing calls from %s to %s", from_date, to_date)
+        params = self._list_params(
+            from_date,
+            to_date,
             host_email=host_email,
             participant_email=participant_email,
             status=status,
+            page_size=page_size,
         )
 
-        params = query.model_dump(exclude_none=True)
-        if page_size is not None:
-            params["page_size"] = page_size
-
-        data = await self.client._request("GET", "/calls", params=params)
-        calls_list = CallsList.model_validate(data)
-        self.client.logger.debug(f"Retrieved {len(calls_list.results)} calls")
+        data = await self.client._request("GET", "/calls", params=params, raw=True)
+        calls_list = self.client._validate(CallsList, data)
+        self.client.logger.debug("Retrieved %s calls", len(calls_list.results))
         return calls_list
 
+    def paginate(
+        self,
+        from_date: str,
+        to_date: str,
+        host_email: Optional[str] = None,
+        participant_email: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: Optional[int] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> Paginator[Call]:
+        """Create a paginator over calls.
+
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            host_email: Optional host email to filter by
+            participant_email: Optional participant email to filter by
+            status: Optional status to filter by
+            page_size: Number of calls per page (max 20)
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Paginator yielding calls
+        """
+        self.client.logger.debug("Paginating calls from %s to %s", from_date, to_date)
+        params = self._list_params(
+            from_date,
+            to_date,
+            host_email=host_email,
+            participant_email=participant_email,
+            status=status,
+            page_size=page_size,
+        )
+        return Paginator(
+            self.client,
+            "/calls",
+            CallsList,
+            params=params,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     async def get(self, call_uuid: UUID) -> Call:
         """Get a specific call by UUID.
 
@@ -68,10 +138,10 @@ class CallsAPI:
         Returns:
             Call details
         """
-        self.client.logger.debug(f"Getting call with UUID: {call_uuid}")
-        data = await self.client._request("GET", f"/calls/{call_uuid}")
-        call = Call.model_validate(data)
-        self.client.logger.debug(f"Retrieved call: {call_uuid}")
+        self.client.logger.debug("Getting call with UUID: %s", call_uuid)
+        data = await self.client._request("GET", f"/calls/{call_uuid}", raw=True)
+        call = self.client._validate(Call, data)
+        self.client.logger.debug("Retrieved call: %s", call_uuid)
         return call
 
     async def create(self, call: CallCreate) -> Call:
@@ -85,10 +155,10 @@ class CallsAPI:
         """
         self.client.logger.debug("Creating new call")
         data = await self.client._request(
-            "POST", "/calls", json=call.model_dump(exclude_unset=True)
+            "POST", "/calls", json=call.model_dump(exclude_unset=True), raw=True
         )
-        created_call = Call.model_validate(data)
-        self.client.logger.debug(f"Created call with UUID: {created_call.uuid}")
+        created_call = self.client._validate(Call, data)
+        self.client.logger.debug("Created call with UUID: %s", created_call.uuid)
         return created_call
 
     async def update(self, call_uuid: UUID, call: CallUpdate) -> Call:
@@ -101,12 +171,15 @@ class CallsAPI:
         Returns:
             Updated call
         """
-        self.client.logger.debug(f"Updating call with UUID: {call_uuid}")
+        self.client.logger.debug("Updating call with UUID: %s", call_uuid)
         data = await self.client._request(
-            "PUT", f"/calls/{call_uuid}", json=call.model_dump(exclude_unset=True)
+            "PUT",
+            f"/calls/{call_uuid}",
+            json=call.model_dump(exclude_unset=True),
+            raw=True,
         )
-        updated_call = Call.model_validate(data)
-        self.client.logger.debug(f"Updated call: {call_uuid}")
+        updated_call = self.client._validate(Call, data)
+        self.client.logger.debug("Updated call: %s", call_uuid)
         return updated_call
 
     async def cancel(self, call_uuid: UUID) -> Call:
@@ -118,10 +191,12 @@ class CallsAPI:
         Returns:
             Updated call with cancelled status
         """
-        self.client.logger.debug(f"Cancelling call with UUID: {call_uuid}")
-        data = await self.client._request("POST", f"/calls/{call_uuid}/cancel")
-        cancelled_call = Call.model_validate(data)
-        self.client.logger.debug(f"Call {call_uuid} cancelled")
+        self.client.logger.debug("Cancelling call with UUID: %s", call_uuid)
+        data = await self.client._request(
+            "POST", f"/calls/{call_uuid}/cancel", raw=True
+        )
+        cancelled_call = self.client._validate(Call, data)
+        self.client.logger.debug("Call %s cancelled", call_uuid)
         return cancelled_call
 
     async def start(self, call_uuid: UUID) -> Call:
@@ -133,10 +208,10 @@ class CallsAPI:
         Returns:
             Updated call with in_progress status
         """
-        self.client.logger.debug(f"Starting call with UUID: {call_uuid}")
-        data = await self.client._request("POST", f"/calls/{call_uuid}/start")
-        started_call = Call.model_validate(data)
-        self.client.logger.debug(f"Call {call_uuid} started")
+        self.client.logger.debug("Starting call with UUID: %s", call_uuid)
+        data = await self.client._request("POST", f"/calls/{call_uuid}/start", raw=True)
+        started_call = self.client._validate(Call, data)
+        self.client.logger.debug("Call %s started", call_uuid)
         return started_call
 
     async def end(self, call_uuid: UUID) -> Call:
@@ -148,8 +223,8 @@ class CallsAPI:
         Returns:
             Updated call with completed status
         """
-        self.client.logger.debug(f"Ending call with UUID: {call_uuid}")
-        data = await self.client._request("POST", f"/calls/{call_uuid}/end")
-        ended_call = Call.model_validate(data)
-        self.client.logger.debug(f"Call {call_uuid} ended")
+        self.client.logger.debug("Ending call with UUID: %s", call_uuid)
+        data = await self.client._request("POST", f"/calls/{call_uuid}/end", raw=True)
+        ended_call = self.client._validate(Call, data)
+        self.client.logger.debug("Call %s ended", call_uuid)
         return ended_call
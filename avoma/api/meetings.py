@@ -1,9 +1,12 @@
+import asyncio
 from datetime import datetime
-from typing import Optional, List
+from typing import AsyncIterator, Dict, Iterable, Optional, List, Sequence, Union
 from uuid import UUID
 from urllib.parse import urlparse, parse_qs
 
 from ..models.meetings import Meeting, MeetingInsights, MeetingList, MeetingSentiment
+from ..pagination import Paginator
+from ..readiness import READY_FLAGS, ReadinessWaiter
 
 
 class MeetingsAPI:
@@ -11,8 +14,182 @@ class MeetingsAPI:
 
     def __init__(self, client):
         self.client = client
+        self._readiness: Optional[ReadinessWaiter] = None
         self.client.logger.debug("MeetingsAPI initialized")
 
+    def _list_params(
+        self,
+        from_date: str,
+        to_date: str,
+        page_size: Optional[int] = None,
+        is_call: Optional[bool] = None,
+        is_internal: Optional[bool] = None,
+        recording_duration__gte: Optional[float] = None,
+    ) -> dict:
+        params = {
+            "from_date": from_date,
+            "to_date": to_date,
+            "page_size": page_size or 100,  # Use max page size if not specified
+        }
+
+        if is_call is not None:
+            params["is_call"] = str(is_call).lower()
+        if is_internal is not None:
+            params["is_internal"] = str(is_internal).lower()
+        if recording_duration__gte is not None:
+            params["recording_duration__gte"] = recording_duration__gte
+        return params
+
+    def paginate(
+        self,
+        from_date: str,
+        to_date: str,
+        page_size: Optional[int] = None,
+        is_call: Optional[bool] = None,
+        is_internal: Optional[bool] = None,
+        recording_duration__gte: Optional[float] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> Paginator[Meeting]:
+        """Create a paginator over meetings.
+
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            page_size: Number of records per page (max 100)
+            is_call: Filter for voice calls
+            is_internal: Filter for internal meetings
+            recording_duration__gte: Minimum recording duration
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Paginator yielding meetings
+        """
+        self.client.logger.debug(
+            "Paginating meetings from %s to %s", from_date, to_date
+        )
+        params = self._list_params(
+            from_date,
+            to_date,
+            page_size=page_size,
+            is_call=is_call,
+            is_internal=is_internal,
+            recording_duration__gte=recording_duration__gte,
+        )
+        return Paginator(
+            self.client,
+            "meetings",
+            MeetingList,
+            params=params,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+            on_page=self._store_page if self.client.mirror is not None else None,
+        )
+
+    def _store_page(self, page: MeetingList) -> None:
+        # Keep the mirror's copies as fresh as the latest listing
+        self.client.mirror.save_meetings(page.results)
+
+    def iter_pages(
+        self,
+        from_date: str,
+        to_date: str,
+        page_size: Optional[int] = None,
+        is_call: Optional[bool] = None,
+        is_internal: Optional[bool] = None,
+        recording_duration__gte: Optional[float] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> AsyncIterator[MeetingList]:
+        """Iterate over pages of meetings as they are fetched.
+
+        Each page is yielded as soon as it has been validated, so only one page is
+        held in memory at a time (see :class:`avoma.pagination.Paginator` for the
+        prefetch and concurrency modes).
+
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            page_size: Number of records per page (max 100)
+            is_call: Filter for voice calls
+            is_internal: Filter for internal meetings
+            recording_duration__gte: Minimum recording duration
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Async iterator over pages of meetings
+        """
+        return self.paginate(
+            from_date,
+            to_date,
+            page_size=page_size,
+            is_call=is_call,
+            is_internal=is_internal,
+            recording_duration__gte=recording_duration__gte,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        ).pages()
+
+    def iter(
+        self,
+        from_date: str,
+        to_date: str,
+        page_size: Optional[int] = None,
+        is_call: Optional[bool] = None,
+        is_internal: Optional[bool] = None,
+        recording_duration__gte: Optional[float] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> AsyncIterator[Meeting]:
+        """Iterate over meetings, fetching pages lazily.
+
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            page_size: Number of records per page (max 100)
+            is_call: Filter for voice calls
+            is_internal: Filter for internal meetings
+            recording_duration__gte: Minimum recording duration
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Async iterator over meetings in the order returned by the API
+        """
+        return self.paginate(
+            from_date,
+            to_date,
+            page_size=page_size,
+            is_call=is_call,
+            is_internal=is_internal,
+            recording_duration__gte=recording_duration__gte,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        ).items()
+
     async def list(
         self,
         from_date: str,
@@ -24,6 +201,7 @@ class MeetingsAPI:
         follow_pagination: bool = False,
         from_page: Optional[int] = None,
         to_page: Optional[int] = None,
+        concurrency: int = 1,
     ) -> MeetingList:
         """List meetings with optional filters.
 
@@ -37,96 +215,82 @@ class MeetingsAPI:
             follow_pagination: If True, will fetch all pages
             from_page: Start from this page number (1-based)
             to_page: Stop at this page number (inclusive)
+            concurrency: Maximum number of pages fetched concurrently when
+                fetching more than one page
 
         Returns:
             Paginated list of meetings. If follow_pagination is True or page range is specified,
             will contain all meetings from the requested pages.
         """
-        self.client.logger.debug(f"Listing meetings from {from_date} to {to_date}")
-        params = {
-            "from_date": from_date,
-            "to_date": to_date,
-            "page_size": page_size or 100,  # Use max page size if not specified
-        }
+        self.client.logger.debug("Listing meetings from %s to %s", from_date, to_date)
+        paginator = self.paginate(
+            from_date,
+            to_date,
+            page_size=page_size,
+            is_call=is_call,
+            is_internal=is_internal,
+            recording_duration__gte=recording_duration__gte,
+            from_page=from_page,
+            to_page=to_page,
+            concurrency=concurrency,
+        )
 
-        if is_call is not None:
-            params["is_call"] = str(is_call).lower()
-        if is_internal is not None:
-            params["is_internal"] = str(is_internal).lower()
-        if recording_duration__gte is not None:
-            params["recording_duration__gte"] = recording_duration__gte
+        if not follow_pagination and not to_page:
+            # Only the first requested page
+            return await paginator.fetch_page(paginator.from_page)
+        return await paginator.collect()
 
-        # Determine the starting page
-        current_page = from_page if from_page else 1
+    async def get(self, uuid: UUID, refresh: bool = False) -> Meeting:
+        """Get a single meeting by UUID.
 
-        # Only include page parameter if we're not starting from page 1
-        first_params = params.copy()
-        if current_page > 1:
-            first_params["page"] = current_page
+        Args:
+            uuid: Meeting UUID
+            refresh: Whether to skip the client's mirror and fetch the meeting
+                from the API
 
-        # Get first page
-        data = await self.client._request("GET", "meetings", params=first_params)
-        meeting_list = MeetingList.model_validate(data)
-        self.client.logger.debug(f"Retrieved {len(meeting_list.results)} meetings")
+        Returns:
+            Meeting details, from the client's mirror if it holds a fresh copy
+        """
+        self.client.logger.debug("Getting meeting with UUID: %s", uuid)
+        mirror = self.client.mirror
+        if mirror is not None and not refresh:
+            meeting = mirror.get_meeting(uuid)
+            if meeting is not None:
+                self.client.logger.debug("Serving meeting %s from mirror", uuid)
+                return meeting
 
-        # Determine if we should continue fetching pages
-        should_continue = (follow_pagination and meeting_list.next) or (
-            to_page and current_page < to_page
-        )
+        data = await self.client._request("GET", f"meetings/{uuid}", raw=True)
+        meeting = self.client._validate(Meeting, data)
+        self.client.logger.debug("Retrieved meeting: %s", meeting.subject)
+        if mirror is not None:
+            mirror.save_meetings([meeting])
+        return meeting
 
-        if should_continue:
-            all_results = meeting_list.results
-            total_count = (
-                meeting_list.count
-            )  # Keep track of total count from first response
-            current_page += 1
-
-            while meeting_list.next and (not to_page or current_page <= to_page):
-                # Add page parameter for subsequent requests
-                params_with_page = params.copy()
-                params_with_page["page"] = current_page
-
-                data = await self.client._request(
-                    "GET", "meetings", params=params_with_page
-                )
-                meeting_list = MeetingList.model_validate(data)
-                all_results.extend(meeting_list.results)
-                self.client.logger.debug(
-                    f"Retrieved {len(meeting_list.results)} more meetings"
-                )
-                current_page += 1
-
-                # Stop if we've reached the end and we're not following pagination
-                if not follow_pagination and not to_page:
-                    break
-
-            # Create a new MeetingList with all results
-            has_more = meeting_list.next is not None and (
-                to_page is None or current_page <= to_page
-            )
-            meeting_list = MeetingList(
-                count=total_count,  # Use the total count from first response
-                next=meeting_list.next if has_more else None,
-                previous=None,
-                results=all_results,
-            )
-
-        return meeting_list
-
-    async def get(self, uuid: UUID) -> Meeting:
-        """Get a single meeting by UUID.
+    def wait_until_ready(
+        self,
+        meetings: Iterable[Union[Meeting, UUID, str]],
+        flags: Sequence[str] = READY_FLAGS,
+        timeout: Optional[float] = None,
+    ) -> Dict[UUID, asyncio.Future]:
+        """Wait for meetings to have their transcript, notes, audio, etc. ready.
+
+        Meetings are polled by a ReadinessWaiter shared by every call, which
+        batches polls of meetings that started close together into list
+        requests and backs off per meeting.
 
         Args:
-            uuid: Meeting UUID
+            meetings: Meetings or meeting UUIDs
+            flags: Boolean Meeting fields that must all be set
+                (default: transcript_ready, notes_ready, audio_ready)
+            timeout: Seconds after which a meeting's future fails with
+                asyncio.TimeoutError (default: wait forever)
 
         Returns:
-            Meeting details
+            Future by meeting UUID, resolving to the ready Meeting
         """
-        self.client.logger.debug(f"Getting meeting with UUID: {uuid}")
-        data = await self.client._request("GET", f"meetings/{uuid}")
-        meeting = Meeting.model_validate(data)
-        self.client.logger.debug(f"Retrieved meeting: {meeting.subject}")
-        return meeting
+        if self._readiness is None:
+            self._readiness = ReadinessWaiter(self.client)
+        return self._readiness.wait_until_ready(meetings, flags=flags, timeout=timeout)
 
     async def get_insights(self, uuid: UUID) -> MeetingInsights:
         """Get insights for a meeting.
@@ -135,12 +299,22 @@ class MeetingsAPI:
             uuid: Meeting UUID
 
         Returns:
-            Meeting insights including AI notes and keywords
+            Meeting insights including AI notes and keywords, from the client's
+            mirror if it holds a fresh copy
         """
-        self.client.logger.debug(f"Getting insights for meeting with UUID: {uuid}")
-        data = await self.client._request("GET", f"meetings/{uuid}/insights")
-        insights = MeetingInsights.model_validate(data)
-        self.client.logger.debug(f"Retrieved insights for meeting: {uuid}")
+        self.client.logger.debug("Getting insights for meeting with UUID: %s", uuid)
+        mirror = self.client.mirror
+        if mirror is not None:
+            insights = mirror.get_insights(uuid)
+            if insights is not None:
+                self.client.logger.debug("Serving insights %s from mirror", uuid)
+                return insights
+
+        data = await self.client._request("GET", f"meetings/{uuid}/insights", raw=True)
+        insights = self.client._validate(MeetingInsights, data)
+        self.client.logger.debug("Retrieved insights for meeting: %s", uuid)
+        if mirror is not None:
+            mirror.save_insights(uuid, insights)
         return insights
 
     async def get_sentiments(self, uuid: UUID) -> MeetingSentiment:
@@ -152,15 +326,15 @@ class MeetingsAPI:
         Returns:
             Meeting sentiment analysis
         """
-        self.client.logger.debug(f"Getting sentiments for meeting with UUID: {uuid}")
+        self.client.logger.debug("Getting sentiments for meeting with UUID: %s", uuid)
         data = await self.client._request(
             "GET", "meeting_sentiments", params={"uuid": str(uuid)}
         )
         # Check if data is a list and take the first item if it is
         if isinstance(data, list) and data:
             data = data[0]
-        sentiment = MeetingSentiment.model_validate(data)
-        self.client.logger.debug(f"Retrieved sentiments for meeting: {uuid}")
+        sentiment = self.client._validate(MeetingSentiment, data)
+        self.client.logger.debug("Retrieved sentiments for meeting: %s", uuid)
         return sentiment
 
     async def drop(self, uuid: UUID) -> dict:
@@ -172,7 +346,7 @@ class MeetingsAPI:
         Returns:
             Response message
         """
-        self.client.logger.debug(f"Dropping meeting with UUID: {uuid}")
+        self.client.logger.debug("Dropping meeting with UUID: %s", uuid)
         response = await self.client._request("POST", f"meetings/{uuid}/drop/")
-        self.client.logger.debug(f"Meeting {uuid} dropped")
+        self.client.logger.debug("Meeting %s dropped", uuid)
         return response
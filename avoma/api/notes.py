@@ -2,6 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from ..models.notes import Note, NotesList, NotesQuery
+from ..pagination import Paginator
 
 
 class NotesAPI:
@@ -11,7 +12,7 @@ class NotesAPI:
         self.client = client
         self.client.logger.debug("NotesAPI initialized")
 
-    async def list(
+    def _list_params(
         self,
         from_date: str,
         to_date: str,
@@ -19,26 +20,14 @@ class NotesAPI:
         custom_category: Optional[UUID] = None,
         output_format: str = "json",
         page_size: Optional[int] = None,
-    ) -> NotesList:
-        """List notes with optional filters.
-
-        Args:
-            from_date: Start date-time in ISO format
-            to_date: End date-time in ISO format
-            meeting_uuid: Optional meeting UUID to filter by
-            custom_category: Optional custom category UUID to filter by
-            output_format: Format of the notes (json, html, markdown)
-            page_size: Number of notes per page (max 20)
-
-        Returns:
-            Paginated list of notes
-        """
-        self.client.logger.debug(f"Listing notes from {from_date} to {to_date}")
-
+        ordering: Optional[str] = None,
+    ) -> dict:
         if meeting_uuid:
-            self.client.logger.debug(f"Filtering by meeting UUID: {meeting_uuid}")
+            self.client.logger.debug("Filtering by meeting UUID: %s", meeting_uuid)
         if custom_category:
-            self.client.logger.debug(f"Filtering by custom category: {custom_category}")
+            self.client.logger.debug(
+                "Filtering by custom category: %s", custom_category
+            )
 
         query = NotesQuery(
             from_date=from_date,
@@ -56,8 +45,102 @@ class NotesAPI:
             params["custom_category"] = str(custom_category)
         if page_size is not None:
             params["page_size"] = page_size
+        if ordering is not None:
+            params["o"] = ordering
+        return params
+
+    async def list(
+        self,
+        from_date: str,
+        to_date: str,
+        meeting_uuid: Optional[UUID] = None,
+        custom_category: Optional[UUID] = None,
+        output_format: str = "json",
+        page_size: Optional[int] = None,
+        ordering: Optional[str] = None,
+    ) -> NotesList:
+        """List notes with optional filters.
 
-        data = await self.client._request("GET", "notes", params=params)
-        notes_list = NotesList.model_validate(data)
-        self.client.logger.debug(f"Retrieved {len(notes_list.results)} notes")
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            meeting_uuid: Optional meeting UUID to filter by
+            custom_category: Optional custom category UUID to filter by
+            output_format: Format of the notes (json, html, markdown)
+            page_size: Number of notes per page (max 20)
+            ordering: Sort order (created, -created, modified or -modified,
+                default: API order)
+
+        Returns:
+            Paginated list of notes
+        """
+        self.client.logger.debug("Listing notes from %s to %s", from_date, to_date)
+        params = self._list_params(
+            from_date,
+            to_date,
+            meeting_uuid=meeting_uuid,
+            custom_category=custom_category,
+            output_format=output_format,
+            page_size=page_size,
+            ordering=ordering,
+        )
+
+        data = await self.client._request("GET", "notes", params=params, raw=True)
+        notes_list = self.client._validate(NotesList, data)
+        self.client.logger.debug("Retrieved %s notes", len(notes_list.results))
         return notes_list
+
+    def paginate(
+        self,
+        from_date: str,
+        to_date: str,
+        meeting_uuid: Optional[UUID] = None,
+        custom_category: Optional[UUID] = None,
+        output_format: str = "json",
+        page_size: Optional[int] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        ordering: Optional[str] = None,
+    ) -> Paginator[Note]:
+        """Create a paginator over notes.
+
+        Args:
+            from_date: Start date-time in ISO format
+            to_date: End date-time in ISO format
+            meeting_uuid: Optional meeting UUID to filter by
+            custom_category: Optional custom category UUID to filter by
+            output_format: Format of the notes (json, html, markdown)
+            page_size: Number of notes per page (max 20)
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+            ordering: Sort order (created, -created, modified or -modified,
+                default: API order)
+
+        Returns:
+            Paginator yielding notes
+        """
+        self.client.logger.debug("Paginating notes from %s to %s", from_date, to_date)
+        params = self._list_params(
+            from_date,
+            to_date,
+            meeting_uuid=meeting_uuid,
+            custom_category=custom_category,
+            output_format=output_format,
+            page_size=page_size,
+            ordering=ordering,
+        )
+        return Paginator(
+            self.client,
+            "notes",
+            NotesList,
+            params=params,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
@@ -18,12 +18,12 @@ class RecordingsAPI:
         Returns:
             Recording details including download URLs
         """
-        self.client.logger.debug(f"Getting recording for meeting: {meeting_uuid}")
+        self.client.logger.debug("Getting recording for meeting: %s", meeting_uuid)
         data = await self.client._request(
-            "GET", "/recordings", params={"meeting_uuid": str(meeting_uuid)}
+            "GET", "/recordings", params={"meeting_uuid": str(meeting_uuid)}, raw=True
         )
-        recording = Recording.model_validate(data)
-        self.client.logger.debug(f"Retrieved recording for meeting: {meeting_uuid}")
+        recording = self.client._validate(Recording, data)
+        self.client.logger.debug("Retrieved recording for meeting: %s", meeting_uuid)
         return recording
 
     async def get(self, uuid: UUID) -> Recording:
@@ -35,8 +35,8 @@ class RecordingsAPI:
         Returns:
             Recording details including download URLs
         """
-        self.client.logger.debug(f"Getting recording with UUID: {uuid}")
-        data = await self.client._request("GET", f"/recordings/{uuid}")
-        recording = Recording.model_validate(data)
-        self.client.logger.debug(f"Retrieved recording: {uuid}")
+        self.client.logger.debug("Getting recording with UUID: %s", uuid)
+        data = await self.client._request("GET", f"/recordings/{uuid}", raw=True)
+        recording = self.client._validate(Recording, data)
+        self.client.logger.debug("Retrieved recording: %s", uuid)
         return recording
@@ -2,6 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from ..models.sentiments import MeetingSentiment, MeetingSentimentsList, SentimentQuery
+from ..pagination import Paginator
 
 
 class SentimentsAPI:
@@ -11,6 +12,29 @@ class SentimentsAPI:
         self.client = client
         self.client.logger.debug("SentimentsAPI initialized")
 
+    def _list_params(
+        self,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> dict:
+        if from_date and to_date:
+            self.client.logger.debug("Date range: %s to %s", from_date, to_date)
+        if status:
+            self.client.logger.debug("Filtering by status: %s", status)
+
+        query = SentimentQuery(
+            from_date=from_date,
+            to_date=to_date,
+            status=status,
+        )
+
+        params = query.model_dump(mode="json", exclude_none=True)
+        if page_size is not None:
+            params["page_size"] = page_size
+        return params
+
     async def list(
         self,
         from_date: Optional[str] = None,
@@ -30,29 +54,59 @@ class SentimentsAPI:
             Paginated list of meeting sentiment analyses
         """
         self.client.logger.debug("Listing meeting sentiments")
-
-        if from_date and to_date:
-            self.client.logger.debug(f"Date range: {from_date} to {to_date}")
-        if status:
-            self.client.logger.debug(f"Filtering by status: {status}")
-
-        query = SentimentQuery(
-            from_date=from_date,
-            to_date=to_date,
-            status=status,
+        params = self._list_params(
+            from_date=from_date, to_date=to_date, status=status, page_size=page_size
         )
 
-        params = query.model_dump(exclude_none=True)
-        if page_size is not None:
-            params["page_size"] = page_size
-
-        data = await self.client._request("GET", "/sentiments", params=params)
-        sentiments = MeetingSentimentsList.model_validate(data)
+        data = await self.client._request("GET", "/sentiments", params=params, raw=True)
+        sentiments = self.client._validate(MeetingSentimentsList, data)
         self.client.logger.debug(
-            f"Retrieved {len(sentiments.results)} sentiment analyses"
+            "Retrieved %s sentiment analyses", len(sentiments.results)
         )
         return sentiments
 
+    def paginate(
+        self,
+        from_date: Optional[str] = None,
+        to_date: Optional[str] = None,
+        status: Optional[str] = None,
+        page_size: Optional[int] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> Paginator[MeetingSentiment]:
+        """Create a paginator over meeting sentiment analyses.
+
+        Args:
+            from_date: Optional start date-time in ISO format
+            to_date: Optional end date-time in ISO format
+            status: Optional status to filter by (pending, completed, failed)
+            page_size: Number of results per page (max 20)
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Paginator yielding meeting sentiment analyses
+        """
+        self.client.logger.debug("Paginating meeting sentiments")
+        params = self._list_params(
+            from_date=from_date, to_date=to_date, status=status, page_size=page_size
+        )
+        return Paginator(
+            self.client,
+            "/sentiments",
+            MeetingSentimentsList,
+            params=params,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     async def get(self, meeting_uuid: UUID) -> MeetingSentiment:
         """Get sentiment analysis for a specific meeting.
 
@@ -63,12 +117,14 @@ class SentimentsAPI:
             Meeting sentiment analysis details
         """
         self.client.logger.debug(
-            f"Getting sentiment analysis for meeting: {meeting_uuid}"
+            "Getting sentiment analysis for meeting: %s", meeting_uuid
         )
-        data = await self.client._request("GET", f"/sentiments/{meeting_uuid}")
-        sentiment = MeetingSentiment.model_validate(data)
+        data = await self.client._request(
+            "GET", f"/sentiments/{meeting_uuid}", raw=True
+        )
+        sentiment = self.client._validate(MeetingSentiment, data)
         self.client.logger.debug(
-            f"Retrieved sentiment analysis for meeting: {meeting_uuid}"
+            "Retrieved sentiment analysis for meeting: %s", meeting_uuid
         )
         return sentiment
 
@@ -82,11 +138,13 @@ class SentimentsAPI:
             Created sentiment analysis request (initially in pending state)
         """
         self.client.logger.debug(
-            f"Requesting sentiment analysis for meeting: {meeting_uuid}"
+            "Requesting sentiment analysis for meeting: %s", meeting_uuid
+        )
+        data = await self.client._request(
+            "POST", f"/sentiments/{meeting_uuid}/analyze", raw=True
         )
-        data = await self.client._request("POST", f"/sentiments/{meeting_uuid}/analyze")
-        sentiment = MeetingSentiment.model_validate(data)
+        sentiment = self.client._validate(MeetingSentiment, data)
         self.client.logger.debug(
-            f"Sentiment analysis requested for meeting: {meeting_uuid}"
+            "Sentiment analysis requested for meeting: %s", meeting_uuid
         )
         return sentiment
@@ -2,6 +2,7 @@ from typing import List, Optional
 from uuid import UUID
 
 from ..models.smart_categories import (
+    SmartCategoriesList,
     SmartCategory,
     SmartCategoryCreate,
     SmartCategoryUpdate,
@@ -22,9 +23,9 @@ class SmartCategoriesAPI:
             List of smart categories
         """
         self.client.logger.debug("Listing all smart categories")
-        data = await self.client._request("GET", "/smart_categories")
-        categories = [SmartCategory.model_validate(item) for item in data["results"]]
-        self.client.logger.debug(f"Retrieved {len(categories)} smart categories")
+        data = await self.client._request("GET", "/smart_categories", raw=True)
+        categories = self.client._validate(SmartCategoriesList, data).results
+        self.client.logger.debug("Retrieved %s smart categories", len(categories))
         return categories
 
     async def get(self, uuid: UUID) -> SmartCategory:
@@ -36,10 +37,10 @@ class SmartCategoriesAPI:
         Returns:
             Smart category details
         """
-        self.client.logger.debug(f"Getting smart category with UUID: {uuid}")
-        data = await self.client._request("GET", f"/smart_categories/{uuid}")
-        category = SmartCategory.model_validate(data)
-        self.client.logger.debug(f"Retrieved smart category: {category.name}")
+        self.client.logger.debug("Getting smart category with UUID: %s", uuid)
+        data = await self.client._request("GET", f"/smart_categories/{uuid}", raw=True)
+        category = self.client._validate(SmartCategory, data)
+        self.client.logger.debug("Retrieved smart category: %s", category.name)
         return category
 
     async def create(self, category: SmartCategoryCreate) -> SmartCategory:
@@ -51,12 +52,15 @@ class SmartCategoriesAPI:
         Returns:
             Created smart category
         """
-        self.client.logger.debug(f"Creating smart category: {category.name}")
+        self.client.logger.debug("Creating smart category: %s", category.name)
         data = await self.client._request(
-            "POST", "/smart_categories", json=category.model_dump(exclude_unset=True)
+            "POST",
+            "/smart_categories",
+            json=category.model_dump(exclude_unset=True),
+            raw=True,
         )
-        created_category = SmartCategory.model_validate(data)
-        self.client.logger.debug(f"Created smart category: {created_category.name}")
+        created_category = self.client._validate(SmartCategory, data)
+        self.client.logger.debug("Created smart category: %s", created_category.name)
         return created_category
 
     async def update(self, uuid: UUID, category: SmartCategoryUpdate) -> SmartCategory:
@@ -69,12 +73,13 @@ class SmartCategoriesAPI:
         Returns:
             Updated smart category
         """
-        self.client.logger.debug(f"Updating smart category with UUID: {uuid}")
+        self.client.logger.debug("Updating smart category with UUID: %s", uuid)
         data = await self.client._request(
             "PATCH",
             f"/smart_categories/{uuid}",
             json=category.model_dump(exclude_unset=True),
+            raw=True,
         )
-        updated_category = SmartCategory.model_validate(data)
-        self.client.logger.debug(f"Updated smart category: {updated_category.name}")
+        updated_category = self.client._validate(SmartCategory, data)
+        self.client.logger.debug("Updated smart category: %s", updated_category.name)
         return updated_category
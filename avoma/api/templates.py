@@ -18,9 +18,9 @@ class TemplatesAPI:
             List of templates
         """
         self.client.logger.debug("Listing all templates")
-        data = await self.client._request("GET", "/template")
-        templates = [Template.model_validate(item) for item in data]
-        self.client.logger.debug(f"Retrieved {len(templates)} templates")
+        data = await self.client._request("GET", "/template", raw=True)
+        templates = self.client._validate(List[Template], data)
+        self.client.logger.debug("Retrieved %s templates", len(templates))
         return templates
 
     async def get(self, uuid: UUID) -> Template:
@@ -32,10 +32,10 @@ class TemplatesAPI:
         Returns:
             Template details
         """
-        self.client.logger.debug(f"Getting template with UUID: {uuid}")
-        data = await self.client._request("GET", f"/template/{uuid}")
-        template = Template.model_validate(data)
-        self.client.logger.debug(f"Retrieved template: {uuid}")
+        self.client.logger.debug("Getting template with UUID: %s", uuid)
+        data = await self.client._request("GET", f"/template/{uuid}", raw=True)
+        template = self.client._validate(Template, data)
+        self.client.logger.debug("Retrieved template: %s", uuid)
         return template
 
     async def create(self, template: TemplateCreate) -> Template:
@@ -49,10 +49,12 @@ class TemplatesAPI:
         """
         self.client.logger.debug("Creating new template")
         data = await self.client._request(
-            "POST", "/template", json=template.model_dump(exclude_unset=True)
+            "POST", "/template", json=template.model_dump(exclude_unset=True), raw=True
+        )
+        created_template = self.client._validate(Template, data)
+        self.client.logger.debug(
+            "Created template with UUID: %s", created_template.uuid
         )
-        created_template = Template.model_validate(data)
-        self.client.logger.debug(f"Created template with UUID: {created_template.uuid}")
         return created_template
 
     async def update(self, template: TemplateUpdate) -> Template:
@@ -64,10 +66,10 @@ class TemplatesAPI:
         Returns:
             Updated template
         """
-        self.client.logger.debug(f"Updating template with UUID: {template.uuid}")
+        self.client.logger.debug("Updating template with UUID: %s", template.uuid)
         data = await self.client._request(
-            "PUT", "/template", json=template.model_dump(exclude_unset=True)
+            "PUT", "/template", json=template.model_dump(exclude_unset=True), raw=True
         )
-        updated_template = Template.model_validate(data)
-        self.client.logger.debug(f"Updated template: {updated_template.uuid}")
+        updated_template = self.client._validate(Template, data)
+        self.client.logger.debug("Updated template: %s", updated_template.uuid)
         return updated_template
@@ -1,8 +1,8 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 from uuid import UUID
 
-from ..models.transcriptions import Transcription
+from ..models.transcriptions import CompactTranscription, Transcription
 
 
 class TranscriptionsAPI:
@@ -17,22 +17,24 @@ class TranscriptionsAPI:
         from_date: str,
         to_date: str,
         meeting_uuid: Optional[UUID] = None,
-    ) -> List[Transcription]:
+        compact: bool = False,
+    ) -> List[Union[Transcription, CompactTranscription]]:
         """List transcriptions with optional filters.
 
         Args:
             from_date: Start date-time in ISO format
             to_date: End date-time in ISO format
             meeting_uuid: Optional meeting UUID to filter by
+            compact: If True, return array-backed CompactTranscription objects
 
         Returns:
             List of transcriptions
         """
         self.client.logger.debug(
-            f"Listing transcriptions from {from_date} to {to_date}"
+            "Listing transcriptions from %s to %s", from_date, to_date
         )
         if meeting_uuid:
-            self.client.logger.debug(f"Filtering by meeting UUID: {meeting_uuid}")
+            self.client.logger.debug("Filtering by meeting UUID: %s", meeting_uuid)
 
         params = {
             "from_date": from_date,
@@ -42,22 +44,46 @@ class TranscriptionsAPI:
         if meeting_uuid is not None:
             params["meeting_uuid"] = str(meeting_uuid)
 
-        data = await self.client._request("GET", "/transcriptions", params=params)
-        transcriptions = [Transcription.model_validate(item) for item in data]
-        self.client.logger.debug(f"Retrieved {len(transcriptions)} transcriptions")
+        data = await self.client._request(
+            "GET", "/transcriptions", params=params, raw=True
+        )
+        transcriptions = self.client._validate(List[Transcription], data)
+        if compact:
+            transcriptions = [
+                transcription.compact() for transcription in transcriptions
+            ]
+        self.client.logger.debug("Retrieved %s transcriptions", len(transcriptions))
         return transcriptions
 
-    async def get(self, uuid: UUID) -> Transcription:
+    async def get(
+        self, uuid: UUID, compact: bool = False
+    ) -> Union[Transcription, CompactTranscription]:
         """Get a single transcription by UUID.
 
         Args:
             uuid: Transcription UUID
+            compact: If True, return an array-backed CompactTranscription
 
         Returns:
-            Transcription details
+            Transcription details, from the client's mirror if it holds a fresh
+            copy
         """
-        self.client.logger.debug(f"Getting transcription with UUID: {uuid}")
-        data = await self.client._request("GET", f"/transcriptions/{uuid}")
-        transcription = Transcription.model_validate(data)
-        self.client.logger.debug(f"Retrieved transcription: {uuid}")
+        self.client.logger.debug("Getting transcription with UUID: %s", uuid)
+        mirror = self.client.mirror
+        transcription = None
+        if mirror is not None:
+            transcription = mirror.get_transcription(uuid)
+            if transcription is not None:
+                self.client.logger.debug("Serving transcription %s from mirror", uuid)
+
+        if transcription is None:
+            data = await self.client._request(
+                "GET", f"/transcriptions/{uuid}", raw=True
+            )
+            transcription = self.client._validate(Transcription, data)
+            self.client.logger.debug("Retrieved transcription: %s", uuid)
+            if mirror is not None:
+                mirror.save_transcription(transcription)
+        if compact:
+            return transcription.compact()
         return transcription
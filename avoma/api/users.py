@@ -2,6 +2,7 @@ from typing import Optional
 from uuid import UUID
 
 from ..models.users import User, UserCreate, UserUpdate, UsersList
+from ..pagination import Paginator
 
 
 class UsersAPI:
@@ -25,11 +26,48 @@ class UsersAPI:
         if page_size is not None:
             params["page_size"] = page_size
 
-        data = await self.client._request("GET", "/users", params=params)
-        users_list = UsersList.model_validate(data)
-        self.client.logger.debug(f"Retrieved {len(users_list.results)} users")
+        data = await self.client._request("GET", "/users", params=params, raw=True)
+        users_list = self.client._validate(UsersList, data)
+        self.client.logger.debug("Retrieved %s users", len(users_list.results))
         return users_list
 
+    def paginate(
+        self,
+        page_size: Optional[int] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+    ) -> Paginator[User]:
+        """Create a paginator over users.
+
+        Args:
+            page_size: Number of users per page (max 20)
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+
+        Returns:
+            Paginator yielding users
+        """
+        self.client.logger.debug("Paginating users")
+        params = {}
+        if page_size is not None:
+            params["page_size"] = page_size
+
+        return Paginator(
+            self.client,
+            "/users",
+            UsersList,
+            params=params,
+            from_page=from_page,
+            to_page=to_page,
+            prefetch=prefetch,
+            concurrency=concurrency,
+        )
+
     async def get(self, user_uuid: UUID) -> User:
         """Get a specific user by UUID.
 
@@ -39,10 +77,10 @@ class UsersAPI:
         Returns:
             User details
         """
-        self.client.logger.debug(f"Getting user with UUID: {user_uuid}")
-        data = await self.client._request("GET", f"/users/{user_uuid}")
-        user = User.model_validate(data)
-        self.client.logger.debug(f"Retrieved user: {user.email}")
+        self.client.logger.debug("Getting user with UUID: %s", user_uuid)
+        data = await self.client._request("GET", f"/users/{user_uuid}", raw=True)
+        user = self.client._validate(User, data)
+        self.client.logger.debug("Retrieved user: %s", user.email)
         return user
 
     async def create(self, user: UserCreate) -> User:
@@ -54,12 +92,12 @@ class UsersAPI:
         Returns:
             Created user
         """
-        self.client.logger.debug(f"Creating new user with email: {user.email}")
+        self.client.logger.debug("Creating new user with email: %s", user.email)
         data = await self.client._request(
-            "POST", "/users", json=user.model_dump(exclude_unset=True)
+            "POST", "/users", json=user.model_dump(exclude_unset=True), raw=True
         )
-        created_user = User.model_validate(data)
-        self.client.logger.debug(f"Created user with UUID: {created_user.uuid}")
+        created_user = self.client._validate(User, data)
+        self.client.logger.debug("Created user with UUID: %s", created_user.uuid)
         return created_user
 
     async def update(self, user_uuid: UUID, user: UserUpdate) -> User:
@@ -72,12 +110,15 @@ class UsersAPI:
         Returns:
             Updated user
         """
-        self.client.logger.debug(f"Updating user with UUID: {user_uuid}")
+        self.client.logger.debug("Updating user with UUID: %s", user_uuid)
         data = await self.client._request(
-            "PUT", f"/users/{user_uuid}", json=user.model_dump(exclude_unset=True)
+            "PUT",
+            f"/users/{user_uuid}",
+            json=user.model_dump(exclude_unset=True),
+            raw=True,
         )
-        updated_user = User.model_validate(data)
-        self.client.logger.debug(f"Updated user: {updated_user.email}")
+        updated_user = self.client._validate(User, data)
+        self.client.logger.debug("Updated user: %s", updated_user.email)
         return updated_user
 
     async def delete(self, user_uuid: UUID) -> None:
@@ -86,9 +127,9 @@ class UsersAPI:
         Args:
             user_uuid: UUID of the user to delete
         """
-        self.client.logger.debug(f"Deleting user with UUID: {user_uuid}")
+        self.client.logger.debug("Deleting user with UUID: %s", user_uuid)
         await self.client._request("DELETE", f"/users/{user_uuid}")
-        self.client.logger.debug(f"User {user_uuid} deleted")
+        self.client.logger.debug("User %s deleted", user_uuid)
 
     async def get_current(self) -> User:
         """Get the currently authenticated user.
@@ -97,7 +138,7 @@ class UsersAPI:
             Current user details
         """
         self.client.logger.debug("Getting current authenticated user")
-        data = await self.client._request("GET", "/users/me")
-        user = User.model_validate(data)
-        self.client.logger.debug(f"Retrieved current user: {user.email}")
+        data = await self.client._request("GET", "/users/me", raw=True)
+        user = self.client._validate(User, data)
+        self.client.logger.debug("Retrieved current user: %s", user.email)
         return user
@@ -0,0 +1,288 @@
+import asyncio
+import inspect
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
+
+from .incremental import format_datetime
+from .pagination import Paginator
+
+Window = Tuple[datetime, datetime]
+
+
+class BackfillCheckpoint:
+    """Record of the completed windows of a backfill.
+
+    Completed windows are kept as merged, sorted time intervals. With a path,
+    they are persisted to a JSON file (rewritten atomically after every
+    window) so an interrupted backfill can resume where it stopped.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        """Initialize the checkpoint, loading it from path if it exists.
+
+        Args:
+            path: Optional path of the JSON file (default: keep in memory)
+        """
+        self.path = Path(path) if path is not None else None
+        self.completed: List[Window] = []
+        if self.path is not None and self.path.exists():
+            self.completed = [
+                (datetime.fromisoformat(start), datetime.fromisoformat(end))
+                for start, end in json.loads(self.path.read_text())["completed"]
+            ]
+
+    def add(self, start: datetime, end: datetime) -> None:
+        """Mark a window as completed."""
+        intervals = sorted(self.completed + [(start, end)])
+        merged = [intervals[0]]
+        for lower, upper in intervals[1:]:
+            if lower <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], upper))
+            else:
+                merged.append((lower, upper))
+        self.completed = merged
+        self._save()
+
+    def remaining(self, start: datetime, end: datetime) -> List[Window]:
+        """Get the parts of a range that weren't completed yet.
+
+        Returns:
+            Sorted (start, end) windows
+        """
+        gaps = []
+        cursor = start
+        for lower, upper in self.completed:
+            if upper <= cursor or lower >= end:
+                continue
+            if lower > cursor:
+                gaps.append((cursor, lower))
+            cursor = max(cursor, upper)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        data = {
+            "completed": [
+                [start.isoformat(), end.isoformat()] for start, end in self.completed
+            ]
+        }
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, self.path)
+
+
+class BackfillResult(NamedTuple):
+    """Outcome of a backfill."""
+
+    windows: int
+    """Number of windows fetched by this run"""
+
+    splits: int
+    """Number of windows that were split because they held too many records"""
+
+    records: int
+    """Number of records passed to the sink"""
+
+
+class Backfill:
+    """Fetch every record of a long date range in adaptively sized windows.
+
+    The range is cut into ``initial_window``-sized windows that are fetched by
+    ``concurrency`` workers; every request still goes through the client's
+    rate limiter. Before fetching a window its record count is probed (the
+    first page of a paginated endpoint, which is reused, or the meeting count
+    for transcriptions, whose endpoint returns the whole window at once). A
+    window holding more than ``max_records`` records is split in two halves,
+    recursively, down to ``min_window``.
+
+    Completed windows are recorded in a BackfillCheckpoint, so running the
+    same backfill again after a crash only fetches the missing windows.
+    Records from a window that failed midway may be passed to the sink again,
+    which must therefore treat records as upserts.
+    """
+
+    RESOURCES = ("meetings", "notes", "transcriptions")
+
+    def __init__(
+        self,
+        client,
+        resource: str,
+        sink: Callable[[str, Any], Any],
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        initial_window: timedelta = timedelta(days=7),
+        min_window: timedelta = timedelta(hours=1),
+        max_records: int = 1000,
+        concurrency: int = 4,
+    ):
+        """Initialize the backfill.
+
+        Args:
+            client: AvomaClient used to fetch records
+            resource: One of Backfill.RESOURCES
+            sink: Called with the resource name and each record; may be a
+                coroutine function
+            checkpoint: Record of completed windows (default: in memory only)
+            initial_window: Size of the windows the range is first cut into
+            min_window: Windows aren't split below this size
+            max_records: Windows with more records are split
+            concurrency: Number of windows fetched concurrently
+        """
+        if resource not in self.RESOURCES:
+            raise ValueError(f"Unknown resource: {resource}")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client = client
+        self.resource = resource
+        self.sink = sink
+        self.checkpoint = checkpoint or BackfillCheckpoint()
+        self.initial_window = initial_window
+        self.min_window = min_window
+        self.max_records = max_records
+        self.concurrency = concurrency
+
+    def plan(self, from_date: datetime, to_date: datetime) -> List[Window]:
+        """Cut the not yet completed parts of a range into initial windows.
+
+        Args:
+            from_date: Start of the range
+            to_date: End of the range
+
+        Returns:
+            Sorted (start, end) windows
+        """
+        windows = []
+        for start, end in self.checkpoint.remaining(from_date, to_date):
+            while start < end:
+                windows.append((start, min(start + self.initial_window, end)))
+                start = windows[-1][1]
+        return windows
+
+    async def run(self, from_date: datetime, to_date: datetime) -> BackfillResult:
+        """Fetch every record started within a range.
+
+        Args:
+            from_date: Start of the range
+            to_date: End of the range
+
+        Returns:
+            Backfill statistics
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        for window in self.plan(from_date, to_date):
+            queue.put_nowait(window)
+        self.client.logger.debug(
+            "Backfilling %s from %s to %s in %s windows",
+            self.resource,
+            from_date,
+            to_date,
+            queue.qsize(),
+        )
+
+        stats = {"windows": 0, "splits": 0, "records": 0}
+
+        async def worker():
+            while True:
+                window = await queue.get()
+                try:
+                    await self._process(window, queue, stats)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        join = asyncio.ensure_future(queue.join())
+        try:
+            # Stop on the first failing worker instead of waiting forever
+            await asyncio.wait([join, *workers], return_when=asyncio.FIRST_COMPLETED)
+            for task in workers:
+                if task.done():
+                    task.result()
+        finally:
+            join.cancel()
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(join, *workers, return_exceptions=True)
+
+        return BackfillResult(**stats)
+
+    async def _process(self, window: Window, queue: asyncio.Queue, stats) -> None:
+        start, end = window
+        from_date, to_date = self._window_params(start, end)
+        if self.resource == "transcriptions":
+            count = await self._count_meetings(from_date, to_date)
+            first_page = None
+        else:
+            first_page = await self._paginator(from_date, to_date).fetch_page(1)
+            count = first_page.count
+
+        if count > self.max_records and end - start > self.min_window:
+            middle = start + (end - start) / 2
+            self.client.logger.debug(
+                "Splitting %s window %s - %s with %s records",
+                self.resource,
+                start,
+                end,
+                count,
+            )
+            stats["splits"] += 1
+            queue.put_nowait((start, middle))
+            queue.put_nowait((middle, end))
+            return
+
+        records = 0
+        if first_page is None:
+            for record in await self.client.transcriptions.list(from_date, to_date):
+                await self._emit(record)
+                records += 1
+        else:
+            for record in first_page.results:
+                await self._emit(record)
+                records += 1
+            if first_page.next:
+                rest = self._paginator(from_date, to_date, from_page=2)
+                async for record in rest:
+                    await self._emit(record)
+                    records += 1
+
+        self.checkpoint.add(start, end)
+        stats["windows"] += 1
+        stats["records"] += records
+        self.client.logger.debug(
+            "Backfilled %s window %s - %s: %s records",
+            self.resource,
+            start,
+            end,
+            records,
+        )
+
+    def _window_params(self, start: datetime, end: datetime) -> Tuple[str, str]:
+        # Both bounds are inclusive, end one second early so windows don't overlap
+        return format_datetime(start), format_datetime(end - timedelta(seconds=1))
+
+    def _paginator(
+        self, from_date: str, to_date: str, from_page: Optional[int] = None
+    ) -> Paginator:
+        if self.resource == "meetings":
+            return self.client.meetings.paginate(
+                from_date, to_date, from_page=from_page
+            )
+        return self.client.notes.paginate(
+            from_date, to_date, page_size=20, from_page=from_page
+        )
+
+    async def _count_meetings(self, from_date: str, to_date: str) -> int:
+        page = await self.client.meetings.paginate(
+            from_date, to_date, page_size=1
+        ).fetch_page(1)
+        return page.count
+
+    async def _emit(self, record: Any) -> None:
+        result = self.sink(self.resource, record)
+        if inspect.isawaitable(result):
+            await result
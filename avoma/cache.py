@@ -0,0 +1,205 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+DEFAULT_TTLS = {
+    "smart_categories": 300,
+    "smart_categories/*": 300,
+    "template": 300,
+    "template/*": 300,
+    "users/me": 300,
+    "transcriptions/*": 3600,
+}
+"""Default cache lifetimes (in seconds) by endpoint path pattern"""
+
+
+class CacheBackend(ABC):
+    """Storage interface for cached responses.
+
+    Implement this to keep cached responses somewhere other than in memory,
+    e.g. on disk or in a shared store.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ttl seconds."""
+
+    @abstractmethod
+    def invalidate(self, prefix: str) -> int:
+        """Remove every entry whose key starts with prefix.
+
+        Returns:
+            Number of removed entries
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class LRUCache(CacheBackend):
+    """In-memory cache with per-entry TTL and least-recently-used eviction."""
+
+    def __init__(
+        self, maxsize: int = 1024, clock: Optional[Callable[[], float]] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            clock: Optional monotonic clock function (default: time.monotonic)
+        """
+        self.maxsize = maxsize
+        self._clock = clock or time.monotonic
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str) -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class ResponseCache:
+    """Cache for GET responses made through AvomaClient._request.
+
+    Only endpoints with a configured lifetime are cached. Entries are keyed on
+    the HTTP method, endpoint path and query parameters. A successful mutating
+    request (POST, PUT, PATCH, DELETE) invalidates every cached entry of the
+    resource it touched, e.g. ``PATCH smart_categories/{uuid}`` drops both the
+    category and the category list.
+
+    Only raw (undecoded) response bodies are cached, since they are immutable.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        """Initialize the response cache.
+
+        Args:
+            backend: Storage backend (default: LRUCache())
+            ttls: Cache lifetimes in seconds by endpoint path pattern, e.g.
+                ``{"meetings/*": 60}`` (default: DEFAULT_TTLS)
+            default_ttl: Lifetime for endpoints not matching any pattern
+                (default: None, not cached)
+        """
+        self.backend = backend if backend is not None else LRUCache()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        """Get the cache lifetime for an endpoint.
+
+        Args:
+            path: Endpoint path, e.g. "smart_categories/123"
+
+        Returns:
+            Lifetime in seconds, or None if the endpoint isn't cached
+        """
+        path = path.strip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(path, pattern):
+                return ttl
+        return self.default_ttl
+
+    @staticmethod
+    def key(method: str, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Build the cache key of a request.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            params: Optional query parameters
+
+        Returns:
+            Cache key
+        """
+        key = f"{method.upper()} /{path.strip('/')}/"
+        if params:
+            key += "?" + urlencode(sorted(params.items()))
+        return key
+
+    def get(
+        self, method: str, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> Optional[Any]:
+        """Get a cached response.
+
+        Returns:
+            The cached response body, or None on a miss
+        """
+        value = self.backend.get(self.key(method, path, params))
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        value: Any,
+    ) -> bool:
+        """Cache a response if its endpoint is cacheable.
+
+        Returns:
+            True if the response was cached
+        """
+        ttl = self.ttl_for(path)
+        if not ttl:
+            return False
+        self.backend.set(self.key(method, path, params), value, ttl)
+        return True
+
+    def invalidate(self, path: str) -> int:
+        """Invalidate every cached entry of the resource a path belongs to.
+
+        Args:
+            path: Endpoint path, e.g. "users/123"
+
+        Returns:
+            Number of removed entries
+        """
+        resource = path.strip("/").split("/", 1)[0]
+        return self.backend.invalidate(f"GET /{resource}/")
+
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        self.backend.clear()
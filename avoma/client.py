@@ -1,6 +1,11 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
+import asyncio
 import aiohttp
+import functools
+import itertools
 import logging
+import time
+from urllib.parse import urlparse
 from yarl import URL
 
 from .api.meetings import MeetingsAPI
@@ -12,13 +17,32 @@ from .api.notes import NotesAPI
 from .api.sentiments import SentimentsAPI
 from .api.users import UsersAPI
 from .api.calls import CallsAPI
-from .logging import create_logger, DEFAULT_FORMAT
+from .api.bulk import BulkAPI
+from .instrumentation import (
+    MetricsCollector,
+    RequestEvent,
+    RequestHooks,
+    endpoint_template,
+    trace_config,
+)
+from .logging import create_logger, DEFAULT_FORMAT, Truncated
+from .cache import ResponseCache
+from .decoding import validate_response
+from .mirror import SQLiteMirror
+from .ratelimit import TokenBucket
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .transport import TransportConfig
+
+T = TypeVar("T")
 
 
 class AvomaClient:
     """Base client for the Avoma API."""
 
     BASE_URL = "https://api.avoma.com/v1"
+    RATE_LIMIT = 60
+    """Documented API quota in requests per minute"""
 
     def __init__(
         self,
@@ -28,6 +52,16 @@ class AvomaClient:
         log_level: int = logging.INFO,
         logger_name: str = "avoma",
         log_format: Optional[str] = None,
+        log_queue_size: Optional[int] = None,
+        rate_limit: Optional[float] = RATE_LIMIT,
+        rate_limiter: Optional[TokenBucket] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        cache: Optional[ResponseCache] = None,
+        coalesce_requests: bool = True,
+        transport: Optional[TransportConfig] = None,
+        hooks: Optional[Iterable[RequestHooks]] = None,
+        collect_metrics: bool = False,
+        mirror: Optional[SQLiteMirror] = None,
     ):
         """Initialize the Avoma client.
 
@@ -38,18 +72,55 @@ class AvomaClient:
             log_level: Logging level (default: INFO)
             logger_name: Name for the logger (default: "avoma")
             log_format: Optional custom log format string
+            log_queue_size: If set, log records are written on a background
+                thread through a queue of this size, so that slow log output
+                never blocks requests (default: None, log synchronously)
+            rate_limit: Requests allowed per minute (default: 60, None disables)
+            rate_limiter: Optional TokenBucket to use instead of the default one,
+                e.g. to share a quota between several clients
+            retry_policy: Optional RetryPolicy for transient failures
+                (default: RetryPolicy(), use RetryPolicy.disabled() to turn off)
+            cache: Optional ResponseCache for GET responses (default: no caching)
+            coalesce_requests: Whether identical concurrent GET requests share a
+                single network call (default: True)
+            transport: Optional TransportConfig for the connection pool and
+                timeouts of the session created by the client (ignored if a
+                session is given)
+            hooks: Optional RequestHooks notified of every request, e.g. a
+                MetricsCollector. Connection timings are only recorded by
+                sessions created by the client.
+            collect_metrics: Whether to collect request metrics in
+                ``client.metrics`` (see avoma.prometheus to export them)
+            mirror: Optional SQLiteMirror serving meetings, insights and
+                transcriptions locally while fresh, and storing fetched ones
         """
         self.api_key = api_key
         self.base_url = base_url or self.BASE_URL
         self._session = session
 
+        if rate_limiter is None and rate_limit:
+            rate_limiter = TokenBucket.per_minute(rate_limit)
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.cache = cache
+        self._inflight = SingleFlight() if coalesce_requests else None
+        self.transport = transport or TransportConfig()
+        self.hooks: List[RequestHooks] = list(hooks or ())
+        self.mirror = mirror
+        self.metrics: Optional[MetricsCollector] = None
+        if collect_metrics:
+            self.metrics = MetricsCollector()
+            self.hooks.append(self.metrics)
+        self._request_ids = itertools.count(1)
+
         # Configure logging
         self.logger = create_logger(
             name=logger_name,
             level=log_level,
             format_string=log_format or DEFAULT_FORMAT,
+            queue_size=log_queue_size,
         )
-        self.logger.debug(f"Initializing Avoma client with base URL: {self.base_url}")
+        self.logger.debug("Initializing Avoma client with base URL: %s", self.base_url)
 
         # Initialize API endpoints
         self.meetings = MeetingsAPI(self)
@@ -61,9 +132,12 @@ class AvomaClient:
         self.sentiments = SentimentsAPI(self)
         self.users = UsersAPI(self)
         self.calls = CallsAPI(self)
+        self.bulk = BulkAPI(self)
 
     async def __aenter__(self):
         self.logger.debug("Entering context manager")
+        if self.transport.prewarm:
+            await self.warm_up(self.transport.prewarm)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -76,10 +150,41 @@ class AvomaClient:
         if self._session is None:
             self.logger.debug("Creating new aiohttp ClientSession")
             self._session = aiohttp.ClientSession(
-                headers={"Authorization": f"Bearer {self.api_key}"}
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                connector=self.transport.connector(),
+                timeout=self.transport.timeout(),
+                trace_configs=[trace_config()] if self.hooks else None,
             )
         return self._session
 
+    async def warm_up(self, connections: int = 1) -> int:
+        """Open connections to the API host ahead of the first requests.
+
+        Sends concurrent HEAD requests to the API host, so that the connections
+        (with completed TCP and TLS handshakes) are kept alive in the pool. These
+        requests don't go through the rate limiter and their failures are
+        ignored.
+
+        Args:
+            connections: Number of connections to open
+
+        Returns:
+            Number of connections that were opened successfully
+        """
+        url = URL(self.base_url).origin()
+        self.logger.debug("Pre-warming %s connections to %s", connections, url)
+
+        async def connect() -> bool:
+            try:
+                async with self.session.head(url, allow_redirects=False):
+                    return True
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                self.logger.debug("Pre-warming connection to %s failed: %r", url, exc)
+                return False
+
+        results = await asyncio.gather(*(connect() for _ in range(connections)))
+        return sum(results)
+
     async def close(self):
         """Close the client session."""
         if self._session is not None:
@@ -94,50 +199,214 @@ class AvomaClient:
         params: Optional[Dict[str, Any]] = None,
         json: Optional[Dict[str, Any]] = None,
         full_url: Optional[str] = None,
-    ) -> Dict[str, Any]:
+        raw: bool = False,
+    ) -> Any:
         """Make a request to the Avoma API.
 
+        Transient failures (rate limiting, gateway errors and connection errors)
+        are retried according to the client's retry policy.
+
         Args:
             method: HTTP method
             path: API endpoint path (ignored if full_url is provided)
             params: Optional query parameters
             json: Optional JSON body
             full_url: Optional full URL to use instead of constructing from path
+            raw: If True, return the undecoded response body so it can be
+                validated directly from JSON bytes (see avoma.decoding)
 
         Returns:
-            API response as a dictionary
+            API response decoded from JSON, or the raw response body if raw is True
 
         Raises:
             aiohttp.ClientError: If the request fails
         """
         url = full_url if full_url else f"{self.base_url}/{path.lstrip('/')}/"
+        base_path = urlparse(self.base_url).path.rstrip("/")
 
         # Log request details
-        request_id = id(params) + id(json) if params or json else id(url)
-        self.logger.debug(f"Request {request_id}: {method} {url}")
-        if params:
-            self.logger.debug(f"Request {request_id} params: {params}")
-        if json:
-            self.logger.debug(f"Request {request_id} body: {json}")
-
-        async with self.session.request(
-            method=method,
-            url=url,
-            params=(
-                params if not full_url else None
-            ),  # Don't add params if using full URL
-            json=json,
-        ) as response:
-            json_response = await response.json()
-
-            # Log response details
-            status = response.status
-            self.logger.debug(f"Response {request_id}: status={status}")
-            if status >= 400:
-                self.logger.error(f"Error response {request_id}: {json_response}")
-            elif self.logger.isEnabledFor(logging.DEBUG):
-                # Only log full response body at DEBUG level
-                self.logger.debug(f"Response {request_id} body: {json_response}")
-
-            response.raise_for_status()
-            return json_response
+        request_id = next(self._request_ids)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Request %s: %s %s", request_id, method, url)
+            if params:
+                self.logger.debug(
+                    "Request %s params: %s", request_id, Truncated(params)
+                )
+            if json:
+                self.logger.debug("Request %s body: %s", request_id, Truncated(json))
+
+        # Only raw GET bodies are cached, decoded JSON is mutable
+        cacheable = (
+            self.cache is not None and raw and method.upper() == "GET" and not full_url
+        )
+        if cacheable:
+            cached = self.cache.get(method, path, params)
+            if cached is not None:
+                self.logger.debug("Response %s: served from cache", request_id)
+                return cached
+
+        # Path relative to the base URL, also for full URLs
+        relative_path = urlparse(url).path[len(base_path) :]
+        send = functools.partial(
+            self._send,
+            method,
+            url,
+            params if not full_url else None,  # Don't add params to full URL
+            json,
+            raw,
+            request_id,
+            relative_path,
+        )
+        if raw and method.upper() == "GET" and self._inflight is not None:
+            # Identical concurrent GETs share a single network request
+            key = (method.upper(), url, ResponseCache.key(method, path, send.args[2]))
+            body = await self._inflight.do(key, send)
+        else:
+            body = await send()
+
+        if cacheable:
+            self.cache.set(method, path, params, body)
+        elif self.cache is not None and method.upper() != "GET":
+            # Drop cached entries of the resource that was changed
+            self.cache.invalidate(relative_path)
+        return body
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        raw: bool,
+        request_id: int,
+        path: str,
+    ) -> Any:
+        """Send a request, applying rate limiting and retries.
+
+        Returns:
+            Decoded JSON or raw response body
+        """
+        event = None
+        if self.hooks:
+            event = RequestEvent(request_id, method, url, endpoint_template(path))
+
+        attempt = 0
+        while True:
+            attempt += 1
+            waited = 0.0
+            if self.rate_limiter is not None:
+                waited = await self.rate_limiter.acquire()
+                if waited:
+                    self.logger.debug(
+                        "Request %s throttled for %.3fs by rate limiter",
+                        request_id,
+                        waited,
+                    )
+            if event is not None:
+                event.start_attempt(waited)
+                self._emit("on_request_start", event)
+
+            try:
+                async with self.session.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    trace_request_ctx=event,
+                ) as response:
+                    status = response.status
+                    if self.retry_policy.should_retry_status(method, status, attempt):
+                        delay = self.retry_policy.delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        self.logger.warning(
+                            "Request %s got status %s, retrying in %.2fs (attempt %s/%s)",
+                            request_id,
+                            status,
+                            delay,
+                            attempt,
+                            self.retry_policy.max_attempts,
+                        )
+                        if event is not None:
+                            event.status = status
+                            event.retry_delay = delay
+                            self._emit("on_retry", event)
+                    else:
+                        if raw:
+                            body = await response.read()
+                        else:
+                            body = await response.json()
+
+                        if event is not None:
+                            event.status = status
+                            event.elapsed = time.monotonic() - event.started
+                            event.bytes_received = (
+                                len(body) if raw else response.content_length
+                            )
+                            self._emit("on_response", event)
+
+                        # Log response details
+                        if status >= 400:
+                            self.logger.error(
+                                "Error response %s: status=%s %s",
+                                request_id,
+                                status,
+                                Truncated(body),
+                            )
+                        elif self.logger.isEnabledFor(logging.DEBUG):
+                            # Only log the (truncated) response body at DEBUG level
+                            self.logger.debug(
+                                "Response %s: status=%s %s",
+                                request_id,
+                                status,
+                                Truncated(body),
+                            )
+
+                        response.raise_for_status()
+                        return body
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if not self.retry_policy.should_retry_exception(method, exc, attempt):
+                    if event is not None:
+                        event.error = exc
+                        self._emit("on_error", event)
+                    raise
+                delay = self.retry_policy.delay(attempt)
+                self.logger.warning(
+                    "Request %s failed with %r, retrying in %.2fs (attempt %s/%s)",
+                    request_id,
+                    exc,
+                    delay,
+                    attempt,
+                    self.retry_policy.max_attempts,
+                )
+                if event is not None:
+                    event.error = exc
+                    event.retry_delay = delay
+                    self._emit("on_retry", event)
+            except Exception as exc:
+                if event is not None:
+                    event.error = exc
+                    self._emit("on_error", event)
+                raise
+
+            await asyncio.sleep(delay)
+
+    def _validate(self, tp: Type[T], data: Any) -> T:
+        """Validate a response (see avoma.decoding.validate_response).
+
+        When hooks are registered, the validation time is reported to them.
+        """
+        if not self.hooks:
+            return validate_response(tp, data)
+        started = time.perf_counter()
+        result = validate_response(tp, data)
+        self._emit("on_validation", tp, time.perf_counter() - started)
+        return result
+
+    def _emit(self, name: str, *args: Any) -> None:
+        """Call a hook method on every registered hook, logging their failures."""
+        for hook in self.hooks:
+            try:
+                getattr(hook, name)(*args)
+            except Exception:
+                self.logger.exception("Request hook %r failed in %s", hook, name)
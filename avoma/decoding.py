@@ -0,0 +1,54 @@
+from functools import lru_cache
+from typing import Any, Type, TypeVar, get_args, get_origin
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=None)
+def type_adapter(tp: Type[T]) -> TypeAdapter[T]:
+    """Get a cached TypeAdapter for a type.
+
+    Building a TypeAdapter compiles a pydantic-core validator, so adapters for
+    types like ``List[Transcription]`` are built once and reused.
+
+    Args:
+        tp: Type to validate, e.g. a model class or ``List[Model]``
+
+    Returns:
+        TypeAdapter for the type
+    """
+    return TypeAdapter(tp)
+
+
+def validate_response(tp: Type[T], data: Any) -> T:
+    """Validate an API response against a type.
+
+    Raw JSON (bytes or str, as returned by ``AvomaClient._request(raw=True)``) is
+    parsed and validated in a single pass by pydantic-core, without building an
+    intermediate dict tree. Already decoded data is validated as Python objects.
+
+    Args:
+        tp: Type to validate, e.g. a model class or ``List[Model]``
+        data: Raw JSON response body or decoded JSON data
+
+    Returns:
+        Validated response
+    """
+    adapter = type_adapter(tp)
+    if isinstance(data, (bytes, bytearray, str)):
+        return adapter.validate_json(data)
+    return adapter.validate_python(data)
+
+
+def type_name(tp: Any) -> str:
+    """Get a short, readable name of a type, e.g. "List[Transcription]"."""
+    if isinstance(tp, type) and not get_args(tp):
+        return tp.__name__
+    args = get_args(tp)
+    if not args:
+        return str(tp)
+    origin = get_origin(tp)
+    name = getattr(tp, "_name", None) or getattr(origin, "__name__", str(origin))
+    return f"{name}[{', '.join(type_name(arg) for arg in args)}]"
@@ -0,0 +1,380 @@
+import asyncio
+import json
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Optional, Union
+from uuid import UUID
+
+import aiohttp
+
+from .models.recordings import Recording
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+
+
+class DownloadError(Exception):
+    """Raised when a recording can't be downloaded completely."""
+
+
+class _Segment:
+    __slots__ = ("start", "end", "done")
+
+    def __init__(self, start: int, end: int, done: int = 0):
+        self.start = start
+        self.end = end  # Exclusive
+        self.done = done
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.start - self.done
+
+
+class RecordingDownloader:
+    """Stream recordings to disk with segmented, resumable downloads.
+
+    The file is split into ``segments`` byte ranges that are downloaded in
+    parallel with HTTP Range requests and written in ``chunk_size`` chunks, so
+    memory use doesn't depend on the recording size. Data goes to
+    ``<path>.part`` and the progress of each segment to ``<path>.part.json``;
+    downloading to the same path again resumes from there. Once every byte has
+    been received and the size verified, the file is moved to ``path``.
+
+    Failed range requests are retried with the client's retry policy. When the
+    pre-signed URL expires (its ``valid_till`` has passed or the server answers
+    403), the recording is fetched again to get fresh URLs.
+
+    Pre-signed URLs must be requested without the API's Authorization header
+    and don't count against the API quota, so the downloader uses its own
+    session and bypasses the rate limiter.
+    """
+
+    def __init__(
+        self,
+        client,
+        chunk_size: int = 1024 * 1024,
+        segments: int = 4,
+        min_segment_size: int = 8 * 1024 * 1024,
+        refresh_margin: timedelta = timedelta(seconds=60),
+        session: Optional[aiohttp.ClientSession] = None,
+    ):
+        """Initialize the downloader.
+
+        Args:
+            client: AvomaClient used to refresh recording URLs
+            chunk_size: Size of the chunks written to disk
+            segments: Maximum number of byte ranges downloaded in parallel
+            min_segment_size: Files are not split into segments smaller than this
+            refresh_margin: Refresh URLs this long before they expire
+            session: Optional session without API credentials to download with
+                (default: a session created for each download)
+        """
+        if segments < 1:
+            raise ValueError("segments must be at least 1")
+
+        self.client = client
+        self.chunk_size = chunk_size
+        self.segments = segments
+        self.min_segment_size = min_segment_size
+        self.refresh_margin = refresh_margin
+        self._session = session
+
+    async def download(
+        self,
+        recording: Union[Recording, UUID, str],
+        path: Union[str, Path],
+        media: str = "video",
+    ) -> Path:
+        """Download a recording.
+
+        Args:
+            recording: Recording, or the UUID of a recording
+            path: Destination file path
+            media: "video" or "audio"
+
+        Returns:
+            Path of the downloaded file
+
+        Raises:
+            DownloadError: If the recording can't be downloaded completely,
+                e.g. because the server answered with an error status
+        """
+        if media not in ("video", "audio"):
+            raise ValueError(f"Unknown media: {media}")
+        if not isinstance(recording, Recording):
+            recording = await self.client.recordings.get(recording)
+
+        path = Path(path)
+        session = self._session or aiohttp.ClientSession(
+            timeout=self.client.transport.timeout()
+        )
+        try:
+            job = _Download(self, session, recording, media, path)
+            await job.run()
+        finally:
+            if self._session is None:
+                await session.close()
+        return path
+
+
+class _Download:
+    """State of a single download."""
+
+    def __init__(
+        self,
+        downloader: RecordingDownloader,
+        session: aiohttp.ClientSession,
+        recording: Recording,
+        media: str,
+        path: Path,
+    ):
+        self.downloader = downloader
+        self.client = downloader.client
+        self.session = session
+        self.recording = recording
+        self.media = media
+        self.path = path
+        self.part = path.with_name(path.name + ".part")
+        self.state = path.with_name(path.name + ".part.json")
+        self.segments: List[_Segment] = []
+        self.size = 0
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def url(self) -> str:
+        url = getattr(self.recording, f"{self.media}_url")
+        if url is None:
+            raise DownloadError(
+                f"Recording {self.recording.uuid} has no {self.media} URL"
+            )
+        return str(url)
+
+    def _expiring(self) -> bool:
+        valid_till = self.recording.valid_till
+        if valid_till is None:
+            return False
+        if valid_till.tzinfo is None:
+            valid_till = valid_till.replace(tzinfo=timezone.utc)
+        margin = self.downloader.refresh_margin
+        return valid_till - margin <= datetime.now(timezone.utc)
+
+    async def _refresh(self, stale: Recording) -> None:
+        async with self._refresh_lock:
+            # Another segment may have refreshed the URLs while we waited
+            if self.recording is stale:
+                self.client.logger.debug(
+                    "Refreshing URLs of recording %s", self.recording.uuid
+                )
+                self.recording = await self.client.recordings.get(self.recording.uuid)
+
+    async def run(self) -> None:
+        if not self._resume():
+            await self._start()
+
+        with open(self.part, "r+b") as file:
+            await self._fetch_segments(file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        written = self.part.stat().st_size
+        received = sum(s.done for s in self.segments)
+        if written != self.size or received != self.size:
+            raise DownloadError(
+                f"Downloaded {received} of {self.size} bytes ({written} on disk)"
+            )
+        os.replace(self.part, self.path)
+        self.state.unlink(missing_ok=True)
+        self.client.logger.debug(
+            "Downloaded %s bytes of recording %s to %s",
+            self.size,
+            self.recording.uuid,
+            self.path,
+        )
+
+    async def _fetch_segments(self, file) -> None:
+        tasks = [
+            asyncio.ensure_future(self._fetch_segment(file, segment))
+            for segment in self.segments
+            if segment.remaining
+        ]
+        if not tasks:
+            return
+        try:
+            await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Stop the other segments before the file and session are closed
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        for task in tasks:
+            if not task.cancelled() and task.exception() is not None:
+                # Keep what the cancelled segments received for a resume
+                self._checkpoint(file)
+                raise task.exception()
+
+    def _resume(self) -> bool:
+        if not (self.part.exists() and self.state.exists()):
+            return False
+        state = json.loads(self.state.read_text())
+        if state.get("url_path") != self._url_path():
+            return False
+        self.size = state["size"]
+        self.segments = [_Segment(*segment) for segment in state["segments"]]
+        self.client.logger.debug(
+            "Resuming download of %s at %s of %s bytes",
+            self.path,
+            sum(s.done for s in self.segments),
+            self.size,
+        )
+        return True
+
+    def _url_path(self) -> str:
+        # Pre-signed query parameters change on refresh, the object path doesn't
+        return self.url.split("?", 1)[0]
+
+    def _save_state(self) -> None:
+        state = {
+            "url_path": self._url_path(),
+            "size": self.size,
+            "segments": [[s.start, s.end, s.done] for s in self.segments],
+        }
+        tmp = self.state.with_name(self.state.name + ".tmp")
+        tmp.write_text(json.dumps(state))
+        os.replace(tmp, self.state)
+
+    def _checkpoint(self, file) -> None:
+        # The data must be on disk before the state claims it was received
+        file.flush()
+        os.fsync(file.fileno())
+        self._save_state()
+
+    def _raise_for_status(self, response: aiohttp.ClientResponse) -> None:
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientResponseError as exc:
+            raise DownloadError(
+                f"Download of recording {self.recording.uuid} failed: "
+                f"HTTP {exc.status} {exc.message}"
+            ) from exc
+
+    def _forbidden(self, attempt: int) -> DownloadError:
+        return DownloadError(
+            f"Access to recording {self.recording.uuid} denied after "
+            f"{attempt} attempts"
+        )
+
+    async def _start(self) -> None:
+        self.size = await self._probe_size()
+        downloader = self.downloader
+        count = max(
+            1, min(downloader.segments, self.size // downloader.min_segment_size)
+        )
+        bounds = [self.size * n // count for n in range(count + 1)]
+        self.segments = [_Segment(bounds[n], bounds[n + 1]) for n in range(count)]
+        with open(self.part, "wb") as file:
+            file.truncate(self.size)
+        self._save_state()
+
+    async def _probe_size(self) -> int:
+        attempt = 0
+        while True:
+            attempt += 1
+            recording = self.recording
+            if self._expiring():
+                await self._refresh(recording)
+                recording = self.recording
+            try:
+                async with self.session.get(
+                    self.url, headers={"Range": "bytes=0-0"}
+                ) as response:
+                    if response.status == 403:
+                        if attempt >= self.client.retry_policy.max_attempts:
+                            raise self._forbidden(attempt)
+                        await self._refresh(recording)
+                        continue
+                    self._raise_for_status(response)
+                    if response.status == 206:
+                        match = _CONTENT_RANGE.match(
+                            response.headers.get("Content-Range", "")
+                        )
+                        # The total may be "*" when the server doesn't know it
+                        if match is None:
+                            raise DownloadError("Server didn't report the file size")
+                        return int(match.group(3))
+                    if response.content_length is None:
+                        raise DownloadError("Server didn't report the file size")
+                    # No range support: the size is the full body length
+                    return response.content_length
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if not self.client.retry_policy.should_retry_exception(
+                    "GET", exc, attempt
+                ):
+                    raise
+                await asyncio.sleep(self.client.retry_policy.delay(attempt))
+
+    async def _fetch_segment(self, file, segment: _Segment) -> None:
+        policy = self.client.retry_policy
+        attempt = 0
+        while segment.remaining:
+            attempt += 1
+            recording = self.recording
+            if self._expiring():
+                await self._refresh(recording)
+                recording = self.recording
+
+            offset = segment.start + segment.done
+            headers = {"Range": f"bytes={offset}-{segment.end - 1}"}
+            try:
+                async with self.session.get(self.url, headers=headers) as response:
+                    if response.status == 403:
+                        if attempt >= policy.max_attempts:
+                            raise self._forbidden(attempt)
+                        # Most likely an expired pre-signed URL
+                        await self._refresh(recording)
+                        continue
+                    if response.status == 200 and (offset or segment.end < self.size):
+                        raise DownloadError("Server doesn't support range requests")
+                    if policy.should_retry_status("GET", response.status, attempt):
+                        delay = policy.delay(
+                            attempt, response.headers.get("Retry-After")
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    self._raise_for_status(response)
+
+                    received = segment.done
+                    async for chunk in response.content.iter_chunked(
+                        self.downloader.chunk_size
+                    ):
+                        chunk = chunk[: segment.remaining]
+                        file.seek(segment.start + segment.done)
+                        file.write(chunk)
+                        segment.done += len(chunk)
+                        if not segment.remaining:
+                            break
+                    self._checkpoint(file)
+                    if segment.done > received:
+                        attempt = 0  # Progress was made
+            except (
+                aiohttp.ClientPayloadError,
+                aiohttp.ClientConnectionError,
+                asyncio.TimeoutError,
+            ) as exc:
+                # Keep what was received, the next attempt resumes from there
+                self._checkpoint(file)
+                if isinstance(exc, aiohttp.ClientPayloadError):
+                    retry = attempt < policy.max_attempts
+                else:
+                    retry = policy.should_retry_exception("GET", exc, attempt)
+                if not retry:
+                    raise
+                delay = policy.delay(attempt)
+                self.client.logger.warning(
+                    "Download of %s failed at byte %s with %r, retrying in %.2fs",
+                    self.path,
+                    segment.start + segment.done,
+                    exc,
+                    delay,
+                )
+                await asyncio.sleep(delay)
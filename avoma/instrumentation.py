@@ -0,0 +1,395 @@
+import bisect
+import math
+import re
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from .decoding import type_name
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?[0-9a-fA-F]{4}-?"
+    r"[0-9a-fA-F]{12}|\d+)$"
+)
+
+DEFAULT_VALIDATION_BUCKETS = (
+    0.0001,
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+)
+"""Default validation time histogram bucket upper bounds (in seconds)"""
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+"""Default latency histogram bucket upper bounds (in seconds)"""
+
+
+def endpoint_template(path: str) -> str:
+    """Get the endpoint template of a request path.
+
+    Args:
+        path: Request path relative to the API base URL, e.g.
+            "/meetings/123e4567-e89b-12d3-a456-426614174000/insights/"
+
+    Returns:
+        The path with identifiers replaced, e.g. "meetings/{uuid}/insights"
+    """
+    segments = []
+    for segment in path.strip("/").split("/"):
+        if _ID_SEGMENT.match(segment):
+            segment = "{id}" if segment.isdigit() else "{uuid}"
+        segments.append(segment)
+    return "/".join(segments)
+
+
+class RequestEvent:
+    """State of a request made by AvomaClient, passed to RequestHooks.
+
+    The same event is passed to every hook call of a request and updated
+    before each attempt, so timings always describe the latest attempt. All
+    durations are in seconds; timings that weren't measured are None.
+    """
+
+    __slots__ = (
+        "request_id",
+        "method",
+        "url",
+        "endpoint",
+        "attempt",
+        "status",
+        "bytes_received",
+        "queue_wait",
+        "dns",
+        "connect",
+        "ttfb",
+        "elapsed",
+        "retry_delay",
+        "error",
+        "started",
+    )
+
+    def __init__(self, request_id: int, method: str, url: str, endpoint: str):
+        self.request_id = request_id
+        """Client-wide monotonically increasing request id"""
+
+        self.method = method.upper()
+        """HTTP method"""
+
+        self.url = url
+        """Request URL (without query parameters)"""
+
+        self.endpoint = endpoint
+        """Endpoint template, e.g. "meetings/{uuid}" """
+
+        self.attempt = 0
+        """Number of the current attempt (1-based)"""
+
+        self.status: Optional[int] = None
+        """HTTP status of the response"""
+
+        self.bytes_received: Optional[int] = None
+        """Size of the response body"""
+
+        self.queue_wait = 0.0
+        """Time spent waiting for the rate limiter"""
+
+        self.dns: Optional[float] = None
+        """DNS resolution time, if a new connection was made"""
+
+        self.connect: Optional[float] = None
+        """Time to open a new connection (including DNS and TLS), if one was made"""
+
+        self.ttfb: Optional[float] = None
+        """Time from starting the request to receiving the response headers"""
+
+        self.elapsed: Optional[float] = None
+        """Time from starting the request to reading the whole response"""
+
+        self.retry_delay: Optional[float] = None
+        """Delay before the next attempt, set when the request is retried"""
+
+        self.error: Optional[BaseException] = None
+        """Exception raised by the attempt, if any"""
+
+        self.started: Optional[float] = None
+        """Monotonic time at which the current attempt started"""
+
+    def start_attempt(self, queue_wait: float) -> None:
+        """Reset the per-attempt state before sending a new attempt."""
+        self.attempt += 1
+        self.queue_wait = queue_wait
+        self.status = self.bytes_received = None
+        self.dns = self.connect = self.ttfb = self.elapsed = None
+        self.retry_delay = self.error = None
+        self.started = time.monotonic()
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestEvent(request_id={self.request_id}, method={self.method!r}, "
+            f"endpoint={self.endpoint!r}, attempt={self.attempt}, "
+            f"status={self.status}, elapsed={self.elapsed})"
+        )
+
+
+class RequestHooks:
+    """Base class for request instrumentation hooks.
+
+    Subclass and override the methods of interest, then pass instances to
+    ``AvomaClient(hooks=[...])``. Hooks are called synchronously from the event
+    loop, so they should be quick; exceptions raised by hooks are logged and
+    ignored.
+    """
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        """Called before each attempt is sent, after any rate limiter wait."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """Called when a response was read and won't be retried."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """Called when an attempt failed and will be retried."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """Called when the request fails with an exception."""
+
+    def on_validation(self, model: Any, elapsed: float) -> None:
+        """Called after a response was validated into a model.
+
+        Args:
+            model: Type the response was validated against
+            elapsed: Validation time in seconds
+        """
+
+
+def trace_config() -> aiohttp.TraceConfig:
+    """Create a TraceConfig recording connection timings into RequestEvents.
+
+    Requests must pass their RequestEvent as ``trace_request_ctx``.
+    """
+
+    async def on_request_start(session, ctx, params):
+        ctx.request_start = time.monotonic()
+
+    async def on_dns_resolvehost_start(session, ctx, params):
+        ctx.dns_start = time.monotonic()
+
+    async def on_dns_resolvehost_end(session, ctx, params):
+        if isinstance(ctx.trace_request_ctx, RequestEvent):
+            ctx.trace_request_ctx.dns = time.monotonic() - ctx.dns_start
+
+    async def on_connection_create_start(session, ctx, params):
+        ctx.connect_start = time.monotonic()
+
+    async def on_connection_create_end(session, ctx, params):
+        if isinstance(ctx.trace_request_ctx, RequestEvent):
+            ctx.trace_request_ctx.connect = time.monotonic() - ctx.connect_start
+
+    async def on_request_end(session, ctx, params):
+        if isinstance(ctx.trace_request_ctx, RequestEvent):
+            ctx.trace_request_ctx.ttfb = time.monotonic() - ctx.request_start
+
+    config = aiohttp.TraceConfig()
+    config.on_request_start.append(on_request_start)
+    config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+    config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+    config.on_connection_create_start.append(on_connection_create_start)
+    config.on_connection_create_end.append(on_connection_create_end)
+    config.on_request_end.append(on_request_end)
+    return config
+
+
+class Histogram:
+    """Cumulative histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds; an implicit +Inf bucket is added
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """Get the cumulative count of each bucket.
+
+        Returns:
+            (upper bound, count of values <= bound) pairs, ending with +Inf
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Estimate a percentile by interpolating within its bucket.
+
+        Args:
+            q: Percentile between 0 and 100
+
+        Returns:
+            Estimated value, or None if nothing was recorded. Values in the
+            +Inf bucket are reported as the largest finite bound.
+        """
+        if not self.count:
+            return None
+        rank = q / 100 * self.count
+        lower, seen = 0.0, 0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and seen + count >= rank:
+                return lower + (bound - lower) * max(0.0, rank - seen) / count
+            seen += count
+            lower = bound
+        return lower
+
+
+class MetricsCollector(RequestHooks):
+    """In-process request metrics, aggregated per method and endpoint template.
+
+    Example:
+        metrics = MetricsCollector()
+        client = AvomaClient(api_key, hooks=[metrics])
+        ...
+        print(metrics.summary())
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        validation_buckets: Sequence[float] = DEFAULT_VALIDATION_BUCKETS,
+    ):
+        """Initialize the collector.
+
+        Args:
+            buckets: Latency and rate limiter wait histogram bucket upper
+                bounds (in seconds)
+            validation_buckets: Validation time histogram bucket upper bounds
+                (in seconds)
+        """
+        self.buckets = tuple(buckets)
+        self.validation_buckets = tuple(validation_buckets)
+        self.latency: Dict[Tuple[str, str], Histogram] = {}
+        """Latency histogram of completed requests by (method, endpoint)"""
+
+        self.queue_wait = Histogram(self.buckets)
+        """Rate limiter wait histogram of every attempt"""
+
+        self.validation: Dict[str, Histogram] = {}
+        """Validation time histogram by model name"""
+
+        self.responses: Counter = Counter()
+        """Number of responses by (method, endpoint, status)"""
+
+        self.retries: Counter = Counter()
+        """Number of retries by (method, endpoint, reason), where reason is the
+        response status or the exception type"""
+
+        self.rate_limited: Counter = Counter()
+        """Number of 429 responses (retried or not) by (method, endpoint)"""
+
+        self.errors: Counter = Counter()
+        """Number of failed requests by (method, endpoint, exception type)"""
+
+        self.bytes_received: Counter = Counter()
+        """Response bytes by (method, endpoint)"""
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        self.queue_wait.observe(event.queue_wait)
+
+    def on_response(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        histogram = self.latency.get(key)
+        if histogram is None:
+            histogram = self.latency[key] = Histogram(self.buckets)
+        if event.elapsed is not None:
+            histogram.observe(event.elapsed)
+        self.responses[key + (event.status,)] += 1
+        if event.bytes_received:
+            self.bytes_received[key] += event.bytes_received
+        if event.status == 429:
+            self.rate_limited[key] += 1
+
+    def on_retry(self, event: RequestEvent) -> None:
+        key = (event.method, event.endpoint)
+        if event.error is not None:
+            reason = type(event.error).__name__
+        else:
+            reason = str(event.status)
+        self.retries[key + (reason,)] += 1
+        if event.status == 429:
+            self.rate_limited[key] += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.errors[(event.method, event.endpoint, type(event.error).__name__)] += 1
+
+    def on_validation(self, model: Any, elapsed: float) -> None:
+        name = type_name(model)
+        histogram = self.validation.get(name)
+        if histogram is None:
+            histogram = self.validation[name] = Histogram(self.validation_buckets)
+        histogram.observe(elapsed)
+
+    def summary(
+        self, percentiles: Iterable[float] = (50, 90, 99)
+    ) -> Dict[str, Dict[str, Any]]:
+        """Summarize latencies per endpoint.
+
+        Args:
+            percentiles: Percentiles to estimate
+
+        Returns:
+            Mapping of "METHOD endpoint" to its request count, mean latency and
+            estimated percentiles (e.g. "p99"), in seconds
+        """
+        percentiles = tuple(percentiles)
+        summary = {}
+        for (method, endpoint), histogram in sorted(self.latency.items()):
+            stats = {
+                "count": histogram.count,
+                "mean": histogram.sum / histogram.count if histogram.count else None,
+            }
+            for q in percentiles:
+                stats[f"p{q:g}"] = histogram.percentile(q)
+            summary[f"{method} {endpoint}"] = stats
+        return summary
+
+    def reset(self) -> None:
+        """Clear every metric."""
+        self.latency.clear()
+        self.queue_wait = Histogram(self.buckets)
+        self.validation.clear()
+        self.responses.clear()
+        self.retries.clear()
+        self.rate_limited.clear()
+        self.errors.clear()
+        self.bytes_received.clear()
@@ -1,6 +1,12 @@
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+import threading
+from typing import Any, Optional
+
+PAYLOAD_LOG_LIMIT = 1000
+"""Maximum number of characters of a request or response payload that is logged"""
 
 
 def create_logger(
@@ -8,6 +14,7 @@ def create_logger(
     level: int = logging.INFO,
     format_string: Optional[str] = None,
     handler: Optional[logging.Handler] = None,
+    queue_size: Optional[int] = None,
 ) -> logging.Logger:
     """Create a logger for the Avoma client.
 
@@ -16,6 +23,10 @@ def create_logger(
         level: Logging level (default: INFO)
         format_string: Optional custom format string
         handler: Optional custom handler
+        queue_size: If set, records are handed to the handler on a background
+            thread through a queue of this size, so slow handlers never block
+            the caller. Records are dropped (and counted) while the queue is
+            full (default: None, handle records synchronously)
 
     Returns:
         Logger instance
@@ -31,6 +42,8 @@ def create_logger(
 
         formatter = logging.Formatter(format_string)
         handler.setFormatter(formatter)
+        if queue_size is not None:
+            handler = DroppingQueueHandler(handler, queue_size)
         logger.addHandler(handler)
 
     logger.setLevel(level)
@@ -41,3 +54,84 @@ def create_logger(
 
 # Default format string that can be imported
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+class _BlockingStopListener(logging.handlers.QueueListener):
+    def enqueue_sentinel(self) -> None:
+        # Wait for room in a full queue instead of failing to stop
+        self.queue.put(self._sentinel)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that never blocks and drops records when its queue is full.
+
+    Records are formatted in the logging thread and written by the wrapped
+    handler on a QueueListener thread. Closing the handler (which
+    logging.shutdown does at exit) stops the listener after the queued records
+    have been written.
+    """
+
+    def __init__(self, handler: logging.Handler, queue_size: int = 10000):
+        """Initialize the handler and start its listener thread.
+
+        Args:
+            handler: Handler that writes the records
+            queue_size: Maximum number of queued records (0 for no limit)
+        """
+        super().__init__(queue.Queue(queue_size))
+        self.handler = handler
+        self.dropped = 0
+        """Number of records dropped because the queue was full"""
+
+        self._lock = threading.Lock()
+        self.listener = _BlockingStopListener(
+            self.queue, handler, respect_handler_level=True
+        )
+        self.listener.start()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def close(self) -> None:
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.handler.close()
+        super().close()
+
+
+class Truncated:
+    """Lazily formatted, truncated payload for log messages.
+
+    Pass as a %-style logging argument: the payload is only converted to a
+    string if the record is actually emitted, e.g.
+    ``logger.debug("Response body: %s", Truncated(body))``.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value: Any, limit: int = PAYLOAD_LOG_LIMIT):
+        """Wrap a payload.
+
+        Args:
+            value: Payload to log (raw bytes are decoded as UTF-8)
+            limit: Maximum number of characters to log
+        """
+        self.value = value
+        self.limit = limit
+
+    def __str__(self) -> str:
+        value = self.value
+        if isinstance(value, (bytes, bytearray)):
+            text = bytes(value[: self.limit + 1]).decode("utf-8", errors="replace")
+            size = len(value)
+        else:
+            text = str(value)
+            size = len(text)
+        if len(text) <= self.limit:
+            return text
+        return f"{text[: self.limit]}... ({size} total)"
@@ -0,0 +1,578 @@
+import json
+import sqlite3
+import threading
+import time
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Union
+from uuid import UUID
+
+from .models.calls import Call
+from .models.meetings import AINote, Meeting, MeetingInsights, Speaker
+from .models.notes import Note
+from .models.transcriptions import Speaker as TranscriptSpeaker
+from .models.transcriptions import TranscriptSegment, Transcription
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    uuid TEXT PRIMARY KEY,
+    subject TEXT NOT NULL,
+    organizer_email TEXT NOT NULL,
+    state TEXT NOT NULL,
+    start_at TEXT,
+    end_at TEXT,
+    modified TEXT NOT NULL,
+    transcription_uuid TEXT,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS meetings_organizer_email ON meetings (organizer_email);
+CREATE INDEX IF NOT EXISTS meetings_start_at ON meetings (start_at);
+
+CREATE TABLE IF NOT EXISTS attendees (
+    meeting_uuid TEXT NOT NULL REFERENCES meetings (uuid) ON DELETE CASCADE,
+    uuid TEXT NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT,
+    response_status TEXT NOT NULL,
+    PRIMARY KEY (meeting_uuid, uuid)
+);
+CREATE INDEX IF NOT EXISTS attendees_email ON attendees (email);
+
+CREATE TABLE IF NOT EXISTS transcriptions (
+    uuid TEXT PRIMARY KEY,
+    transcription_vtt_url TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS speakers (
+    transcription_uuid TEXT NOT NULL
+        REFERENCES transcriptions (uuid) ON DELETE CASCADE,
+    id INTEGER NOT NULL,
+    email TEXT NOT NULL,
+    name TEXT,
+    is_rep INTEGER NOT NULL,
+    PRIMARY KEY (transcription_uuid, id)
+);
+
+CREATE TABLE IF NOT EXISTS segments (
+    transcription_uuid TEXT NOT NULL
+        REFERENCES transcriptions (uuid) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    speaker_id INTEGER NOT NULL,
+    transcript TEXT NOT NULL,
+    timestamps BLOB NOT NULL,
+    PRIMARY KEY (transcription_uuid, position)
+);
+
+CREATE TABLE IF NOT EXISTS insights (
+    meeting_uuid TEXT PRIMARY KEY,
+    keywords TEXT NOT NULL,
+    speakers TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS ai_notes (
+    uuid TEXT PRIMARY KEY,
+    meeting_uuid TEXT NOT NULL REFERENCES insights (meeting_uuid) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    note_type TEXT NOT NULL,
+    start REAL NOT NULL,
+    "end" REAL NOT NULL,
+    text TEXT NOT NULL,
+    speaker_id INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ai_notes_meeting_uuid ON ai_notes (meeting_uuid);
+CREATE INDEX IF NOT EXISTS ai_notes_note_type ON ai_notes (note_type);
+
+CREATE TABLE IF NOT EXISTS notes (
+    meeting_uuid TEXT NOT NULL DEFAULT '',
+    created TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (meeting_uuid, created, modified, digest)
+);
+CREATE INDEX IF NOT EXISTS notes_modified ON notes (modified);
+
+CREATE TABLE IF NOT EXISTS calls (
+    uuid TEXT PRIMARY KEY,
+    title TEXT NOT NULL,
+    host_email TEXT NOT NULL,
+    state TEXT NOT NULL,
+    scheduled_start TEXT NOT NULL,
+    modified TEXT NOT NULL,
+    data TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS calls_scheduled_start ON calls (scheduled_start);
+"""
+
+
+class SQLiteMirror:
+    """Local SQLite copy of meetings, transcriptions, insights, notes and calls.
+
+    Records are stored in normalized tables (attendees, speakers, segments and
+    AI notes get their own tables) that can be queried directly with SQL, e.g.
+    for analytics. Saving a record replaces the previous copy.
+
+    Pass the mirror to ``AvomaClient(mirror=...)`` to serve
+    ``meetings.get``, ``meetings.get_insights`` and ``transcriptions.get``
+    from it while the stored copy is fresh, and to store every record these
+    methods fetch from the API, as well as the meetings of every list page.
+    Meetings and insights change (e.g. as recordings are processed), so they
+    are only served for ``max_age`` seconds after being stored; transcriptions
+    don't change once made and are kept fresh by default. The mirror can also
+    be used as the sink of an :class:`avoma.incremental.IncrementalSync`
+    through :meth:`save`.
+
+    SQLite calls are synchronous; reads of a single record take microseconds,
+    so they are made directly from the event loop. The connection may be used
+    from any thread (e.g. the loop thread of a SyncAvomaClient); access is
+    serialized with a lock.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        max_age: Optional[float] = 300.0,
+        transcription_max_age: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """Open (and create if needed) the mirror database.
+
+        Args:
+            path: Path of the SQLite database (default: in-memory database)
+            max_age: Seconds a stored meeting, insight or call is considered
+                fresh (default: 5 minutes, None never expires them)
+            transcription_max_age: Seconds a stored transcription is considered
+                fresh (default: None, transcriptions never expire)
+            clock: Optional wall clock function (default: time.time)
+        """
+        self.path = str(path)
+        self.max_age = max_age
+        self.transcription_max_age = transcription_max_age
+        self._clock = clock or time.time
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        if self.path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "SQLiteMirror":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self.connection.close()
+
+    def _is_fresh(
+        self, synced_at: float, max_age: Optional[float], default: Optional[float]
+    ) -> bool:
+        max_age = default if max_age is None else max_age
+        return max_age is None or self._clock() - synced_at <= max_age
+
+    def save(self, resource: str, record: Any) -> None:
+        """Save a record by resource name.
+
+        Matches the sink signature of IncrementalSync.
+
+        Args:
+            resource: "meetings", "notes", "calls" or "transcriptions"
+            record: Record to save
+        """
+        if resource == "meetings":
+            self.save_meetings([record])
+        elif resource == "notes":
+            self.save_notes([record])
+        elif resource == "calls":
+            self.save_calls([record])
+        elif resource == "transcriptions":
+            self.save_transcription(record)
+        else:
+            raise ValueError(f"Resource {resource} can't be mirrored")
+
+    def save_meetings(self, meetings: Iterable[Meeting]) -> int:
+        """Save meetings and their attendees in a single transaction.
+
+        Returns:
+            Number of saved meetings
+        """
+        now = self._clock()
+        count = 0
+        with self._lock, self.connection:
+            for meeting in meetings:
+                uuid = str(meeting.uuid)
+                self.connection.execute(
+                    "DELETE FROM attendees WHERE meeting_uuid = ?", (uuid,)
+                )
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meetings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        uuid,
+                        meeting.subject,
+                        meeting.organizer_email,
+                        meeting.state,
+                        _timestamp(meeting.start_at),
+                        _timestamp(meeting.end_at),
+                        _timestamp(meeting.modified),
+                        _str(meeting.transcription_uuid),
+                        meeting.model_dump_json(),
+                        now,
+                    ),
+                )
+                self.connection.executemany(
+                    "INSERT INTO attendees VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (uuid, str(a.uuid), a.email, a.name, a.response_status)
+                        for a in meeting.attendees
+                    ],
+                )
+                count += 1
+        return count
+
+    def get_meeting(
+        self, uuid: Union[UUID, str], max_age: Optional[float] = None
+    ) -> Optional[Meeting]:
+        """Get a stored meeting.
+
+        Args:
+            uuid: Meeting UUID
+            max_age: Override of the mirror's max_age for this read
+
+        Returns:
+            The meeting, or None if it isn't stored or is stale
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data, synced_at FROM meetings WHERE uuid = ?", (str(uuid),)
+            ).fetchone()
+        if row is None or not self._is_fresh(row[1], max_age, self.max_age):
+            return None
+        return Meeting.model_validate_json(row[0])
+
+    def meetings(
+        self,
+        organizer_email: Optional[str] = None,
+        attendee_email: Optional[str] = None,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+    ) -> List[Meeting]:
+        """Query stored meetings, ordered by start time.
+
+        Args:
+            organizer_email: Only meetings organized by this email
+            attendee_email: Only meetings attended by this email
+            from_date: Only meetings starting at or after this time
+            to_date: Only meetings starting at or before this time
+
+        Returns:
+            Matching meetings
+        """
+        query = "SELECT data FROM meetings"
+        clauses, args = [], []
+        if organizer_email is not None:
+            clauses.append("organizer_email = ?")
+            args.append(organizer_email)
+        if attendee_email is not None:
+            clauses.append(
+                "uuid IN (SELECT meeting_uuid FROM attendees WHERE email = ?)"
+            )
+            args.append(attendee_email)
+        if from_date is not None:
+            clauses.append("start_at >= ?")
+            args.append(_timestamp(from_date))
+        if to_date is not None:
+            clauses.append("start_at <= ?")
+            args.append(_timestamp(to_date))
+        if clauses:
+            query += " WHERE " + " AND ".join(clauses)
+        query += " ORDER BY start_at"
+        with self._lock:
+            rows = self.connection.execute(query, args).fetchall()
+        return [Meeting.model_validate_json(data) for (data,) in rows]
+
+    def save_transcription(self, transcription: Transcription) -> None:
+        """Save a transcription with its speakers and segments."""
+        uuid = str(transcription.uuid)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM transcriptions WHERE uuid = ?", (uuid,)
+            )
+            self.connection.execute(
+                "INSERT INTO transcriptions VALUES (?, ?, ?)",
+                (uuid, str(transcription.transcription_vtt_url), self._clock()),
+            )
+            self.connection.executemany(
+                "INSERT INTO speakers VALUES (?, ?, ?, ?, ?)",
+                [
+                    (uuid, s.id, s.email, s.name, s.is_rep)
+                    for s in transcription.speakers
+                ],
+            )
+            self.connection.executemany(
+                "INSERT INTO segments VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        uuid,
+                        position,
+                        segment.speaker_id,
+                        segment.transcript,
+                        array("d", segment.timestamps).tobytes(),
+                    )
+                    for position, segment in enumerate(transcription.transcript)
+                ],
+            )
+
+    def get_transcription(
+        self, uuid: Union[UUID, str], max_age: Optional[float] = None
+    ) -> Optional[Transcription]:
+        """Get a stored transcription.
+
+        Args:
+            uuid: Transcription UUID
+            max_age: Override of the mirror's transcription_max_age for this read
+
+        Returns:
+            The transcription, or None if it isn't stored or is stale
+        """
+        uuid = str(uuid)
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT transcription_vtt_url, synced_at FROM transcriptions WHERE uuid = ?",
+                (uuid,),
+            ).fetchone()
+            if row is None or not self._is_fresh(
+                row[1], max_age, self.transcription_max_age
+            ):
+                return None
+
+            speakers = [
+                TranscriptSpeaker(id=id, email=email, name=name, is_rep=bool(is_rep))
+                for id, email, name, is_rep in self.connection.execute(
+                    "SELECT id, email, name, is_rep FROM speakers "
+                    "WHERE transcription_uuid = ? ORDER BY rowid",
+                    (uuid,),
+                )
+            ]
+            segments = []
+            for speaker_id, transcript, blob in self.connection.execute(
+                "SELECT speaker_id, transcript, timestamps FROM segments "
+                "WHERE transcription_uuid = ? ORDER BY position",
+                (uuid,),
+            ):
+                timestamps = array("d")
+                timestamps.frombytes(blob)
+                segments.append(
+                    TranscriptSegment.model_construct(
+                        transcript=transcript,
+                        timestamps=timestamps.tolist(),
+                        speaker_id=speaker_id,
+                    )
+                )
+            return Transcription(
+                uuid=uuid,
+                transcript=segments,
+                speakers=speakers,
+                transcription_vtt_url=row[0],
+            )
+
+    def save_insights(
+        self, meeting_uuid: Union[UUID, str], insights: MeetingInsights
+    ) -> None:
+        """Save the insights of a meeting with their AI notes."""
+        meeting_uuid = str(meeting_uuid)
+        with self._lock, self.connection:
+            self.connection.execute(
+                "DELETE FROM insights WHERE meeting_uuid = ?", (meeting_uuid,)
+            )
+            self.connection.execute(
+                "INSERT INTO insights VALUES (?, ?, ?, ?)",
+                (
+                    meeting_uuid,
+                    json.dumps(insights.keywords),
+                    json.dumps([s.model_dump() for s in insights.speakers]),
+                    self._clock(),
+                ),
+            )
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO ai_notes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        str(note.uuid),
+                        meeting_uuid,
+                        position,
+                        note.note_type,
+                        note.start,
+                        note.end,
+                        note.text,
+                        note.speaker_id,
+                    )
+                    for position, note in enumerate(insights.ai_notes)
+                ],
+            )
+
+    def get_insights(
+        self, meeting_uuid: Union[UUID, str], max_age: Optional[float] = None
+    ) -> Optional[MeetingInsights]:
+        """Get the stored insights of a meeting.
+
+        Args:
+            meeting_uuid: Meeting UUID
+            max_age: Override of the mirror's max_age for this read
+
+        Returns:
+            The insights, or None if they aren't stored or are stale
+        """
+        meeting_uuid = str(meeting_uuid)
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT keywords, speakers, synced_at FROM insights WHERE meeting_uuid = ?",
+                (meeting_uuid,),
+            ).fetchone()
+            if row is None or not self._is_fresh(row[2], max_age, self.max_age):
+                return None
+
+            ai_notes = [
+                AINote(
+                    uuid=uuid,
+                    note_type=note_type,
+                    start=start,
+                    end=end,
+                    text=text,
+                    speaker_id=speaker_id,
+                )
+                for uuid, note_type, start, end, text, speaker_id in self.connection.execute(
+                    'SELECT uuid, note_type, start, "end", text, speaker_id FROM ai_notes '
+                    "WHERE meeting_uuid = ? ORDER BY position",
+                    (meeting_uuid,),
+                )
+            ]
+            return MeetingInsights(
+                ai_notes=ai_notes,
+                keywords=json.loads(row[0]),
+                speakers=[Speaker(**speaker) for speaker in json.loads(row[1])],
+            )
+
+    def save_notes(
+        self, notes: Iterable[Note], meeting_uuid: Optional[Union[UUID, str]] = None
+    ) -> int:
+        """Save notes in a single transaction.
+
+        Notes have no identifier of their own, so they are keyed on their
+        meeting (if known), creation and modification times and a digest of
+        their content: notes created at the same time are stored separately,
+        and saving an identical note again replaces it.
+
+        Args:
+            notes: Notes to save
+            meeting_uuid: UUID of the meeting the notes belong to, if known
+
+        Returns:
+            Number of saved notes
+        """
+        now = self._clock()
+        rows = [
+            (
+                _str(meeting_uuid) or "",
+                _timestamp(note.created),
+                _timestamp(note.modified),
+                note.digest,
+                json.dumps(note.data),
+                now,
+            )
+            for note in notes
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def notes(self, meeting_uuid: Optional[Union[UUID, str]] = None) -> List[Note]:
+        """Get stored notes, ordered by creation time.
+
+        Args:
+            meeting_uuid: Only notes saved for this meeting
+
+        Returns:
+            Matching notes
+        """
+        query = "SELECT created, modified, data FROM notes"
+        args = []
+        if meeting_uuid is not None:
+            query += " WHERE meeting_uuid = ?"
+            args.append(str(meeting_uuid))
+        query += " ORDER BY created"
+        with self._lock:
+            rows = self.connection.execute(query, args).fetchall()
+        return [
+            Note(created=created, modified=modified, data=json.loads(data))
+            for created, modified, data in rows
+        ]
+
+    def save_calls(self, calls: Iterable[Call]) -> int:
+        """Save calls in a single transaction.
+
+        Returns:
+            Number of saved calls
+        """
+        now = self._clock()
+        rows = [
+            (
+                str(call.uuid),
+                call.title,
+                call.host.email,
+                call.status.state,
+                _timestamp(call.scheduled_start),
+                _timestamp(call.modified),
+                call.model_dump_json(),
+                now,
+            )
+            for call in calls
+        ]
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO calls VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def get_call(
+        self, uuid: Union[UUID, str], max_age: Optional[float] = None
+    ) -> Optional[Call]:
+        """Get a stored call.
+
+        Args:
+            uuid: Call UUID
+            max_age: Override of the mirror's max_age for this read
+
+        Returns:
+            The call, or None if it isn't stored or is stale
+        """
+        with self._lock:
+            row = self.connection.execute(
+                "SELECT data, synced_at FROM calls WHERE uuid = ?", (str(uuid),)
+            ).fetchone()
+        if row is None or not self._is_fresh(row[1], max_age, self.max_age):
+            return None
+        return Call.model_validate_json(row[0])
+
+
+def _timestamp(value: Optional[datetime]) -> Optional[str]:
+    # Stored in UTC so that text comparisons order times correctly
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _str(value: Any) -> Optional[str]:
+    return str(value) if value is not None else None
@@ -0,0 +1,32 @@
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel, Field
+
+from .meetings import Meeting, MeetingInsights, MeetingSentiment
+from .recordings import Recording
+from .transcriptions import Transcription
+
+
+class HydratedMeeting(BaseModel):
+    """Model for a meeting together with its related resources."""
+
+    meeting: Meeting
+    """The meeting itself"""
+
+    insights: Optional[MeetingInsights] = None
+    """AI notes, keywords and speakers, if requested and ready"""
+
+    sentiments: Optional[MeetingSentiment] = None
+    """Sentiment analysis, if requested and ready"""
+
+    transcription: Optional[Transcription] = None
+    """Transcription, if requested and ready"""
+
+    recording: Optional[Recording] = None
+    """Recording download URLs, if requested and ready"""
+
+    skipped: List[str] = Field(default_factory=list)
+    """Requested resources that were skipped because they are not ready yet"""
+
+    errors: Dict[str, str] = Field(default_factory=dict)
+    """Requested resources that failed to load, mapped to the error message"""
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 from uuid import UUID
@@ -18,6 +20,12 @@ class Note(BaseModel):
     data: Union[Dict[str, Any], str]
     """Note content, either as JSON object or formatted string based on output_format"""
 
+    @property
+    def digest(self) -> str:
+        """SHA-1 of the note content, to tell apart notes created at the same time"""
+        content = json.dumps(self.data, sort_keys=True)
+        return hashlib.sha1(content.encode()).hexdigest()
+
 
 class NotesList(PaginatedResponse[Note]):
     """Model for paginated notes list response."""
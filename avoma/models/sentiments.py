@@ -16,6 +16,9 @@ class SentimentQuery(BaseModel):
         None, description="End date for sentiment analysis"
     )
     meeting_uuid: Optional[str] = Field(None, description="UUID of the meeting")
+    status: Optional[str] = Field(
+        None, description="Status to filter by (pending, completed, failed)"
+    )
 
 
 class SentimentScores(BaseModel):
@@ -51,6 +54,9 @@ class MeetingSentiment(BaseModel):
     segments: List[SentimentSegment] = Field(
         default_factory=list, description="Segments with sentiment analysis"
     )
+    status: Optional[str] = Field(
+        None, description="Status of the analysis (pending, completed, failed)"
+    )
 
 
 class MeetingSentimentsList(PaginatedResponse):
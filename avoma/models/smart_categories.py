@@ -3,6 +3,8 @@ from typing import Dict, List, Optional
 from uuid import UUID
 from pydantic import BaseModel
 
+from .base import PaginatedResponse
+
 
 class SmartCategorySettings(BaseModel):
     """Settings configuration for a smart category."""
@@ -92,6 +94,12 @@ class SmartCategory(BaseModel):
     """Configuration settings for this category"""
 
 
+class SmartCategoriesList(PaginatedResponse[SmartCategory]):
+    """Model for paginated smart category list response."""
+
+    pass
+
+
 class SmartCategoryUpdate(BaseModel):
     """Model for updating a smart category."""
 
@@ -1,6 +1,11 @@
-from typing import List, Optional
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from itertools import pairwise
+from typing import List, NamedTuple, Optional
 from uuid import UUID
-from pydantic import BaseModel, HttpUrl
+from pydantic import BaseModel, HttpUrl, PrivateAttr
 
 
 class Speaker(BaseModel):
@@ -32,6 +37,21 @@ class TranscriptSegment(BaseModel):
     """ID of the speaker who said this segment, references Speaker.id"""
 
 
+class _IndexCache:
+    """Time index of a Transcription, ignored when comparing transcriptions."""
+
+    __slots__ = ("transcript", "index")
+
+    def __init__(self, transcript=None, index=None):
+        self.transcript = transcript
+        self.index = index
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _IndexCache)
+
+    __hash__ = None
+
+
 class Transcription(BaseModel):
     """Model for a complete meeting transcription."""
 
@@ -46,3 +66,420 @@ class Transcription(BaseModel):
 
     transcription_vtt_url: HttpUrl
     """URL to download the transcription in VTT format"""
+
+    _index_cache: _IndexCache = PrivateAttr(default_factory=_IndexCache)
+
+    def compact(self) -> "CompactTranscription":
+        """Convert the transcription to its compact, array-backed form.
+
+        Returns:
+            CompactTranscription holding the same data
+        """
+        return CompactTranscription.from_transcription(self)
+
+    @property
+    def index(self) -> "TranscriptIndex":
+        """Time index over the transcript, built on first access."""
+        cache = self._index_cache
+        # Copies share the cache; rebuild if the transcript was replaced
+        if cache.transcript is not self.transcript:
+            cache = _IndexCache(self.transcript, TranscriptIndex(self.compact()))
+            self._index_cache = cache
+        return cache.index
+
+    def segment_at(self, t: float) -> Optional["CompactSegment"]:
+        """Find the segment being spoken at time t (see TranscriptIndex)."""
+        return self.index.segment_at(t)
+
+    def words_between(self, t0: float, t1: float) -> List["TranscriptWord"]:
+        """Get the words spoken between t0 and t1 (see TranscriptIndex)."""
+        return self.index.words_between(t0, t1)
+
+    def slice(self, t0: float, t1: float) -> List[TranscriptSegment]:
+        """Get what was said between t0 and t1 (see TranscriptIndex)."""
+        return self.index.slice(t0, t1)
+
+
+class CompactSegment:
+    """Lazy view of a single segment of a CompactTranscription.
+
+    Exposes the same attributes as TranscriptSegment, reading them from the
+    owning transcription's buffers on access.
+    """
+
+    __slots__ = ("_owner", "_index")
+
+    def __init__(self, owner: "CompactTranscription", index: int):
+        self._owner = owner
+        self._index = index
+
+    @property
+    def transcript(self) -> str:
+        """The actual transcribed text"""
+        offsets = self._owner.text_offsets
+        return self._owner.text[offsets[self._index] : offsets[self._index + 1]]
+
+    @property
+    def timestamps(self) -> array:
+        """Timestamps (in seconds) for each word in the transcript"""
+        offsets = self._owner.word_offsets
+        return self._owner.timestamps[offsets[self._index] : offsets[self._index + 1]]
+
+    @property
+    def speaker_id(self) -> int:
+        """ID of the speaker who said this segment, references Speaker.id"""
+        return self._owner.speaker_ids[self._index]
+
+    def to_segment(self) -> TranscriptSegment:
+        """Materialize the segment as a TranscriptSegment model."""
+        return TranscriptSegment(
+            transcript=self.transcript,
+            timestamps=self.timestamps.tolist(),
+            speaker_id=self.speaker_id,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactSegment(speaker_id={self.speaker_id}, "
+            f"transcript={self.transcript!r})"
+        )
+
+
+class CompactTranscription(Sequence):
+    """Memory-efficient, columnar representation of a Transcription.
+
+    Instead of one model object and one list of boxed floats per segment, all
+    segments share contiguous buffers:
+
+    * ``text``: every segment's transcript concatenated into a single string,
+      delimited by ``text_offsets``
+    * ``timestamps``: every word timestamp in an ``array('d')``, delimited per
+      segment by ``word_offsets``
+    * ``speaker_ids``: one entry per segment in an ``array('i')``
+
+    The object is a sequence of lazy CompactSegment views, so code written
+    against ``Transcription.transcript`` keeps working when iterating over it.
+    """
+
+    __slots__ = (
+        "uuid",
+        "speakers",
+        "transcription_vtt_url",
+        "text",
+        "text_offsets",
+        "timestamps",
+        "word_offsets",
+        "speaker_ids",
+        "_index",
+    )
+
+    def __init__(
+        self,
+        uuid: UUID,
+        speakers: List[Speaker],
+        transcription_vtt_url: HttpUrl,
+        text: str,
+        text_offsets: array,
+        timestamps: array,
+        word_offsets: array,
+        speaker_ids: array,
+    ):
+        self.uuid = uuid
+        self.speakers = speakers
+        self.transcription_vtt_url = transcription_vtt_url
+        self.text = text
+        self.text_offsets = text_offsets
+        self.timestamps = timestamps
+        self.word_offsets = word_offsets
+        self.speaker_ids = speaker_ids
+        self._index = None
+
+    @classmethod
+    def from_transcription(cls, transcription: Transcription) -> "CompactTranscription":
+        """Build the compact form of a transcription.
+
+        Args:
+            transcription: Transcription to convert
+
+        Returns:
+            CompactTranscription holding the same data
+        """
+        text_offsets = array("q", [0])
+        timestamps = array("d")
+        word_offsets = array("q", [0])
+        speaker_ids = array("i")
+        texts = []
+
+        for segment in transcription.transcript:
+            texts.append(segment.transcript)
+            text_offsets.append(text_offsets[-1] + len(segment.transcript))
+            timestamps.extend(segment.timestamps)
+            word_offsets.append(len(timestamps))
+            speaker_ids.append(segment.speaker_id)
+
+        return cls(
+            uuid=transcription.uuid,
+            speakers=transcription.speakers,
+            transcription_vtt_url=transcription.transcription_vtt_url,
+            text="".join(texts),
+            text_offsets=text_offsets,
+            timestamps=timestamps,
+            word_offsets=word_offsets,
+            speaker_ids=speaker_ids,
+        )
+
+    @property
+    def transcript(self) -> "CompactTranscription":
+        """Segments of the transcription (the compact transcription itself)."""
+        return self
+
+    def __len__(self) -> int:
+        return len(self.speaker_ids)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [CompactSegment(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("segment index out of range")
+        return CompactSegment(self, index)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate size in bytes of the segment buffers."""
+        return sys.getsizeof(self.text) + sum(
+            buffer.itemsize * len(buffer)
+            for buffer in (
+                self.text_offsets,
+                self.timestamps,
+                self.word_offsets,
+                self.speaker_ids,
+            )
+        )
+
+    @property
+    def index(self) -> "TranscriptIndex":
+        """Time index over the transcript, built on first access."""
+        if self._index is None:
+            self._index = TranscriptIndex(self)
+        return self._index
+
+    def segment_at(self, t: float) -> Optional[CompactSegment]:
+        """Find the segment being spoken at time t (see TranscriptIndex)."""
+        return self.index.segment_at(t)
+
+    def words_between(self, t0: float, t1: float) -> List["TranscriptWord"]:
+        """Get the words spoken between t0 and t1 (see TranscriptIndex)."""
+        return self.index.words_between(t0, t1)
+
+    def slice(self, t0: float, t1: float) -> List[TranscriptSegment]:
+        """Get what was said between t0 and t1 (see TranscriptIndex)."""
+        return self.index.slice(t0, t1)
+
+    def to_transcription(self) -> Transcription:
+        """Materialize the full Transcription model.
+
+        Returns:
+            Transcription holding the same data
+        """
+        return Transcription(
+            uuid=self.uuid,
+            transcript=[segment.to_segment() for segment in self],
+            speakers=self.speakers,
+            transcription_vtt_url=self.transcription_vtt_url,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompactTranscription(uuid={self.uuid!r}, segments={len(self)}, "
+            f"words={len(self.timestamps)})"
+        )
+
+
+class TranscriptWord(NamedTuple):
+    """A single timed word of a transcript."""
+
+    time: float
+    """Timestamp (in seconds) of the word, relative to recording start"""
+
+    word: str
+    """The spoken word"""
+
+    speaker_id: int
+    """ID of the speaker who said the word, references Speaker.id"""
+
+    segment: int
+    """Index of the segment the word belongs to"""
+
+
+class TranscriptIndex:
+    """Time index over a transcript for O(log n) lookups.
+
+    Segment start times and the flattened word timestamps are kept in sorted
+    arrays, so finding the segment spoken at a given time or the words spoken
+    in a time range is a binary search rather than a scan over every segment.
+    When speech overlaps, segments and words are not in chronological order in
+    the transcript; the index then keeps their chronological order separately.
+
+    A segment is considered to last from its first word until the next segment
+    starts; the last segment ends at the last word of the transcript.
+    """
+
+    def __init__(self, transcription: CompactTranscription):
+        """Build the index.
+
+        Args:
+            transcription: Compact transcription to index
+        """
+        self.transcription = transcription
+        word_offsets = transcription.word_offsets
+        timestamps = transcription.timestamps
+        # Segments without timestamps can't be placed in time
+        starts = sorted(
+            (timestamps[word_offsets[i]], i)
+            for i in range(len(transcription))
+            if word_offsets[i] < word_offsets[i + 1]
+        )
+        self._segment_starts = array("d", (start for start, _ in starts))
+        self._segments = array("q", (segment for _, segment in starts))
+
+        if all(a <= b for a, b in pairwise(timestamps)):
+            self._word_times = timestamps
+            self._word_order = None
+        else:
+            order = sorted(range(len(timestamps)), key=timestamps.__getitem__)
+            self._word_times = array("d", (timestamps[i] for i in order))
+            self._word_order = array("q", order)
+        self._words = {}
+
+    def _segment_words(self, segment: int) -> List[str]:
+        words = self._words.get(segment)
+        if words is None:
+            words = self.transcription[segment].transcript.split()
+            self._words[segment] = words
+        return words
+
+    def _timed(self, segment: int) -> bool:
+        offsets = self.transcription.word_offsets
+        return (
+            len(self._segment_words(segment)) == offsets[segment + 1] - offsets[segment]
+        )
+
+    def _segment_of(self, position: int) -> int:
+        return bisect_right(self.transcription.word_offsets, position) - 1
+
+    def segment_index_at(self, t: float) -> Optional[int]:
+        """Find the index of the segment being spoken at time t.
+
+        Args:
+            t: Time in seconds
+
+        Returns:
+            Segment index, or None if t is outside the transcript
+        """
+        position = bisect_right(self._segment_starts, t) - 1
+        if position < 0 or t > self._word_times[-1]:
+            return None
+        return self._segments[position]
+
+    def segment_at(self, t: float) -> Optional[CompactSegment]:
+        """Find the segment being spoken at time t.
+
+        Args:
+            t: Time in seconds
+
+        Returns:
+            The segment, or None if t is outside the transcript
+        """
+        index = self.segment_index_at(t)
+        return None if index is None else self.transcription[index]
+
+    def word_range(self, t0: float, t1: float) -> Sequence[int]:
+        """Find the flat word positions with a timestamp in [t0, t1].
+
+        Args:
+            t0: Start time in seconds
+            t1: End time in seconds
+
+        Returns:
+            Positions into the flattened timestamps, in chronological order (a
+            range unless speech overlaps)
+        """
+        start = bisect_left(self._word_times, t0)
+        stop = bisect_right(self._word_times, t1)
+        if self._word_order is None:
+            return range(start, stop)
+        return self._word_order[start:stop]
+
+    def words_between(self, t0: float, t1: float) -> List[TranscriptWord]:
+        """Get the words spoken between t0 and t1 (inclusive).
+
+        Args:
+            t0: Start time in seconds
+            t1: End time in seconds
+
+        Returns:
+            Timed words in chronological order
+        """
+        transcription = self.transcription
+        offsets = transcription.word_offsets
+        words = []
+        for position in self.word_range(t0, t1):
+            segment = self._segment_of(position)
+            segment_words = self._segment_words(segment)
+            word_index = position - offsets[segment]
+            words.append(
+                TranscriptWord(
+                    time=transcription.timestamps[position],
+                    word=(
+                        segment_words[word_index]
+                        if word_index < len(segment_words)
+                        else ""
+                    ),
+                    speaker_id=transcription.speaker_ids[segment],
+                    segment=segment,
+                )
+            )
+        return words
+
+    def slice(self, t0: float, t1: float) -> List[TranscriptSegment]:
+        """Get what was said between t0 and t1 (inclusive).
+
+        Segments are trimmed to the words spoken in the range and returned in
+        transcript order. Segments whose word count doesn't match their number
+        of timestamps can't be trimmed reliably and are returned whole.
+
+        Args:
+            t0: Start time in seconds
+            t1: End time in seconds
+
+        Returns:
+            Segments (or parts of segments) spoken in the range
+        """
+        transcription = self.transcription
+        offsets = transcription.word_offsets
+        runs: List[List[int]] = []  # [segment, start, stop] in flat positions
+        for position in sorted(self.word_range(t0, t1)):
+            if runs and position < offsets[runs[-1][0] + 1]:
+                runs[-1][2] = position + 1
+            else:
+                runs.append([self._segment_of(position), position, position + 1])
+
+        segments = []
+        for segment, start, stop in runs:
+            if not self._timed(segment):
+                segments.append(transcription[segment].to_segment())
+                continue
+
+            words = self._segment_words(segment)
+            segments.append(
+                TranscriptSegment(
+                    transcript=" ".join(
+                        words[start - offsets[segment] : stop - offsets[segment]]
+                    ),
+                    timestamps=transcription.timestamps[start:stop].tolist(),
+                    speaker_id=transcription.speaker_ids[segment],
+                )
+            )
+        return segments
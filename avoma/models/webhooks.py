@@ -0,0 +1,356 @@
+from datetime import datetime
+from typing import Annotated, List, Literal, Optional, Union
+from uuid import UUID
+from pydantic import BaseModel, Field, HttpUrl
+
+
+class WebhookAttendee(BaseModel):
+    """Model for an attendee in an AINOTE event."""
+
+    email: Optional[str] = None
+    """Email address of the attendee"""
+
+    name: Optional[str] = None
+    """Name of the attendee"""
+
+    response_status: Optional[str] = None
+    """Response status of the attendee"""
+
+    uuid: Optional[UUID] = None
+    """Unique identifier for the attendee"""
+
+
+class SpeakerFillerRate(BaseModel):
+    """Model for a speaker's filler words per minute."""
+
+    designation: Optional[str] = None
+    """Designation of the speaker"""
+
+    filler_wpm: Optional[float] = None
+    """Filler words per minute of the speaker"""
+
+    speaker_id: Optional[str] = None
+    """ID of the speaker"""
+
+
+class SpeakerPatience(BaseModel):
+    """Model for a speaker's patience."""
+
+    designation: Optional[str] = None
+    """Designation of the speaker"""
+
+    patience: Optional[float] = None
+    """Patience of the speaker"""
+
+    speaker_id: Optional[str] = None
+    """ID of the speaker"""
+
+
+class SpeakerWordRate(BaseModel):
+    """Model for a speaker's words per minute."""
+
+    designation: Optional[str] = None
+    """Designation of the speaker"""
+
+    speaker_id: Optional[str] = None
+    """ID of the speaker"""
+
+    wpm: Optional[float] = None
+    """Words per minute of the speaker"""
+
+
+class Monologue(BaseModel):
+    """Model for a speaker's longest monologue."""
+
+    segments: Optional[List[List[float]]] = None
+    """Segments of the monologue"""
+
+    speaker_id: Optional[str] = None
+    """ID of the speaker"""
+
+
+class LongestMonologue(BaseModel):
+    """Model for the longest monologue in a meeting."""
+
+    rep: Optional[Monologue] = None
+    """Longest monologue of the rep"""
+
+
+class WebhookSentimentRange(BaseModel):
+    """Model for the sentiment of a time range."""
+
+    range: Optional[str] = None
+    """The time range"""
+
+    sentiment_value: Optional[float] = None
+    """Sentiment value of the range"""
+
+
+class WebhookSentiment(BaseModel):
+    """Model for the sentiment of a meeting."""
+
+    sentiment: Optional[float] = None
+    """Overall sentiment of the meeting"""
+
+    sentiment_ranges: Optional[List[WebhookSentimentRange]] = None
+    """Sentiment of time ranges of the meeting"""
+
+
+class WebhookSpeaker(BaseModel):
+    """Model for the speaker mapping of a meeting."""
+
+    email: Optional[str] = None
+    """Email of the speaker"""
+
+    id: Optional[int] = None
+    """ID of the speaker"""
+
+    name: Optional[str] = None
+    """Name of the speaker"""
+
+
+class TalkStats(BaseModel):
+    """Model for talk statistics."""
+
+    talk_percentage: Optional[float] = None
+    """Talk percentage of the speaker"""
+
+    total_talk_time: Optional[float] = None
+    """Total talk time of the speaker"""
+
+
+class AINoteInsights(BaseModel):
+    """Model for the insights sent with an AINOTE event."""
+
+    filler_wpm: Optional[List[SpeakerFillerRate]] = None
+    """Filler words per minute by speaker"""
+
+    longest_monologue: Optional[LongestMonologue] = None
+    """Longest monologue in the meeting"""
+
+    patience: Optional[List[SpeakerPatience]] = None
+    """Patience by speaker"""
+
+    sentiment: Optional[WebhookSentiment] = None
+    """Sentiment of the meeting"""
+
+    speaker_mapping: Optional[WebhookSpeaker] = None
+    """Speaker mapping of the meeting"""
+
+    talk_stats: Optional[TalkStats] = None
+    """Talk statistics of the meeting"""
+
+    wpm: Optional[List[SpeakerWordRate]] = None
+    """Words per minute by speaker"""
+
+
+class WebhookPurpose(BaseModel):
+    """Model for the purpose of a meeting in an AINOTE event."""
+
+    label: Optional[str] = None
+    """Label of the purpose"""
+
+    uuid: Optional[UUID] = None
+    """Unique identifier for the purpose"""
+
+
+class AINoteEvent(BaseModel):
+    """Model for the AINOTE webhook, sent when notes were generated for a
+    meeting or call."""
+
+    event_type: Literal["AINOTE"]
+    """Type of the event"""
+
+    uuid: UUID
+    """Unique identifier of the meeting"""
+
+    modified: Optional[datetime] = None
+    """When the meeting was last modified"""
+
+    created: Optional[datetime] = None
+    """When the meeting was created"""
+
+    subject: Optional[str] = None
+    """Subject of the meeting"""
+
+    start_at: Optional[datetime] = None
+    """Start time of the meeting"""
+
+    end_at: Optional[datetime] = None
+    """End time of the meeting"""
+
+    duration: Optional[float] = None
+    """Duration of the meeting"""
+
+    state: Optional[str] = None
+    """State of the meeting"""
+
+    processing_status: Optional[str] = None
+    """Processing status of the meeting"""
+
+    privacy: Optional[Literal["private", "organization"]] = None
+    """Privacy of the meeting"""
+
+    is_call: Optional[bool] = None
+    """Whether the meeting is a voice call"""
+
+    is_internal: Optional[bool] = None
+    """Whether the meeting has only internal attendees"""
+
+    organizer_email: Optional[str] = None
+    """Email of the organizer"""
+
+    organizer_name: Optional[str] = None
+    """Name of the organizer"""
+
+    attendees: Optional[List[WebhookAttendee]] = None
+    """Attendees of the meeting"""
+
+    purpose: Optional[WebhookPurpose] = None
+    """Purpose of the meeting"""
+
+    insights: Optional[AINoteInsights] = None
+    """Insights of the meeting"""
+
+    audio_ready: Optional[bool] = None
+    """Whether the audio is ready"""
+
+    video_ready: Optional[bool] = None
+    """Whether the video is ready"""
+
+    notes_ready: Optional[bool] = None
+    """Whether the notes are ready"""
+
+    transcript_ready: Optional[bool] = None
+    """Whether the transcript is ready"""
+
+    audio_url: Optional[HttpUrl] = None
+    """URL of the audio"""
+
+    video_url: Optional[HttpUrl] = None
+    """URL of the video"""
+
+    recording_uuid: Optional[UUID] = None
+    """Unique identifier of the recording"""
+
+    transcription_uuid: Optional[UUID] = None
+    """Unique identifier of the transcription"""
+
+    transcription_vtt_url: Optional[HttpUrl] = None
+    """Signed URL of the transcription VTT file"""
+
+    @property
+    def meeting_uuid(self) -> UUID:
+        """Unique identifier of the meeting"""
+        return self.uuid
+
+
+class InviteeDetails(BaseModel):
+    """Model for the details of a scheduler invitee."""
+
+    email: Optional[str] = None
+    """Email of the invitee"""
+
+    locale: Optional[str] = None
+    """Locale of the invitee"""
+
+    name: Optional[str] = None
+    """Name of the invitee"""
+
+    tz: Optional[str] = None
+    """Timezone of the invitee"""
+
+
+class InviteeResponse(BaseModel):
+    """Model for an invitee's answer to a scheduling page question."""
+
+    question: Optional[str] = None
+    """The question"""
+
+    response: Optional[str] = None
+    """The response"""
+
+
+class SchedulerEvent(BaseModel):
+    """Base model for scheduler webhooks."""
+
+    uuid: UUID
+    """Unique identifier of the event"""
+
+    meeting_uuid: UUID
+    """Unique identifier of the meeting"""
+
+    modified: Optional[datetime] = None
+    """When the event was last modified"""
+
+    created: Optional[datetime] = None
+    """When the event was created"""
+
+    subject: Optional[str] = None
+    """Subject of the event"""
+
+    event_start_time: Optional[datetime] = None
+    """Start time of the event"""
+
+    event_end_time: Optional[datetime] = None
+    """End time of the event"""
+
+    booker_email: Optional[str] = None
+    """Email of the booker"""
+
+    cancel_reason: Optional[str] = None
+    """Reason for the cancellation"""
+
+    conference_link: Optional[str] = None
+    """Conference link of the event"""
+
+    invitee_details: Optional[InviteeDetails] = None
+    """Details of the invitee"""
+
+    invitee_responses: Optional[List[InviteeResponse]] = None
+    """Answers of the invitee to the scheduling page questions"""
+
+    organizer_email: Optional[str] = None
+    """Email of the organizer"""
+
+    organizer_timezone: Optional[str] = None
+    """Timezone of the organizer"""
+
+    purpose: Optional[str] = None
+    """Purpose of the event"""
+
+    scheduling_page_link: Optional[str] = None
+    """Link of the scheduling page"""
+
+
+class MeetingBookedEvent(SchedulerEvent):
+    """Model for the MEETING_BOOKED_VIA_SCHEDULER webhook."""
+
+    event_type: Literal["MEETING_BOOKED_VIA_SCHEDULER"]
+    """Type of the event"""
+
+
+class MeetingCanceledEvent(SchedulerEvent):
+    """Model for the MEETING_BOOKED_VIA_SCHEDULER_CANCELED webhook."""
+
+    event_type: Literal["MEETING_BOOKED_VIA_SCHEDULER_CANCELED"]
+    """Type of the event"""
+
+
+class MeetingRescheduledEvent(SchedulerEvent):
+    """Model for the MEETING_BOOKED_VIA_SCHEDULER_RESCHEDULED webhook."""
+
+    event_type: Literal["MEETING_BOOKED_VIA_SCHEDULER_RESCHEDULED"]
+    """Type of the event"""
+
+
+WebhookEvent = Annotated[
+    Union[
+        AINoteEvent,
+        MeetingBookedEvent,
+        MeetingCanceledEvent,
+        MeetingRescheduledEvent,
+    ],
+    Field(discriminator="event_type"),
+]
+"""Any webhook event, told apart by its ``event_type``"""
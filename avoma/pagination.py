@@ -0,0 +1,210 @@
+import asyncio
+import math
+from collections import deque
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Callable, Dict, Generic, Optional, Type, TypeVar
+
+from .models.base import PaginatedResponse
+
+T = TypeVar("T")
+
+
+class Paginator(Generic[T]):
+    """Iterate over the pages of a paginated list endpoint.
+
+    Avoma list endpoints use page-number pagination: page ``N`` is requested
+    with a ``page`` query parameter and the response's ``next`` link is null on
+    the last page. A paginator follows pages until ``next`` is null or
+    ``to_page`` is reached.
+
+    Iterating over the paginator yields individual items, :meth:`pages` yields
+    whole pages and :meth:`collect` gathers every page into a single response.
+
+    Pages can be fetched ahead of the consumer in two ways:
+
+    * ``prefetch``: the next page is requested while the current one is being
+      consumed.
+    * ``concurrency``: after the first page the total number of pages is derived
+      from ``count`` and up to ``concurrency`` pages are fetched at once.
+
+    In both modes pages are yielded in order and every request still goes
+    through the client's rate limiter.
+    """
+
+    def __init__(
+        self,
+        client,
+        path: str,
+        model: Type[PaginatedResponse],
+        params: Optional[Dict[str, Any]] = None,
+        from_page: Optional[int] = None,
+        to_page: Optional[int] = None,
+        prefetch: bool = False,
+        concurrency: int = 1,
+        on_page: Optional[Callable[[PaginatedResponse], Any]] = None,
+    ):
+        """Initialize the paginator.
+
+        Args:
+            client: AvomaClient used to make the requests
+            path: API endpoint path
+            model: PaginatedResponse subclass used to validate each page
+            params: Query parameters sent with every page request
+            from_page: Start from this page number (1-based)
+            to_page: Stop at this page number (inclusive)
+            prefetch: Whether to request the next page while the current one
+                is consumed
+            concurrency: Maximum number of pages fetched concurrently
+            on_page: Optional function called with every fetched page
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client = client
+        self.path = path
+        self.model = model
+        self.params = dict(params or {})
+        self.from_page = from_page or 1
+        self.to_page = to_page
+        self.prefetch = prefetch
+        self.concurrency = concurrency
+        self.on_page = on_page
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.items()
+
+    async def fetch_page(self, page: int) -> PaginatedResponse:
+        """Fetch a single page.
+
+        Args:
+            page: Page number (1-based)
+
+        Returns:
+            The validated page
+        """
+        page_params = self.params.copy()
+        # Only include page parameter if we're not on page 1
+        if page > 1:
+            page_params["page"] = page
+
+        data = await self.client._request(
+            "GET", self.path, params=page_params, raw=True
+        )
+        result = self.client._validate(self.model, data)
+        self.client.logger.debug(
+            "Retrieved %s results from %s page %s", len(result.results), self.path, page
+        )
+        if self.on_page is not None:
+            self.on_page(result)
+        return result
+
+    def _has_more(self, page: PaginatedResponse, number: int) -> bool:
+        return bool(page.next) and not (self.to_page and number >= self.to_page)
+
+    async def pages(self) -> AsyncIterator[PaginatedResponse]:
+        """Iterate over pages as they are fetched.
+
+        Yields:
+            One validated page at a time, in page order
+        """
+        if self.concurrency > 1:
+            pages = self._concurrent_pages()
+        else:
+            pages = self._sequential_pages()
+
+        async with aclosing(pages):
+            async for page in pages:
+                yield page
+
+    async def items(self) -> AsyncIterator[T]:
+        """Iterate over the items of every page.
+
+        Yields:
+            Items in the order returned by the API
+        """
+        async for page in self.pages():
+            for item in page.results:
+                yield item
+
+    async def collect(self) -> PaginatedResponse:
+        """Fetch every page and merge them into a single response.
+
+        Returns:
+            The first page if only one page was fetched, otherwise a response
+            with the results of all pages and no next/previous links
+        """
+        fetched = [page async for page in self.pages()]
+        if len(fetched) == 1:
+            return fetched[0]
+
+        results = []
+        for page in fetched:
+            results.extend(page.results)
+        return self.model(
+            count=fetched[0].count,  # Use the total count from first response
+            next=None,
+            previous=None,
+            results=results,
+        )
+
+    async def _sequential_pages(self) -> AsyncIterator[PaginatedResponse]:
+        number = self.from_page
+        ahead = None
+        try:
+            while True:
+                if ahead is None:
+                    page = await self.fetch_page(number)
+                else:
+                    page = await ahead
+                    ahead = None
+
+                more = self._has_more(page, number)
+                if more and self.prefetch:
+                    ahead = asyncio.ensure_future(self.fetch_page(number + 1))
+                yield page
+                if not more:
+                    break
+                number += 1
+        finally:
+            if ahead is not None:
+                ahead.cancel()
+
+    async def _concurrent_pages(self) -> AsyncIterator[PaginatedResponse]:
+        first = await self.fetch_page(self.from_page)
+        if not self._has_more(first, self.from_page):
+            yield first
+            return
+
+        page_size = self.params.get("page_size") or len(first.results)
+        last_page = max(1, math.ceil(first.count / page_size))
+        if self.to_page:
+            last_page = min(last_page, self.to_page)
+        self.client.logger.debug(
+            "Fetching %s pages %s-%s with concurrency %s",
+            self.path,
+            self.from_page + 1,
+            last_page,
+            self.concurrency,
+        )
+
+        # Keep at most `concurrency` requests in flight and yield in page order
+        pending = deque()
+        next_page = self.from_page + 1
+
+        def schedule():
+            nonlocal next_page
+            while next_page <= last_page and len(pending) < self.concurrency:
+                pending.append(asyncio.ensure_future(self.fetch_page(next_page)))
+                next_page += 1
+
+        try:
+            # Start fetching the next pages before handing out the first one
+            schedule()
+            yield first
+            while pending:
+                page = await pending.popleft()
+                schedule()
+                yield page
+        finally:
+            for task in pending:
+                task.cancel()
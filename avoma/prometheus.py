@@ -0,0 +1,153 @@
+import math
+from typing import Dict, Iterable, List, Mapping, Tuple
+
+from aiohttp import web
+
+from .instrumentation import Histogram, MetricsCollector
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+"""Content type of the Prometheus text exposition format"""
+
+
+def _escape(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Iterable[str], values: Iterable[object]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Writer:
+    def __init__(self, namespace: str):
+        self.namespace = namespace
+        self.lines: List[str] = []
+
+    def header(self, name: str, kind: str, help: str) -> str:
+        name = f"{self.namespace}_{name}"
+        self.lines.append(f"# HELP {name} {help}")
+        self.lines.append(f"# TYPE {name} {kind}")
+        return name
+
+    def counter(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...],
+        values: Mapping[Tuple, float],
+    ) -> None:
+        name = self.header(name, "counter", help)
+        for key, value in sorted(values.items(), key=lambda item: str(item[0])):
+            self.lines.append(f"{name}{_labels(labels, key)} {_number(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labels: Tuple[str, ...],
+        histograms: Mapping[Tuple, Histogram],
+    ) -> None:
+        name = self.header(name, "histogram", help)
+        for key, histogram in sorted(histograms.items(), key=lambda item: item[0]):
+            for bound, count in histogram.cumulative():
+                bucket_labels = _labels(labels + ("le",), key + (_number(bound),))
+                self.lines.append(f"{name}_bucket{bucket_labels} {count}")
+            self.lines.append(
+                f"{name}_sum{_labels(labels, key)} {_number(histogram.sum)}"
+            )
+            self.lines.append(f"{name}_count{_labels(labels, key)} {histogram.count}")
+
+
+def render(collector: MetricsCollector, namespace: str = "avoma") -> str:
+    """Render collected metrics in the Prometheus text exposition format.
+
+    Args:
+        collector: Metrics to render
+        namespace: Prefix of every metric name
+
+    Returns:
+        The metrics, one sample per line
+    """
+    writer = _Writer(namespace)
+    writer.counter(
+        "requests_total",
+        "Responses received, by endpoint and status.",
+        ("method", "endpoint", "status"),
+        collector.responses,
+    )
+    writer.histogram(
+        "request_duration_seconds",
+        "Time from sending a request to reading its response.",
+        ("method", "endpoint"),
+        collector.latency,
+    )
+    writer.counter(
+        "request_retries_total",
+        "Retried attempts, by endpoint and status or exception.",
+        ("method", "endpoint", "reason"),
+        collector.retries,
+    )
+    writer.counter(
+        "request_errors_total",
+        "Failed requests, by endpoint and exception.",
+        ("method", "endpoint", "error"),
+        collector.errors,
+    )
+    writer.counter(
+        "rate_limited_responses_total",
+        "Responses with status 429, by endpoint.",
+        ("method", "endpoint"),
+        collector.rate_limited,
+    )
+    writer.counter(
+        "response_bytes_total",
+        "Response body bytes received, by endpoint.",
+        ("method", "endpoint"),
+        collector.bytes_received,
+    )
+    writer.histogram(
+        "rate_limiter_wait_seconds",
+        "Time attempts waited for the client-side rate limiter.",
+        (),
+        {(): collector.queue_wait},
+    )
+    validation: Dict[Tuple[str], Histogram] = {
+        (model,): histogram for model, histogram in collector.validation.items()
+    }
+    writer.histogram(
+        "validation_duration_seconds",
+        "Time spent validating responses, by model.",
+        ("model",),
+        validation,
+    )
+    return "\n".join(writer.lines) + "\n"
+
+
+def metrics_handler(collector: MetricsCollector, namespace: str = "avoma"):
+    """Create an aiohttp request handler serving the collected metrics.
+
+    Example:
+        app = web.Application()
+        app.router.add_get("/metrics", metrics_handler(client.metrics))
+
+    Args:
+        collector: Metrics to serve
+        namespace: Prefix of every metric name
+
+    Returns:
+        aiohttp request handler
+    """
+
+    async def handler(request: web.Request) -> web.Response:
+        return web.Response(
+            body=render(collector, namespace).encode(),
+            headers={"Content-Type": CONTENT_TYPE},
+        )
+
+    return handler
@@ -0,0 +1,145 @@
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``. Every
+    call to :meth:`acquire` reserves its tokens immediately, so concurrent
+    callers are served in arrival order and the bucket never hands out more than
+    ``capacity + rate * t`` tokens over any interval of ``t`` seconds.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1,
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """Initialize the token bucket.
+
+        Args:
+            rate: Number of tokens added per second
+            capacity: Maximum number of tokens the bucket can hold (burst size)
+            clock: Optional monotonic clock function (default: time.monotonic)
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock or time.monotonic
+        self._tokens = float(capacity)
+        self._updated = self._clock()
+
+        self.acquired = 0
+        """Total number of tokens handed out"""
+
+        self.throttled = 0
+        """Number of acquisitions that had to wait for tokens"""
+
+        self.total_wait = 0.0
+        """Cumulative time (in seconds) callers were asked to wait"""
+
+        self.max_wait = 0.0
+        """Longest single wait (in seconds) so far"""
+
+    @classmethod
+    def per_minute(cls, requests: float, burst: float = 1, **kwargs) -> "TokenBucket":
+        """Create a bucket allowing ``requests`` acquisitions per minute.
+
+        With the default burst of 1 no 60 second window ever sees more than
+        ``requests`` acquisitions. Larger bursts let a cold client start faster at
+        the cost of briefly exceeding the per-minute quota.
+
+        Args:
+            requests: Number of requests allowed per minute
+            burst: Maximum number of requests that can be made back to back
+
+        Returns:
+            TokenBucket instance
+        """
+        return cls(rate=requests / 60.0, capacity=burst, **kwargs)
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Current token level (negative while callers are queued)."""
+        self._refill()
+        return self._tokens
+
+    @property
+    def wait_time(self) -> float:
+        """Seconds a new caller would currently have to wait for one token."""
+        missing = 1 - self.tokens
+        return missing / self.rate if missing > 0 else 0.0
+
+    def reserve(self, tokens: float = 1) -> float:
+        """Reserve tokens without waiting.
+
+        Args:
+            tokens: Number of tokens to reserve
+
+        Returns:
+            Seconds the caller must wait before the reservation is honored
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+
+        self._refill()
+        self._tokens -= tokens
+        self.acquired += tokens
+        if self._tokens >= 0:
+            return 0.0
+
+        wait = -self._tokens / self.rate
+        self.throttled += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """Wait until ``tokens`` tokens are available and consume them.
+
+        Args:
+            tokens: Number of tokens to acquire
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                # Give the reservation back so later callers don't pay for it
+                self._tokens += tokens
+                self.acquired -= tokens
+                raise
+        return wait
+
+    def stats(self) -> dict:
+        """Snapshot of the limiter's metrics.
+
+        Returns:
+            Dictionary with the current token level and wait-time statistics
+        """
+        return {
+            "tokens": self.tokens,
+            "capacity": self.capacity,
+            "rate": self.rate,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+        }
@@ -0,0 +1,287 @@
+import asyncio
+import math
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Union
+from uuid import UUID
+
+import aiohttp
+
+from .incremental import format_datetime
+from .models.meetings import Meeting
+
+READY_FLAGS = ("transcript_ready", "notes_ready", "audio_ready")
+"""Flags waited for by default"""
+
+_FLAGS = frozenset(
+    name for name, field in Meeting.model_fields.items() if field.annotation is bool
+)
+
+
+class _Watch:
+    __slots__ = ("uuid", "flags", "future", "start_at", "interval", "due", "deadline")
+
+    def __init__(self, uuid, flags, future, start_at, interval, due, deadline):
+        self.uuid = uuid
+        self.flags = flags
+        self.future = future
+        self.start_at = start_at
+        self.interval = interval
+        self.due = due
+        self.deadline = deadline
+
+
+class ReadinessWaiter:
+    """Wait for many meetings to become ready with as few requests as possible.
+
+    Every watched meeting has its own poll schedule, starting at ``interval``
+    and growing by ``backoff`` after every poll that finds it not ready, up to
+    ``max_interval``. On each tick the meetings that are due are polled
+    together: meetings whose start time is known are grouped into windows of
+    at most ``max_window``, each polled with a single date-windowed list
+    request (plus further pages if needed). A meeting is fetched on its own
+    when its start time is unknown, when it's alone in its window, or when its
+    window holds more pages of meetings than it has watched meetings.
+
+    Meetings fetched by a window poll resolve as soon as they're ready, even
+    when they weren't due yet.
+    """
+
+    def __init__(
+        self,
+        client,
+        interval: float = 30.0,
+        max_interval: float = 600.0,
+        backoff: float = 2.0,
+        window_padding: timedelta = timedelta(hours=1),
+        max_window: timedelta = timedelta(days=1),
+    ):
+        """Initialize the waiter.
+
+        Args:
+            client: AvomaClient used to poll meetings
+            interval: Delay (in seconds) before a meeting is polled again
+            max_interval: Upper bound for the delay between polls of a meeting
+            backoff: Factor the delay grows by after every poll
+            window_padding: Margin added around the start times of a window
+            max_window: Maximum span of start times polled with one list request
+        """
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.window_padding = window_padding
+        self.max_window = max_window
+        self._watches: List[_Watch] = []
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return sum(not watch.future.done() for watch in self._watches)
+
+    def wait_until_ready(
+        self,
+        meetings: Iterable[Union[Meeting, UUID, str]],
+        flags: Sequence[str] = READY_FLAGS,
+        timeout: Optional[float] = None,
+    ) -> Dict[UUID, asyncio.Future]:
+        """Start waiting for meetings to become ready.
+
+        Args:
+            meetings: Meetings or meeting UUIDs. Passing meetings saves the
+                request that would look up their start time
+            flags: Boolean Meeting fields that must all be set
+            timeout: Seconds after which a meeting's future fails with
+                asyncio.TimeoutError (default: wait forever)
+
+        Returns:
+            Future by meeting UUID, resolving to the ready Meeting
+        """
+        flags = tuple(flags)
+        unknown = set(flags) - _FLAGS
+        if unknown:
+            raise ValueError(f"Unknown flags: {', '.join(sorted(unknown))}")
+
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        deadline = math.inf if timeout is None else now + timeout
+        futures = {}
+        for meeting in meetings:
+            future = loop.create_future()
+            if isinstance(meeting, Meeting):
+                futures[meeting.uuid] = future
+                if self._is_ready(meeting, flags):
+                    future.set_result(meeting)
+                    continue
+                watch = _Watch(
+                    meeting.uuid,
+                    flags,
+                    future,
+                    meeting.start_at,
+                    self.interval,
+                    now + self.interval,
+                    deadline,
+                )
+            else:
+                uuid = meeting if isinstance(meeting, UUID) else UUID(meeting)
+                futures[uuid] = future
+                watch = _Watch(uuid, flags, future, None, self.interval, now, deadline)
+            self._watches.append(watch)
+
+        self.client.logger.debug(
+            "Waiting for %s meetings to be ready (%s)", len(futures), ", ".join(flags)
+        )
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+        else:
+            self._wake.set()
+        return futures
+
+    async def close(self) -> None:
+        """Stop polling and cancel the futures of meetings still waited for."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        for watch in self._watches:
+            watch.future.cancel()
+        self._watches = []
+
+    @staticmethod
+    def _is_ready(meeting: Meeting, flags: Sequence[str]) -> bool:
+        return all(getattr(meeting, flag) for flag in flags)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._wake.clear()
+                now = loop.time()
+                self._expire(now)
+                due = [watch for watch in self._watches if watch.due <= now]
+                if due:
+                    await self._poll(due)
+                    self._watches = [w for w in self._watches if not w.future.done()]
+
+                if not self._watches:
+                    return
+                wake_at = min(min(w.due, w.deadline) for w in self._watches)
+                try:
+                    await asyncio.wait_for(
+                        self._wake.wait(), max(0, wake_at - loop.time())
+                    )
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+    def _expire(self, now: float) -> None:
+        for watch in self._watches:
+            if not watch.future.done() and watch.deadline <= now:
+                watch.future.set_exception(
+                    asyncio.TimeoutError(f"Meeting {watch.uuid} is not ready")
+                )
+        self._watches = [w for w in self._watches if not w.future.done()]
+
+    async def _poll(self, due: List[_Watch]) -> None:
+        singles = [watch for watch in due if watch.start_at is None]
+        for window in self._windows([w for w in due if w.start_at is not None]):
+            if len({watch.uuid for watch in window}) == 1:
+                singles.extend(window)
+            else:
+                singles.extend(await self._poll_window(window))
+
+        by_uuid: Dict[UUID, List[_Watch]] = {}
+        for watch in singles:
+            if not watch.future.done():
+                by_uuid.setdefault(watch.uuid, []).append(watch)
+        await asyncio.gather(
+            *(self._poll_meeting(uuid, watches) for uuid, watches in by_uuid.items())
+        )
+
+    def _windows(self, watches: List[_Watch]) -> List[List[_Watch]]:
+        windows: List[List[_Watch]] = []
+        for watch in sorted(watches, key=lambda w: w.start_at):
+            if windows and watch.start_at - windows[-1][0].start_at <= self.max_window:
+                windows[-1].append(watch)
+            else:
+                windows.append([watch])
+        return windows
+
+    async def _poll_window(self, window: List[_Watch]) -> List[_Watch]:
+        """Poll a window of meetings with list requests.
+
+        Returns:
+            Watches of the window that still need to be fetched on their own
+        """
+        from_date = format_datetime(window[0].start_at - self.window_padding)
+        to_date = format_datetime(window[-1].start_at + self.window_padding)
+        uuids = {watch.uuid for watch in window}
+        found: Set[UUID] = set()
+        paginator = self.client.meetings.paginate(from_date, to_date)
+        try:
+            page = await paginator.fetch_page(1)
+            for meeting in page.results:
+                self._update(meeting, found)
+            pages = math.ceil(page.count / max(len(page.results), 1))
+            if page.next and pages - 1 < len(uuids - found):
+                rest = self.client.meetings.paginate(from_date, to_date, from_page=2)
+                async for meeting in rest.items():
+                    self._update(meeting, found)
+                    if uuids <= found:
+                        break
+            elif page.next:
+                self.client.logger.debug(
+                    "Window %s - %s has %s meetings, polling %s meetings one by one",
+                    from_date,
+                    to_date,
+                    page.count,
+                    len(uuids - found),
+                )
+        except Exception as exc:
+            # Timeouts and invalid responses must not stop the poll loop
+            self.client.logger.warning(
+                "Polling meetings from %s to %s failed: %r", from_date, to_date, exc
+            )
+            for watch in window:
+                self._reschedule(watch)
+            return []
+
+        for watch in window:
+            if watch.uuid in found:
+                self._reschedule(watch)
+        return [watch for watch in window if watch.uuid not in found]
+
+    async def _poll_meeting(self, uuid: UUID, watches: List[_Watch]) -> None:
+        try:
+            meeting = await self.client.meetings.get(uuid, refresh=True)
+        except aiohttp.ClientResponseError as exc:
+            if exc.status < 500 and exc.status != 429:
+                for watch in watches:
+                    if not watch.future.done():
+                        watch.future.set_exception(exc)
+                return
+            self.client.logger.warning("Polling meeting %s failed: %r", uuid, exc)
+        except Exception as exc:
+            self.client.logger.warning("Polling meeting %s failed: %r", uuid, exc)
+        else:
+            self._update(meeting, set())
+        for watch in watches:
+            self._reschedule(watch)
+
+    def _update(self, meeting: Meeting, found: Set[UUID]) -> None:
+        for watch in self._watches:
+            if watch.uuid != meeting.uuid or watch.future.done():
+                continue
+            found.add(meeting.uuid)
+            watch.start_at = meeting.start_at
+            if self._is_ready(meeting, watch.flags):
+                self.client.logger.debug("Meeting %s is ready", meeting.uuid)
+                watch.future.set_result(meeting)
+
+    def _reschedule(self, watch: _Watch) -> None:
+        if watch.future.done():
+            return
+        loop = asyncio.get_running_loop()
+        watch.due = loop.time() + watch.interval
+        watch.interval = min(watch.interval * self.backoff, self.max_interval)
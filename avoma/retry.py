@@ -0,0 +1,161 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import aiohttp
+
+
+class RetryPolicy:
+    """Policy deciding whether and when a failed request is retried.
+
+    Delays grow exponentially from ``base_delay`` up to ``max_delay``. With jitter
+    enabled the actual delay is drawn uniformly from ``[0, delay]`` ("full
+    jitter") so that many concurrent callers don't retry in lockstep. A
+    ``Retry-After`` header sent by the server always takes precedence.
+
+    Non-idempotent methods (e.g. POST) are only retried when the server
+    guarantees the request was not processed: rate limited (429) responses and
+    connections that could not be established.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    SAFE_STATUSES = frozenset({429})
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        base_delay: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: Optional[Iterable[int]] = None,
+        retry_methods: Optional[Iterable[str]] = None,
+        respect_retry_after: bool = True,
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total number of attempts, including the first one
+            base_delay: Delay (in seconds) before the first retry
+            max_delay: Upper bound for the backoff delay and for Retry-After
+            jitter: Whether to randomize delays (full jitter)
+            retry_statuses: HTTP status codes that trigger a retry
+                (default: 429, 502, 503, 504)
+            retry_methods: HTTP methods considered safe to retry on any
+                retryable error (default: idempotent methods)
+            respect_retry_after: Whether to honor the Retry-After header
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.retry_statuses = frozenset(
+            self.RETRY_STATUSES if retry_statuses is None else retry_statuses
+        )
+        self.retry_methods = frozenset(
+            m.upper()
+            for m in (
+                self.IDEMPOTENT_METHODS if retry_methods is None else retry_methods
+            )
+        )
+        self.respect_retry_after = respect_retry_after
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Create a policy that never retries."""
+        return cls(max_attempts=1)
+
+    def should_retry_status(self, method: str, status: int, attempt: int) -> bool:
+        """Check whether a response status should be retried.
+
+        Args:
+            method: HTTP method of the request
+            status: HTTP status code of the response
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self.max_attempts or status not in self.retry_statuses:
+            return False
+        return method.upper() in self.retry_methods or status in self.SAFE_STATUSES
+
+    def should_retry_exception(
+        self, method: str, exc: BaseException, attempt: int
+    ) -> bool:
+        """Check whether a client-side exception should be retried.
+
+        Args:
+            method: HTTP method of the request
+            exc: Exception raised while making the request
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            True if the request should be retried
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if isinstance(exc, aiohttp.ClientConnectorError):
+            # The connection was never established, so nothing reached the server
+            return True
+        if isinstance(exc, (aiohttp.ClientConnectionError, TimeoutError)):
+            return method.upper() in self.retry_methods
+        return False
+
+    def backoff(self, attempt: int) -> float:
+        """Compute the backoff delay after a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            Delay in seconds
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Compute how long to wait before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            retry_after: Value of the Retry-After response header, if any
+
+        Returns:
+            Delay in seconds
+        """
+        if self.respect_retry_after and retry_after:
+            parsed = parse_retry_after(retry_after)
+            if parsed is not None:
+                return min(parsed, self.max_delay)
+        return self.backoff(attempt)
+
+
+def parse_retry_after(value: str) -> Optional[float]:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Either a number of seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the value could not be parsed
+    """
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
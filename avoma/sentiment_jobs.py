@@ -0,0 +1,194 @@
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Deque, Dict, Iterable, Optional, Union
+from uuid import UUID
+
+from .incremental import format_datetime
+from .models.sentiments import MeetingSentiment
+
+FINAL_STATUSES = ("completed", "failed")
+"""Statuses of finished sentiment analyses"""
+
+
+class SentimentJobs:
+    """Submit sentiment analyses for many meetings and collect the results.
+
+    Analyses are requested with ``concurrency`` concurrent analyze requests,
+    all going through the client's rate limiter. Completion is then tracked by
+    paging the list of completed and failed analyses created since the jobs
+    were submitted (minus ``lookback``), instead of polling every meeting: the
+    cost of a poll depends on the number of finished analyses, not on the
+    number of pending jobs. The delay between polls grows by ``backoff`` after
+    every poll that finds nothing new. Listed analyses last updated before
+    their job was submitted (minus ``clock_skew``) are results of earlier
+    runs and are ignored.
+
+    Example:
+        jobs = SentimentJobs(client)
+        await jobs.submit(meeting_uuids)
+        async for sentiment in jobs.results():
+            print(sentiment.meeting_uuid, sentiment.status)
+    """
+
+    def __init__(
+        self,
+        client,
+        interval: float = 10.0,
+        max_interval: float = 120.0,
+        backoff: float = 1.5,
+        lookback: timedelta = timedelta(hours=1),
+        concurrency: int = 4,
+        page_size: int = 20,
+        clock_skew: timedelta = timedelta(seconds=30),
+    ):
+        """Initialize the job manager.
+
+        Args:
+            client: AvomaClient used to submit and poll analyses
+            interval: Delay (in seconds) between polls
+            max_interval: Upper bound for the delay between polls
+            backoff: Factor the delay grows by after polls without results
+            lookback: How far before the first submission to list analyses from
+            concurrency: Maximum number of concurrent analyze requests
+            page_size: Number of analyses per list page (max 20)
+            clock_skew: Tolerated difference between the local and server clocks
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.lookback = lookback
+        self.concurrency = concurrency
+        self.page_size = page_size
+        self.clock_skew = clock_skew
+        self._pending: Dict[str, datetime] = {}
+        self._finished: Deque[MeetingSentiment] = deque()
+
+        self.polls = 0
+        """Number of polls made"""
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    async def submit(
+        self, meeting_uuids: Iterable[Union[UUID, str]]
+    ) -> Dict[str, Exception]:
+        """Request sentiment analysis for meetings.
+
+        Args:
+            meeting_uuids: UUIDs of the meetings to analyze
+
+        Returns:
+            Errors by meeting UUID, for the meetings whose analysis could not be
+            requested
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        errors: Dict[str, Exception] = {}
+
+        async def analyze(meeting_uuid: str) -> None:
+            async with semaphore:
+                submitted = datetime.now(timezone.utc)
+                try:
+                    sentiment = await self.client.sentiments.analyze(meeting_uuid)
+                except Exception as exc:
+                    self.client.logger.warning(
+                        "Requesting sentiment analysis of %s failed: %r",
+                        meeting_uuid,
+                        exc,
+                    )
+                    errors[meeting_uuid] = exc
+                    return
+            if sentiment.status in FINAL_STATUSES:
+                self._finished.append(sentiment)
+            else:
+                self._pending[meeting_uuid] = submitted
+
+        uuids = list(dict.fromkeys(str(uuid) for uuid in meeting_uuids))
+        await asyncio.gather(*(analyze(uuid) for uuid in uuids))
+        self.client.logger.debug(
+            "Requested sentiment analysis of %s meetings, %s pending",
+            len(uuids) - len(errors),
+            len(self._pending),
+        )
+        return errors
+
+    async def results(
+        self, timeout: Optional[float] = None
+    ) -> AsyncIterator[MeetingSentiment]:
+        """Yield analyses as they finish, until no job is pending.
+
+        Failed analyses are yielded too, check their ``status``.
+
+        Args:
+            timeout: Seconds after which asyncio.TimeoutError is raised if jobs
+                are still pending (default: wait forever)
+
+        Yields:
+            Finished sentiment analyses
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        interval = self.interval
+        while True:
+            while self._finished:
+                yield self._finished.popleft()
+            if not self._pending:
+                return
+
+            delay = interval
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(
+                        f"{len(self._pending)} sentiment analyses still pending"
+                    )
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
+            if await self.poll():
+                interval = self.interval
+            else:
+                interval = min(interval * self.backoff, self.max_interval)
+
+    async def poll(self) -> int:
+        """Look for finished analyses of pending jobs once.
+
+        Returns:
+            Number of jobs that finished
+        """
+        self.polls += 1
+        if not self._pending:
+            return 0
+        from_date = format_datetime(min(self._pending.values()) - self.lookback)
+        found = 0
+        for status in FINAL_STATUSES:
+            paginator = self.client.sentiments.paginate(
+                from_date=from_date, status=status, page_size=self.page_size
+            )
+            async with aclosing(paginator.items()) as sentiments:
+                async for sentiment in sentiments:
+                    submitted = self._pending.get(sentiment.meeting_uuid)
+                    if submitted is None or self._is_stale(sentiment, submitted):
+                        continue
+                    del self._pending[sentiment.meeting_uuid]
+                    self._finished.append(sentiment)
+                    found += 1
+                    if not self._pending:
+                        break
+            if not self._pending:
+                break
+        self.client.logger.debug(
+            "%s sentiment analyses finished, %s pending", found, len(self._pending)
+        )
+        return found
+
+    def _is_stale(self, sentiment: MeetingSentiment, submitted: datetime) -> bool:
+        updated = sentiment.updated_at
+        if updated.tzinfo is None:
+            updated = updated.replace(tzinfo=timezone.utc)
+        return updated < submitted - self.clock_skew
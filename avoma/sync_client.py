@@ -0,0 +1,179 @@
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Iterator, Optional, TypeVar
+
+from .client import AvomaClient
+
+T = TypeVar("T")
+
+
+class _SyncProxy:
+    """Blocking view of an object living on the client's event loop.
+
+    Method calls run on the loop thread and block until they complete. Their
+    results are converted: async iterators become iterators, asyncio futures
+    become concurrent.futures futures, and objects with async methods (e.g. a
+    Paginator) are proxied in turn.
+    """
+
+    def __init__(self, runner: "SyncAvomaClient", target: Any):
+        self._runner = runner
+        self._target = target
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        @functools.wraps(attr)
+        def call(*args, **kwargs):
+            async def invoke():
+                result = attr(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    result = await result
+                return result
+
+            return self._runner._wrap(self._runner.run(invoke()))
+
+        return call
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._runner._iterate(self._target.__aiter__())
+
+    def __repr__(self) -> str:
+        return f"<sync {self._target!r}>"
+
+
+class SyncAvomaClient:
+    """Blocking client for synchronous code, e.g. Celery tasks or Django views.
+
+    Runs one long-lived event loop on a background thread, with a single
+    AvomaClient on it. Every API method (``client.meetings.get``,
+    ``client.transcriptions.list``, ...) is available as a blocking call that
+    runs on that loop, so calls from any number of threads share the pooled
+    connections, the rate limiter, the cache and the other client state.
+
+    Async iterators returned by the API (``meetings.iter``, paginators, ...)
+    are returned as regular iterators, fetching pages as they are consumed.
+
+    Example:
+        with SyncAvomaClient("your-api-key") as client:
+            meeting = client.meetings.get(meeting_uuid)
+            for meeting in client.meetings.iter(from_date, to_date):
+                ...
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Start the event loop thread and create the client on it.
+
+        Args:
+            *args: Positional arguments for AvomaClient
+            **kwargs: Keyword arguments for AvomaClient
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="avoma-client", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+
+        async def create() -> AvomaClient:
+            return AvomaClient(*args, **kwargs)
+
+        try:
+            self.client: AvomaClient = self.run(create())
+        except BaseException:
+            self._stop()
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes not found on the facade itself
+        client = self.__dict__.get("client")
+        if client is None:
+            raise AttributeError(name)
+        value = getattr(client, name)
+        if type(value).__module__.startswith("avoma.api."):
+            proxy = _SyncProxy(self, value)
+            setattr(self, name, proxy)
+            return proxy
+        return value
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the client's event loop and wait for its result.
+
+        Use this for async helpers that take the client, e.g.
+        ``sync.run(Backfill(sync.client, ...).run(start, end))``.
+
+        Args:
+            awaitable: Coroutine to run
+            timeout: Seconds to wait for the result (default: wait forever)
+
+        Returns:
+            Result of the coroutine
+        """
+        if self._closed or threading.current_thread() is self._thread:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            if self._closed:
+                raise RuntimeError("SyncAvomaClient is closed")
+            raise RuntimeError("SyncAvomaClient can't be called from its own loop")
+
+        async def wrapper():
+            return await awaitable
+
+        future = asyncio.run_coroutine_threadsafe(wrapper(), self._loop)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _wrap(self, value: Any) -> Any:
+        if isinstance(value, asyncio.Future):
+            return asyncio.run_coroutine_threadsafe(_await(value), self._loop)
+        if isinstance(value, dict):
+            return {key: self._wrap(item) for key, item in value.items()}
+        if hasattr(value, "__anext__"):
+            return self._iterate(value)
+        if hasattr(value, "__aiter__"):
+            return _SyncProxy(self, value)
+        return value
+
+    def _iterate(self, iterator) -> Iterator[Any]:
+        try:
+            while True:
+                try:
+                    yield self.run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if hasattr(iterator, "aclose") and not self._closed:
+                self.run(iterator.aclose())
+
+    def close(self) -> None:
+        """Close the client session and stop the event loop thread."""
+        if self._closed:
+            return
+        try:
+            self.run(self.client.close())
+        finally:
+            self._stop()
+
+    def _stop(self) -> None:
+        self._closed = True
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self) -> "SyncAvomaClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+async def _await(future: asyncio.Future) -> Any:
+    return await future
@@ -0,0 +1,81 @@
+import ssl
+from typing import Optional
+
+import aiohttp
+
+
+class TransportConfig:
+    """Connection pool, keep-alive and timeout settings for AvomaClient.
+
+    Every request to the API goes to the same host, so the per-host limit is
+    what actually bounds concurrency. Keeping idle connections alive lets later
+    requests skip the TCP and TLS handshakes, and sharing a single SSL context
+    between connections avoids loading the CA bundle for each of them.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 10,
+        keepalive_timeout: float = 30.0,
+        ttl_dns_cache: Optional[int] = 300,
+        connect_timeout: Optional[float] = 10.0,
+        read_timeout: Optional[float] = 60.0,
+        total_timeout: Optional[float] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        prewarm: int = 0,
+    ):
+        """Initialize the transport configuration.
+
+        Args:
+            limit: Maximum number of open connections (0 for no limit)
+            limit_per_host: Maximum number of open connections to the API host
+                (0 for no limit)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            ttl_dns_cache: Seconds DNS lookups are cached (None caches forever)
+            connect_timeout: Timeout for acquiring a connection, including the
+                TCP and TLS handshakes
+            read_timeout: Timeout between two reads of a response
+            total_timeout: Timeout for a whole request (default: None, no limit)
+            ssl_context: SSL context shared by every connection (default: a
+                context created with ssl.create_default_context())
+            prewarm: Number of connections opened when entering the client's
+                context manager
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.ttl_dns_cache = ttl_dns_cache
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.total_timeout = total_timeout
+        self._ssl_context = ssl_context
+        self.prewarm = prewarm
+
+    @property
+    def ssl_context(self) -> ssl.SSLContext:
+        """Get the SSL context shared by every connection."""
+        if self._ssl_context is None:
+            self._ssl_context = ssl.create_default_context()
+        return self._ssl_context
+
+    def timeout(self) -> aiohttp.ClientTimeout:
+        """Build the session's default request timeouts."""
+        return aiohttp.ClientTimeout(
+            total=self.total_timeout,
+            connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+
+    def connector(self) -> aiohttp.TCPConnector:
+        """Build a connector with the configured pool settings.
+
+        Must be called from a running event loop.
+        """
+        return aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            ssl=self.ssl_context,
+        )
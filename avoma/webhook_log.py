@@ -0,0 +1,198 @@
+import hashlib
+import os
+import struct
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+from .decoding import validate_response
+from .models.webhooks import WebhookEvent
+
+# Body length, CRC32 of key and body, receive time, key length
+_HEADER = struct.Struct(">IIdH")
+
+
+def event_key(event: WebhookEvent, body: bytes) -> str:
+    """Get the deduplication key of a webhook event.
+
+    Deliveries of the same event share the event type, meeting and modified
+    time. Events without a modified time are keyed by a digest of the body.
+
+    Args:
+        event: The event
+        body: Raw request body of the event
+
+    Returns:
+        The key
+    """
+    if event.modified is not None:
+        version = event.modified.isoformat()
+    else:
+        version = hashlib.sha1(body).hexdigest()[:16]
+    return f"{event.event_type}:{event.meeting_uuid}:{version}"
+
+
+class WebhookLog:
+    """Append-only, segmented log of received webhooks.
+
+    Every accepted event is appended as a length-prefixed, checksummed frame
+    holding its deduplication key, receive time and raw body. The log is split
+    into numbered segment files of about ``segment_size`` bytes; only the
+    newest ``max_segments`` are kept. The keys of the kept segments are held in
+    memory to tell redeliveries apart from new events, and events can be
+    replayed from the log, e.g. after a consumer outage, without calling the
+    API again.
+
+    A frame cut short by a crash is dropped when the log is opened.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        segment_size: int = 16 * 1024 * 1024,
+        max_segments: Optional[int] = 10,
+        fsync: bool = False,
+    ):
+        """Open the log, creating the directory if needed.
+
+        Args:
+            directory: Directory of the segment files
+            segment_size: Size after which a new segment is started
+            max_segments: Number of segments to keep (default: 10, None keeps
+                every segment)
+            fsync: Whether to fsync every append, so events survive a power
+                loss and not only a crash of the process (slower)
+        """
+        if max_segments is not None and max_segments < 1:
+            raise ValueError("max_segments must be at least 1")
+
+        self.directory = Path(directory)
+        self.segment_size = segment_size
+        self.max_segments = max_segments
+        self.fsync = fsync
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        self._index: Dict[str, int] = {}
+        self._segment_keys: Dict[int, List[str]] = {}
+        for number in self._numbers():
+            self._segment_keys[number] = []
+            end = 0
+            for end, _, key, _ in self._frames(number):
+                self._index[key] = number
+                self._segment_keys[number].append(key)
+            path = self._path(number)
+            if end < path.stat().st_size:
+                # Torn write: drop the incomplete frame
+                with open(path, "r+b") as file:
+                    file.truncate(end)
+
+        self._current = max(self._segment_keys, default=1)
+        self._segment_keys.setdefault(self._current, [])
+        self._file: BinaryIO = open(self._path(self._current), "ab")
+        self._size = self._file.tell()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _path(self, number: int) -> Path:
+        return self.directory / f"{number:08d}.log"
+
+    def _numbers(self) -> List[int]:
+        return sorted(int(path.stem) for path in self.directory.glob("*.log"))
+
+    def _frames(self, number: int) -> Iterator[Tuple[int, float, str, bytes]]:
+        data = self._path(number).read_bytes()
+        position = 0
+        while position + _HEADER.size <= len(data):
+            length, crc, received, key_length = _HEADER.unpack_from(data, position)
+            start = position + _HEADER.size
+            end = start + key_length + length
+            if end > len(data) or zlib.crc32(data[start:end]) != crc:
+                return
+            key = data[start : start + key_length].decode()
+            yield end, received, key, data[start + key_length : end]
+            position = end
+
+    def append(self, key: str, body: bytes, received: Optional[float] = None) -> bool:
+        """Append an event unless it was logged before.
+
+        Args:
+            key: Deduplication key of the event, see event_key()
+            body: Raw request body of the event
+            received: Receive time as a POSIX timestamp (default: now)
+
+        Returns:
+            False if an event with the same key is already in the log
+        """
+        if key in self._index:
+            return False
+        if self._size >= self.segment_size:
+            self._rotate()
+
+        encoded = key.encode()
+        payload = encoded + body
+        frame = (
+            _HEADER.pack(
+                len(body),
+                zlib.crc32(payload),
+                time.time() if received is None else received,
+                len(encoded),
+            )
+            + payload
+        )
+        self._file.write(frame)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._size += len(frame)
+        self._index[key] = self._current
+        self._segment_keys[self._current].append(key)
+        return True
+
+    def _rotate(self) -> None:
+        self._file.close()
+        self._current += 1
+        self._segment_keys[self._current] = []
+        self._file = open(self._path(self._current), "ab")
+        self._size = 0
+
+        while self.max_segments is not None and (
+            len(self._segment_keys) > self.max_segments
+        ):
+            oldest = min(self._segment_keys)
+            for key in self._segment_keys.pop(oldest):
+                if self._index.get(key) == oldest:
+                    del self._index[key]
+            self._path(oldest).unlink(missing_ok=True)
+
+    def replay(self, since: Optional[datetime] = None) -> Iterator[WebhookEvent]:
+        """Read logged events in the order they were received.
+
+        Args:
+            since: Only replay events received at or after this time
+                (default: every event in the log)
+
+        Yields:
+            The events
+        """
+        self._file.flush()
+        threshold = since.timestamp() if since is not None else None
+        for number in sorted(self._segment_keys):
+            for _, received, _, body in self._frames(number):
+                if threshold is None or received >= threshold:
+                    yield validate_response(WebhookEvent, body)
+
+    def close(self) -> None:
+        """Close the current segment file."""
+        self._file.close()
+
+    def __enter__(self) -> "WebhookLog":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,299 @@
+import asyncio
+import hashlib
+import hmac
+import inspect
+import logging
+import math
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Set
+
+from aiohttp import web
+from pydantic import ValidationError
+
+from .decoding import validate_response
+from .models.webhooks import WebhookEvent
+from .webhook_log import WebhookLog, event_key
+
+SIGNATURE_HEADER = "X-Avoma-Signature"
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check the signature Avoma sends with every webhook.
+
+    Args:
+        secret: API secret key the webhooks are signed with
+        body: Raw request body
+        signature: Value of the X-Avoma-Signature header
+
+    Returns:
+        Whether the signature matches the body
+    """
+    if not signature:
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, signature.lower())
+
+
+def parse_event(body: bytes) -> WebhookEvent:
+    """Validate a webhook request body.
+
+    The raw JSON is parsed and validated in a single pass, and the model is
+    picked by the ``event_type`` field.
+
+    Args:
+        body: Raw request body
+
+    Returns:
+        The event
+    """
+    return validate_response(WebhookEvent, body)
+
+
+class WebhookReceiver:
+    """Receive Avoma webhooks and process them on a pool of workers.
+
+    The request handler only verifies, validates and enqueues events, then
+    acknowledges them right away; the ``handler`` is called later by one of
+    ``workers`` worker tasks. The queue is bounded: when it's full, requests
+    wait up to ``enqueue_timeout`` for room and are then answered with 503, so
+    Avoma retries the delivery later instead of the receiver buffering without
+    limit.
+
+    With a WebhookLog, every accepted event is appended to the log and
+    redeliveries of an event already in the log are acknowledged without
+    being handled again. Logged events can be handed to the workers again with
+    replay().
+
+    Example:
+        receiver = WebhookReceiver(handle_event, secret="your-api-secret")
+        web.run_app(receiver.application())
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[WebhookEvent], Any],
+        secret: Optional[str] = None,
+        path: str = "/webhooks",
+        workers: int = 4,
+        queue_size: int = 1000,
+        enqueue_timeout: float = 5.0,
+        shutdown_timeout: float = 30.0,
+        log: Optional[WebhookLog] = None,
+        logger: Optional[logging.Logger] = None,
+    ):
+        """Initialize the receiver.
+
+        Args:
+            handler: Called with each event; may be a coroutine function
+            secret: Secret key to verify the X-Avoma-Signature header with
+                (default: don't verify signatures)
+            path: URL path webhooks are posted to
+            workers: Number of worker tasks calling the handler
+            queue_size: Maximum number of events waiting for a worker
+            enqueue_timeout: How long a request waits for room in a full queue
+                before it's rejected with 503
+            shutdown_timeout: How long to wait for queued events to be handled
+                on shutdown
+            log: Optional log to deduplicate and replay events with
+            logger: Logger (default: "avoma.webhooks")
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.handler = handler
+        self.secret = secret
+        self.path = path
+        self.workers = workers
+        self.queue_size = queue_size
+        self.enqueue_timeout = enqueue_timeout
+        self.shutdown_timeout = shutdown_timeout
+        self.log = log
+        self.logger = logger or logging.getLogger("avoma.webhooks")
+        self.queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+        self._pending: Set[str] = set()
+
+        self.received = 0
+        """Number of events accepted"""
+
+        self.rejected = 0
+        """Number of requests rejected for a bad signature or payload"""
+
+        self.duplicates = 0
+        """Number of redelivered events that were already logged"""
+
+        self.overloaded = 0
+        """Number of events rejected because the queue was full"""
+
+        self.processed = 0
+        """Number of events handled successfully"""
+
+        self.failed = 0
+        """Number of events whose handler raised"""
+
+    def application(self) -> web.Application:
+        """Create an aiohttp application serving the receiver."""
+        app = web.Application()
+        self.setup(app)
+        return app
+
+    def setup(self, app: web.Application) -> None:
+        """Add the receiver to an existing aiohttp application.
+
+        Registers the webhook route, and starts and stops the workers with the
+        application.
+        """
+        app.router.add_post(self.path, self.handle)
+        app.cleanup_ctx.append(self._lifespan)
+
+    async def start(self) -> None:
+        """Start the workers."""
+        self.queue = asyncio.Queue(self.queue_size)
+        self._tasks = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the workers once the queued events were handled."""
+        if self.queue is None:
+            return
+        try:
+            await asyncio.wait_for(self.queue.join(), self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(
+                "Stopping with %s unhandled webhook events", self.queue.qsize()
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _lifespan(self, app: web.Application):
+        await self.start()
+        yield
+        await self.stop()
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """Handle a webhook request."""
+        body = await request.read()
+        if self.secret is not None and not verify_signature(
+            self.secret, body, request.headers.get(SIGNATURE_HEADER)
+        ):
+            self.rejected += 1
+            self.logger.warning("Rejected webhook with invalid signature")
+            return web.Response(status=401)
+        try:
+            event = parse_event(body)
+        except ValidationError as exc:
+            self.rejected += 1
+            self.logger.warning(
+                "Rejected invalid webhook payload: %s", exc.errors()[0]["msg"]
+            )
+            return web.Response(status=400)
+
+        if self.log is None:
+            accepted = await self.enqueue(event)
+        else:
+            key = event_key(event, body)
+            if key in self.log or key in self._pending:
+                self.duplicates += 1
+                self.logger.debug("Skipping duplicate webhook %s", key)
+                return web.Response()
+            self._pending.add(key)
+            try:
+                accepted = await self.enqueue(event)
+                if accepted:
+                    self.log.append(key, body)
+            finally:
+                self._pending.discard(key)
+
+        if not accepted:
+            return web.Response(
+                status=503,
+                headers={"Retry-After": str(math.ceil(self.enqueue_timeout))},
+            )
+        return web.Response()
+
+    async def enqueue(self, event: WebhookEvent) -> bool:
+        """Queue an event for the workers.
+
+        Args:
+            event: Event to handle
+
+        Returns:
+            False if the queue stayed full for ``enqueue_timeout``
+        """
+        if self.queue is None:
+            raise RuntimeError("WebhookReceiver was not started")
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self.queue.put(event), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.overloaded += 1
+                self.logger.warning(
+                    "Webhook queue full, rejected %s event for %s",
+                    event.event_type,
+                    event.meeting_uuid,
+                )
+                return False
+        self.received += 1
+        return True
+
+    async def replay(self, since: Optional[datetime] = None) -> int:
+        """Hand logged events to the workers again, e.g. after a consumer outage.
+
+        Waits for room in the queue instead of dropping events.
+
+        Args:
+            since: Only replay events received at or after this time
+                (default: every event in the log)
+
+        Returns:
+            Number of replayed events
+        """
+        if self.log is None:
+            raise RuntimeError("WebhookReceiver has no log to replay")
+        if self.queue is None:
+            raise RuntimeError("WebhookReceiver was not started")
+        count = 0
+        for event in self.log.replay(since):
+            await self.queue.put(event)
+            count += 1
+        self.logger.info("Replayed %s webhook events", count)
+        return count
+
+    async def _worker(self) -> None:
+        while True:
+            event = await self.queue.get()
+            try:
+                result = self.handler(event)
+                if inspect.isawaitable(result):
+                    await result
+                self.processed += 1
+            except Exception:
+                self.failed += 1
+                self.logger.exception(
+                    "Webhook handler failed for %s event for %s",
+                    event.event_type,
+                    event.meeting_uuid,
+                )
+            finally:
+                self.queue.task_done()
+
+    def stats(self) -> dict:
+        """Snapshot of the receiver's counters.
+
+        Returns:
+            Dictionary with the event counts and current queue size
+        """
+        return {
+            "received": self.received,
+            "rejected": self.rejected,
+            "duplicates": self.duplicates,
+            "overloaded": self.overloaded,
+            "processed": self.processed,
+            "failed": self.failed,
+            "queued": self.queue.qsize() if self.queue is not None else 0,
+        }
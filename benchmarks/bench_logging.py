@@ -0,0 +1,54 @@
+"""Micro-benchmark of the client's logging overhead when DEBUG is disabled.
+
+Compares eager f-string messages with the lazy %-style arguments used by the
+client, and times the logging done by AvomaClient._request for a request with
+a large JSON body.
+
+Usage: python -m benchmarks.bench_logging
+"""
+
+import logging
+import timeit
+
+from avoma.logging import Truncated
+
+NUMBER = 200_000
+
+logger = logging.getLogger("avoma.bench")
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+params = {"from_date": "2024-02-14T00:00:00", "to_date": "2024-02-15T00:00:00"}
+payload = {"results": [{"uuid": f"{n:032x}", "subject": "Meeting"} for n in range(200)]}
+
+
+def eager():
+    logger.debug(f"Request {id(params)} params: {params}")
+    logger.debug(f"Response {id(payload)} body: {payload}")
+
+
+def lazy():
+    logger.debug("Request %s params: %s", id(params), Truncated(params))
+    logger.debug("Response %s body: %s", id(payload), Truncated(payload))
+
+
+def guarded():
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Request %s params: %s", id(params), Truncated(params))
+        logger.debug("Response %s body: %s", id(payload), Truncated(payload))
+
+
+def main():
+    for level in (logging.INFO, logging.DEBUG):
+        logger.setLevel(level)
+        print(f"{logging.getLevelName(level)}:")
+        for fn in (eager, lazy, guarded):
+            seconds = timeit.timeit(
+                fn, number=NUMBER if level == logging.INFO else 2000
+            )
+            calls = NUMBER if level == logging.INFO else 2000
+            print(f"  {fn.__name__:8} {seconds / calls * 1e9:10.0f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import math
+import pytest
+from datetime import datetime, timedelta, timezone
+
+from avoma import AvomaClient
+from avoma.backfill import Backfill, BackfillCheckpoint
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = START + timedelta(days=28)
+
+
+def make_meeting(start_at):
+    return {
+        "uuid": f"{int(start_at.timestamp()):08x}-e89b-12d3-a456-426614174000",
+        "subject": f"Meeting at {start_at.isoformat()}",
+        "created": "2024-01-01T00:00:00Z",
+        "modified": "2024-01-01T00:00:00Z",
+        "start_at": start_at.isoformat(),
+        "is_private": False,
+        "is_internal": True,
+        "organizer_email": "test@example.com",
+        "state": "completed",
+        "attendees": [],
+        "audio_ready": True,
+        "video_ready": True,
+        "is_call": False,
+        "notes_ready": True,
+        "transcript_ready": True,
+    }
+
+
+# One meeting per day, except for a busy week with one meeting every hour
+STARTS = [START + timedelta(days=n, hours=12) for n in range(28) if not 7 <= n < 14]
+STARTS += [START + timedelta(days=7, hours=n) for n in range(7 * 24)]
+
+
+def fake_api(client):
+    requests = []
+
+    async def request(method, path, params=None, raw=False):
+        requests.append((path, params))
+        lower = datetime.fromisoformat(params["from_date"])
+        upper = datetime.fromisoformat(params["to_date"])
+        matching = sorted(s for s in STARTS if lower <= s <= upper)
+        size = params.get("page_size", 10)
+        page = params.get("page", 1)
+        results = matching[(page - 1) * size : page * size]
+        return {
+            "count": len(matching),
+            "next": "next" if page < math.ceil(len(matching) / size) else None,
+            "previous": None,
+            "results": [make_meeting(s) for s in results],
+        }
+
+    client._request = request
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_backfill_splits_dense_windows():
+    client = AvomaClient("test-api-key")
+    requests = fake_api(client)
+    records = []
+
+    backfill = Backfill(
+        client,
+        "meetings",
+        lambda resource, meeting: records.append(meeting.start_at),
+        max_records=50,
+        concurrency=3,
+    )
+    result = await backfill.run(START, END)
+
+    assert sorted(records) == sorted(STARTS)
+    assert result.records == len(STARTS)
+    # The busy week (168 meetings) is split down to windows of at most 50
+    assert result.splits >= 3
+    assert backfill.checkpoint.completed == [(START, END)]
+    assert all(params["page_size"] == 100 for _, params in requests)
+
+
+@pytest.mark.asyncio
+async def test_backfill_resumes_from_checkpoint(tmp_path):
+    path = tmp_path / "checkpoint.json"
+    client = AvomaClient("test-api-key")
+    fake_api(client)
+    records = []
+
+    def failing_sink(resource, meeting):
+        if meeting.start_at >= START + timedelta(days=21):
+            raise RuntimeError("disk full")
+        records.append(meeting.start_at)
+
+    with pytest.raises(RuntimeError):
+        await Backfill(
+            client, "meetings", failing_sink, BackfillCheckpoint(path), concurrency=1
+        ).run(START, END)
+
+    checkpoint = BackfillCheckpoint(path)
+    assert checkpoint.completed == [(START, START + timedelta(days=21))]
+
+    requests = fake_api(client)
+    resumed = Backfill(
+        client,
+        "meetings",
+        lambda resource, meeting: records.append(meeting.start_at),
+        checkpoint,
+    )
+    result = await resumed.run(START, END)
+
+    assert result.windows == 1
+    assert sorted(records) == sorted(STARTS)
+    assert requests[0][1]["from_date"] == "2024-01-22T00:00:00Z"
+
+
+def test_checkpoint_remaining_windows():
+    checkpoint = BackfillCheckpoint()
+    checkpoint.add(START + timedelta(days=2), START + timedelta(days=3))
+    checkpoint.add(START, START + timedelta(days=1))
+    checkpoint.add(START + timedelta(days=1), START + timedelta(days=2))
+
+    assert checkpoint.completed == [(START, START + timedelta(days=3))]
+    assert checkpoint.remaining(START, END) == [(START + timedelta(days=3), END)]
+
+
+@pytest.mark.asyncio
+async def test_transcriptions_are_sized_by_meeting_count():
+    client = AvomaClient("test-api-key")
+    meetings = fake_api(client)
+    count_meetings = client._request
+    windows = []
+
+    async def request(method, path, params=None, raw=False):
+        if path == "/transcriptions":
+            windows.append((params["from_date"], params["to_date"]))
+            return []
+        return await count_meetings(method, path, params=params, raw=raw)
+
+    client._request = request
+    result = await Backfill(
+        client, "transcriptions", lambda *args: None, max_records=100
+    ).run(START, START + timedelta(days=14))
+
+    # The busy week (168 meetings) is fetched in two halves
+    assert result.splits == 1
+    assert sorted(windows) == [
+        ("2024-01-01T00:00:00Z", "2024-01-07T23:59:59Z"),
+        ("2024-01-08T00:00:00Z", "2024-01-11T11:59:59Z"),
+        ("2024-01-11T12:00:00Z", "2024-01-14T23:59:59Z"),
+    ]
+    assert all(params["page_size"] == 1 for _, params in meetings)
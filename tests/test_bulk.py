@@ -0,0 +1,113 @@
+import asyncio
+import pytest
+from uuid import UUID
+from unittest.mock import AsyncMock
+
+from avoma import AvomaClient
+from avoma.models.meetings import Meeting
+
+TRANSCRIPTION_UUID = "523e4567-e89b-12d3-a456-426614174000"
+
+
+def make_meeting(n, **flags):
+    data = {
+        "uuid": f"{n:08d}-e89b-12d3-a456-426614174000",
+        "subject": f"Test Meeting {n}",
+        "created": "2024-02-14T12:00:00Z",
+        "modified": "2024-02-14T12:00:00Z",
+        "is_private": False,
+        "is_internal": True,
+        "organizer_email": "test@example.com",
+        "state": "completed",
+        "attendees": [],
+        "audio_ready": True,
+        "video_ready": False,
+        "is_call": False,
+        "notes_ready": True,
+        "transcript_ready": True,
+        "transcription_uuid": TRANSCRIPTION_UUID,
+    }
+    data.update(flags)
+    return Meeting.model_validate(data)
+
+
+async def fake_request(method, path, params=None, raw=False):
+    await asyncio.sleep(0)
+    if path.endswith("/insights"):
+        return {"ai_notes": [], "keywords": {}, "speakers": []}
+    if path == "meeting_sentiments":
+        return [{"sentiment": 1, "sentiment_ranges": []}]
+    if path.startswith("/transcriptions/"):
+        return {
+            "uuid": TRANSCRIPTION_UUID,
+            "transcript": [],
+            "speakers": [],
+            "transcription_vtt_url": "https://example.com/transcript.vtt",
+        }
+    if path == "/recordings":
+        if params["meeting_uuid"].startswith("00000002"):
+            raise RuntimeError("boom")
+        return {
+            "uuid": "623e4567-e89b-12d3-a456-426614174000",
+            "meeting_uuid": params["meeting_uuid"],
+            "audio_url": "https://example.com/audio.mp3",
+        }
+    raise AssertionError(f"Unexpected request: {method} {path}")
+
+
+@pytest.mark.asyncio
+async def test_hydrate_meetings():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(side_effect=fake_request)
+    meetings = [
+        make_meeting(1),
+        make_meeting(2),
+        make_meeting(3, transcript_ready=False, notes_ready=False),
+    ]
+
+    hydrated = {
+        h.meeting.subject: h async for h in client.bulk.hydrate(meetings, concurrency=2)
+    }
+
+    assert len(hydrated) == 3
+
+    first = hydrated["Test Meeting 1"]
+    assert first.insights is not None
+    assert first.sentiments.sentiment == 1
+    assert first.transcription.uuid == UUID(TRANSCRIPTION_UUID)
+    assert str(first.recording.audio_url) == "https://example.com/audio.mp3"
+    assert first.skipped == [] and first.errors == {}
+
+    # A failing sub-request is recorded without failing the batch
+    second = hydrated["Test Meeting 2"]
+    assert second.recording is None
+    assert "boom" in second.errors["recording"]
+    assert second.insights is not None
+
+    # Resources that aren't ready are skipped without a request
+    third = hydrated["Test Meeting 3"]
+    assert third.skipped == ["insights", "sentiments", "transcription"]
+    assert third.recording is not None
+
+    # 4 + 4 + 1 sub-requests
+    assert client._request.call_count == 9
+
+
+@pytest.mark.asyncio
+async def test_hydrate_accepts_async_iterables_and_include():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(side_effect=fake_request)
+
+    async def meetings():
+        for n in range(1, 6):
+            yield make_meeting(n)
+
+    hydrated = [h async for h in client.bulk.hydrate(meetings(), include=["insights"])]
+
+    assert len(hydrated) == 5
+    assert all(h.insights is not None and h.recording is None for h in hydrated)
+    assert client._request.call_count == 5
+
+    with pytest.raises(ValueError):
+        async for _ in client.bulk.hydrate([], include=["scorecards"]):
+            pass
@@ -0,0 +1,95 @@
+import pytest
+
+from aioresponses import aioresponses
+from yarl import URL
+
+from avoma import AvomaClient, LRUCache, ResponseCache
+from avoma.models.smart_categories import SmartCategoryUpdate
+
+BASE_URL = "https://api.avoma.com/v1"
+CATEGORY_UUID = "123e4567-e89b-12d3-a456-426614174000"
+CATEGORY = {
+    "uuid": CATEGORY_UUID,
+    "name": "Test Category",
+    "key": "test_category",
+    "is_default": False,
+    "keywords": [],
+    "prompts": [],
+    "settings": {
+        "aug_notes_enabled": True,
+        "keyword_notes_enabled": True,
+        "keyword_tracking_enabled": True,
+        "prompt_extract_length": "medium",
+        "prompt_extract_strategy": "after",
+        "prompt_notes_enabled": True,
+    },
+}
+CATEGORIES = {"count": 1, "next": None, "previous": None, "results": [CATEGORY]}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_lru_cache_ttl_and_eviction():
+    clock = FakeClock()
+    cache = LRUCache(maxsize=2, clock=clock)
+
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1
+    cache.set("c", 3, ttl=10)
+
+    # "b" was least recently used
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    clock.now = 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+def test_response_cache_keys_and_ttls():
+    cache = ResponseCache(ttls={"meetings/*": 60})
+
+    assert cache.ttl_for("/meetings/123") == 60
+    assert cache.ttl_for("/meetings") is None
+    assert cache.key("get", "/users", {"b": 2, "a": 1}) == "GET /users/?a=1&b=2"
+
+    assert cache.set("GET", "meetings/123", None, b"{}")
+    assert not cache.set("GET", "users", None, b"{}")
+    assert cache.get("GET", "meetings/123") == b"{}"
+    assert cache.invalidate("meetings/456") == 1
+    assert cache.get("GET", "meetings/123") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_client_caches_reference_data_and_invalidates_on_update():
+    cache = ResponseCache()
+    client = AvomaClient("test-api-key", rate_limit=None, cache=cache)
+
+    with aioresponses() as mocked:
+        mocked.get(f"{BASE_URL}/smart_categories/", payload=CATEGORIES)
+        mocked.patch(f"{BASE_URL}/smart_categories/{CATEGORY_UUID}/", payload=CATEGORY)
+        mocked.get(f"{BASE_URL}/smart_categories/", payload=CATEGORIES)
+
+        first = await client.smart_categories.list()
+        second = await client.smart_categories.list()
+        assert first == second
+        assert cache.hits == 1
+
+        await client.smart_categories.update(
+            CATEGORY_UUID,
+            SmartCategoryUpdate(keywords=[], prompts=[], settings=CATEGORY["settings"]),
+        )
+        await client.smart_categories.list()
+
+    await client.close()
+    # The update invalidated the cached list, so it was fetched again
+    assert len(mocked.requests[("GET", URL(f"{BASE_URL}/smart_categories/"))]) == 2
+    assert cache.hits == 1
@@ -66,7 +66,7 @@ async def test_list_calls():
 
     # Verify the mock was called with correct parameters
     client._request.assert_called_once_with(
-        "GET", "/calls", params={"from_date": from_date, "to_date": to_date}
+        "GET", "/calls", params={"from_date": from_date, "to_date": to_date}, raw=True
     )
 
     assert calls.count == 1
@@ -129,7 +129,7 @@ async def test_get_call():
     call = await client.calls.get(UUID(call_uuid))
 
     # Verify the mock was called with correct URL path
-    client._request.assert_called_once_with("GET", f"/calls/{call_uuid}")
+    client._request.assert_called_once_with("GET", f"/calls/{call_uuid}", raw=True)
 
     assert call.uuid == UUID(call_uuid)
     assert call.title == "Weekly Team Sync"
@@ -199,7 +199,7 @@ async def test_create_call():
 
     # Verify the mock was called with correct parameters
     client._request.assert_called_once_with(
-        "POST", "/calls", json=call_data.model_dump(exclude_unset=True)
+        "POST", "/calls", json=call_data.model_dump(exclude_unset=True), raw=True
     )
 
     assert call.uuid == UUID("123e4567-e89b-12d3-a456-426614174000")
@@ -255,7 +255,10 @@ async def test_update_call():
 
     # Verify the mock was called with correct parameters
     client._request.assert_called_once_with(
-        "PUT", f"/calls/{call_uuid}", json=update_data.model_dump(exclude_unset=True)
+        "PUT",
+        f"/calls/{call_uuid}",
+        json=update_data.model_dump(exclude_unset=True),
+        raw=True,
     )
 
     assert call.uuid == UUID(call_uuid)
@@ -354,6 +357,6 @@ async def test_call_lifecycle():
 
     # Verify the mock was called with correct parameters
     assert mock_request.call_count == 3
-    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/start")
-    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/end")
-    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/cancel")
+    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/start", raw=True)
+    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/end", raw=True)
+    mock_request.assert_any_call("POST", f"/calls/{call_uuid}/cancel", raw=True)
@@ -0,0 +1,68 @@
+import json
+import pytest
+from typing import List
+from uuid import UUID
+
+from aioresponses import aioresponses
+
+from avoma import AvomaClient
+from avoma.decoding import type_adapter, validate_response
+from avoma.models.transcriptions import Transcription
+
+TRANSCRIPTION = {
+    "uuid": "123e4567-e89b-12d3-a456-426614174000",
+    "transcript": [
+        {
+            "transcript": "Hello, how are you?",
+            "timestamps": [0.0, 0.5, 1.0, 1.5],
+            "speaker_id": 1,
+        }
+    ],
+    "speakers": [
+        {
+            "email": "speaker@example.com",
+            "id": 1,
+            "is_rep": True,
+            "name": "Test Speaker",
+        }
+    ],
+    "transcription_vtt_url": "https://example.com/transcript.vtt",
+}
+
+
+def test_type_adapters_are_cached():
+    assert type_adapter(List[Transcription]) is type_adapter(List[Transcription])
+
+
+def test_validate_response_from_bytes_and_python():
+    raw = json.dumps([TRANSCRIPTION]).encode()
+
+    from_bytes = validate_response(List[Transcription], raw)
+    from_python = validate_response(List[Transcription], [TRANSCRIPTION])
+
+    assert from_bytes == from_python
+    assert from_bytes[0].transcript[0].timestamps == [0.0, 0.5, 1.0, 1.5]
+
+
+@pytest.mark.asyncio
+async def test_request_raw_returns_body_bytes():
+    client = AvomaClient("test-api-key", rate_limit=None)
+    uuid = TRANSCRIPTION["uuid"]
+
+    with aioresponses() as mocked:
+        mocked.get(
+            f"https://api.avoma.com/v1/transcriptions/{uuid}/",
+            body=json.dumps(TRANSCRIPTION),
+        )
+        mocked.get(
+            f"https://api.avoma.com/v1/transcriptions/{uuid}/",
+            body=json.dumps(TRANSCRIPTION),
+        )
+
+        raw = await client._request("GET", f"/transcriptions/{uuid}", raw=True)
+        transcription = await client.transcriptions.get(UUID(uuid))
+
+    await client.close()
+    assert isinstance(raw, bytes)
+    assert transcription.uuid == UUID(uuid)
+    assert transcription.speakers[0].name == "Test Speaker"
@@ -0,0 +1,261 @@
+import asyncio
+import json
+import os
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import UUID
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from avoma import AvomaClient, RetryPolicy
+from avoma.download import DownloadError, RecordingDownloader
+from avoma.models.recordings import Recording
+
+RECORDING_UUID = UUID("123e4567-e89b-12d3-a456-426614174000")
+DATA = os.urandom(100_000)
+
+
+def make_recording(server, token="a", valid_till=None):
+    return Recording(
+        uuid=RECORDING_UUID,
+        meeting_uuid=RECORDING_UUID,
+        video_url=str(server.make_url(f"/video.mp4?token={token}")),
+        audio_url=None,
+        valid_till=valid_till or datetime.now(timezone.utc) + timedelta(hours=1),
+    )
+
+
+def make_app(requests, tokens=("a",), data=DATA):
+    async def video(request):
+        requests.append((request.query.get("token"), request.headers.get("Range")))
+        if request.query.get("token") not in tokens:
+            return web.Response(status=403)
+        if request.headers.get("Authorization"):
+            return web.Response(status=400)
+        first, last = request.headers["Range"][len("bytes=") :].split("-")
+        first, last = int(first), min(int(last), len(data) - 1)
+        return web.Response(
+            status=206,
+            body=data[first : last + 1],
+            headers={"Content-Range": f"bytes {first}-{last}/{len(data)}"},
+        )
+
+    app = web.Application()
+    app.router.add_get("/video.mp4", video)
+    return app
+
+
+@pytest.fixture
+async def client():
+    client = AvomaClient(
+        "test-key", retry_policy=RetryPolicy(base_delay=0, jitter=False)
+    )
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_segmented_download(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests)) as server:
+        downloader = RecordingDownloader(
+            client, chunk_size=4096, segments=4, min_segment_size=10_000
+        )
+        path = await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+    assert path.read_bytes() == DATA
+    assert sorted(os.listdir(tmp_path)) == ["video.mp4"]
+    # A size probe, then one request per segment
+    ranges = [r for _, r in requests]
+    assert ranges[0] == "bytes=0-0"
+    assert sorted(ranges[1:]) == [
+        "bytes=0-24999",
+        "bytes=25000-49999",
+        "bytes=50000-74999",
+        "bytes=75000-99999",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_small_file_is_not_split(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests)) as server:
+        downloader = RecordingDownloader(client, segments=4)
+        await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+    assert [r for _, r in requests] == ["bytes=0-0", "bytes=0-99999"]
+    assert (tmp_path / "video.mp4").read_bytes() == DATA
+
+
+@pytest.mark.asyncio
+async def test_download_resumes_partial_file(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests)) as server:
+        recording = make_recording(server)
+        path = tmp_path / "video.mp4"
+        part = tmp_path / "video.mp4.part"
+        part.write_bytes(DATA[:30_000] + bytes(70_000))
+        (tmp_path / "video.mp4.part.json").write_text(
+            json.dumps(
+                {
+                    "url_path": str(recording.video_url).split("?")[0],
+                    "size": len(DATA),
+                    "segments": [[0, 50_000, 30_000], [50_000, 100_000, 0]],
+                }
+            )
+        )
+
+        downloader = RecordingDownloader(client, min_segment_size=10_000)
+        await downloader.download(recording, path)
+
+    assert sorted(r for _, r in requests) == ["bytes=30000-49999", "bytes=50000-99999"]
+    assert path.read_bytes() == DATA
+    assert not part.exists()
+
+
+@pytest.mark.asyncio
+async def test_download_refreshes_url_on_403(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests, tokens=("b",))) as server:
+        client.recordings.get = AsyncMock(
+            return_value=make_recording(server, token="b")
+        )
+        downloader = RecordingDownloader(client, min_segment_size=10_000)
+        await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+    client.recordings.get.assert_awaited_once_with(RECORDING_UUID)
+    assert requests[0] == ("a", "bytes=0-0")
+    assert {token for token, _ in requests[1:]} == {"b"}
+    assert (tmp_path / "video.mp4").read_bytes() == DATA
+
+
+@pytest.mark.asyncio
+async def test_download_refreshes_expired_url(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests, tokens=("b",))) as server:
+        expired = make_recording(
+            server, valid_till=datetime.now(timezone.utc) - timedelta(minutes=1)
+        )
+        client.recordings.get = AsyncMock(
+            return_value=make_recording(server, token="b")
+        )
+        downloader = RecordingDownloader(client)
+        await downloader.download(expired, tmp_path / "video.mp4")
+
+    client.recordings.get.assert_awaited_once_with(RECORDING_UUID)
+    assert {token for token, _ in requests} == {"b"}
+
+
+@pytest.mark.asyncio
+async def test_download_fetches_recording_by_uuid(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests)) as server:
+        client.recordings.get = AsyncMock(return_value=make_recording(server))
+        downloader = RecordingDownloader(client)
+        await downloader.download(RECORDING_UUID, tmp_path / "video.mp4")
+
+    assert (tmp_path / "video.mp4").read_bytes() == DATA
+
+
+@pytest.mark.asyncio
+async def test_download_without_url(client, tmp_path):
+    recording = Recording(uuid=RECORDING_UUID, meeting_uuid=RECORDING_UUID)
+    downloader = RecordingDownloader(client)
+    with pytest.raises(DownloadError):
+        await downloader.download(recording, tmp_path / "audio.mp3", media="audio")
+
+
+@pytest.mark.asyncio
+async def test_persistent_403_raises_download_error(client, tmp_path):
+    requests = []
+    async with TestServer(make_app(requests, tokens=())) as server:
+        client.recordings.get = AsyncMock(return_value=make_recording(server))
+        downloader = RecordingDownloader(client)
+        with pytest.raises(DownloadError):
+            await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+        # Same when the URL stops working in the middle of a download
+        recording = make_recording(server)
+        (tmp_path / "video.mp4.part").write_bytes(bytes(len(DATA)))
+        (tmp_path / "video.mp4.part.json").write_text(
+            json.dumps(
+                {
+                    "url_path": str(recording.video_url).split("?")[0],
+                    "size": len(DATA),
+                    "segments": [[0, len(DATA), 0]],
+                }
+            )
+        )
+        with pytest.raises(DownloadError):
+            await downloader.download(recording, tmp_path / "video.mp4")
+
+    attempts = client.retry_policy.max_attempts
+    assert len(requests) == 2 * attempts
+    assert client.recordings.get.await_count == 2 * (attempts - 1)
+
+
+@pytest.mark.asyncio
+async def test_failed_segment_stops_the_others(client, tmp_path):
+    streaming = asyncio.Event()
+
+    async def video(request):
+        first, last = request.headers["Range"][len("bytes=") :].split("-")
+        first, last = int(first), int(last)
+        if first == 50_000:
+            # Fail once the other segments are in the middle of their bodies
+            await streaming.wait()
+            return web.Response(status=404)
+        response = web.StreamResponse(
+            status=206,
+            headers={"Content-Range": f"bytes {first}-{last}/{len(DATA)}"},
+        )
+        response.content_length = last - first + 1
+        await response.prepare(request)
+        for start in range(first, last + 1, 1000):
+            await response.write(DATA[start : min(start + 1000, last + 1)])
+            if start - first >= 5000:
+                streaming.set()
+            await asyncio.sleep(0.005)
+        return response
+
+    app = web.Application()
+    app.router.add_get("/video.mp4", video)
+    async with TestServer(app) as server:
+        downloader = RecordingDownloader(
+            client, chunk_size=1000, segments=4, min_segment_size=10_000
+        )
+        with pytest.raises(DownloadError, match="404"):
+            await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+        running = [
+            task
+            for task in asyncio.all_tasks()
+            if "_fetch_segment" in repr(task.get_coro())
+        ]
+        assert running == []
+
+    # The saved progress matches what is on disk, so a resume is safe
+    state = json.loads((tmp_path / "video.mp4.part.json").read_text())
+    part = (tmp_path / "video.mp4.part").read_bytes()
+    assert any(done for _, _, done in state["segments"])
+    for start, _, done in state["segments"]:
+        assert part[start : start + done] == DATA[start : start + done]
+
+
+@pytest.mark.asyncio
+async def test_unknown_total_size_is_an_error(client, tmp_path):
+    async def video(request):
+        return web.Response(
+            status=206, body=DATA[:1], headers={"Content-Range": "bytes 0-0/*"}
+        )
+
+    app = web.Application()
+    app.router.add_get("/video.mp4", video)
+    async with TestServer(app) as server:
+        downloader = RecordingDownloader(client)
+        with pytest.raises(DownloadError, match="size"):
+            await downloader.download(make_recording(server), tmp_path / "video.mp4")
+
+    assert not (tmp_path / "video.mp4").exists()
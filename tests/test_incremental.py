@@ -0,0 +1,168 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from avoma import AvomaClient
+from avoma.incremental import (
+    FileWatermarkStore,
+    IncrementalSync,
+    MemoryWatermarkStore,
+)
+
+NOW = datetime(2024, 2, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def meeting(n, modified):
+    return {
+        "uuid": f"{n:08d}-e89b-12d3-a456-426614174000",
+        "subject": f"Meeting {n}",
+        "created": "2024-02-14T12:00:00Z",
+        "modified": modified,
+        "is_private": False,
+        "is_internal": True,
+        "organizer_email": "test@example.com",
+        "state": "completed",
+        "attendees": [],
+        "audio_ready": True,
+        "video_ready": True,
+        "is_call": False,
+        "notes_ready": True,
+        "transcript_ready": True,
+    }
+
+
+def page(results, next_page=None):
+    return {
+        "count": len(results),
+        "next": f"https://api.avoma.com/v1/x/?page={next_page}" if next_page else None,
+        "previous": None,
+        "results": results,
+    }
+
+
+@pytest.mark.asyncio
+async def test_first_run_emits_everything_and_sets_watermark():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(
+        side_effect=[
+            page([meeting(1, "2024-02-14T10:00:00Z")], next_page=2),
+            # The first meeting shifted to the next page while paginating
+            page(
+                [meeting(1, "2024-02-14T10:00:00Z"), meeting(2, "2024-02-15T09:00:00Z")]
+            ),
+        ]
+    )
+    store = MemoryWatermarkStore()
+    upserts = []
+
+    result = await IncrementalSync(
+        client, store, lambda resource, record: upserts.append(record.subject)
+    ).sync("meetings", now=NOW)
+
+    assert upserts == ["Meeting 1", "Meeting 2"]
+    assert (result.scanned, result.upserts) == (3, 2)
+    assert store.get("meetings") == datetime(2024, 2, 15, 9, tzinfo=timezone.utc)
+    params = client._request.call_args_list[0].kwargs["params"]
+    assert params["from_date"] == "2024-02-08T12:00:00Z"
+    assert params["to_date"] == "2024-02-15T12:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_next_run_only_emits_changes_since_watermark():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(
+        return_value=page(
+            [
+                meeting(1, "2024-02-14T10:00:00Z"),  # Unchanged
+                meeting(2, "2024-02-15T08:58:00Z"),  # Within the overlap
+                meeting(3, "2024-02-15T11:00:00Z"),  # Changed
+            ]
+        )
+    )
+    watermark = datetime(2024, 2, 15, 9, tzinfo=timezone.utc)
+    store = MemoryWatermarkStore({"meetings": watermark})
+    upserts = AsyncMock()
+
+    result = await IncrementalSync(
+        client, store, upserts, lookback=timedelta(days=1)
+    ).sync("meetings", now=NOW)
+
+    assert [c.args[1].subject for c in upserts.await_args_list] == [
+        "Meeting 2",
+        "Meeting 3",
+    ]
+    assert result.watermark == datetime(2024, 2, 15, 11, tzinfo=timezone.utc)
+    params = client._request.call_args.kwargs["params"]
+    assert params["from_date"] == "2024-02-14T09:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_notes_stop_at_first_unchanged_note():
+    client = AvomaClient("test-api-key")
+    notes = [
+        {"created": f"2024-02-1{n}T00:00:00Z", "modified": modified, "data": {}}
+        for n, modified in enumerate(
+            ["2024-02-15T11:00:00Z", "2024-02-15T10:00:00Z", "2024-02-14T00:00:00Z"]
+        )
+    ]
+    client._request = AsyncMock(return_value=page(notes, next_page=2))
+    store = MemoryWatermarkStore(
+        {"notes": datetime(2024, 2, 15, 9, tzinfo=timezone.utc)}
+    )
+    upserts = []
+
+    result = await IncrementalSync(
+        client, store, lambda resource, note: upserts.append(note)
+    ).sync("notes", now=NOW)
+
+    assert len(upserts) == 2
+    assert result.scanned == 3
+    # The next page isn't fetched
+    client._request.assert_awaited_once()
+    assert client._request.call_args.kwargs["params"]["o"] == "-modified"
+
+
+@pytest.mark.asyncio
+async def test_failed_sink_keeps_watermark():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(return_value=page([meeting(1, "2024-02-15T10:00:00Z")]))
+    store = MemoryWatermarkStore()
+
+    def sink(resource, record):
+        raise RuntimeError("sink unavailable")
+
+    with pytest.raises(RuntimeError):
+        await IncrementalSync(client, store, sink).sync("meetings", now=NOW)
+    assert store.get("meetings") is None
+
+
+def test_file_watermark_store(tmp_path):
+    path = tmp_path / "watermarks.json"
+    watermark = datetime(2024, 2, 15, 9, 30, 1, 250, tzinfo=timezone.utc)
+
+    store = FileWatermarkStore(path)
+    assert store.get("meetings") is None
+    store.set("meetings", watermark)
+    store.set("calls", watermark)
+
+    assert FileWatermarkStore(path).get("meetings") == watermark
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["watermarks.json"]
+
+
+@pytest.mark.asyncio
+async def test_notes_created_at_the_same_time_are_kept_apart():
+    client = AvomaClient("test-api-key")
+    notes = [
+        {"created": "2024-02-15T10:00:00Z", "modified": "2024-02-15T10:00:00Z", **n}
+        for n in ({"data": {"text": "a"}}, {"data": {"text": "b"}})
+    ]
+    # The first note shifted to the next page while paginating
+    client._request = AsyncMock(side_effect=[page(notes, next_page=2), page(notes[:1])])
+    upserts = []
+
+    result = await IncrementalSync(
+        client, MemoryWatermarkStore(), lambda resource, note: upserts.append(note)
+    ).sync("notes", now=NOW)
+
+    assert [note.data for note in upserts] == [{"text": "a"}, {"text": "b"}]
+    assert (result.scanned, result.upserts) == (3, 2)
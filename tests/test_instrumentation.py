@@ -0,0 +1,154 @@
+import pytest
+from unittest.mock import AsyncMock
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from aioresponses import aioresponses
+
+from avoma import AvomaClient, MetricsCollector, RequestHooks, RetryPolicy
+from avoma.instrumentation import Histogram, endpoint_template
+
+MEETING_UUID = "123e4567-e89b-12d3-a456-426614174000"
+TEMPLATES_URL = "https://api.avoma.com/v1/template/"
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.calls = []
+
+    def on_request_start(self, event):
+        self.calls.append(("start", event.request_id, event.attempt))
+
+    def on_response(self, event):
+        self.calls.append(("response", event.status, event.bytes_received))
+
+    def on_retry(self, event):
+        self.calls.append(("retry", event.status, event.retry_delay))
+
+    def on_error(self, event):
+        self.calls.append(("error", type(event.error).__name__))
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr("avoma.client.asyncio.sleep", sleep)
+    return sleep
+
+
+def test_endpoint_template():
+    assert endpoint_template(f"/meetings/{MEETING_UUID}/insights/") == (
+        "meetings/{uuid}/insights"
+    )
+    assert endpoint_template("template") == "template"
+    assert endpoint_template("/users/42/") == "users/{id}"
+
+
+def test_histogram_percentiles():
+    histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 0.5, 1.5, 3.0):
+        histogram.observe(value)
+
+    assert histogram.cumulative() == [(1.0, 2), (2.0, 3), (4.0, 4), (float("inf"), 4)]
+    assert histogram.percentile(50) == pytest.approx(1.0)
+    assert histogram.percentile(75) == pytest.approx(2.0)
+    assert histogram.percentile(100) == pytest.approx(4.0)
+    assert Histogram().percentile(50) is None
+
+
+@pytest.mark.asyncio
+async def test_hooks_receive_request_lifecycle(sleep):
+    hooks = RecordingHooks()
+    client = AvomaClient(
+        "test-api-key",
+        rate_limit=None,
+        retry_policy=RetryPolicy(max_attempts=2, base_delay=1.0, jitter=False),
+        hooks=[hooks],
+    )
+
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, status=503)
+        mocked.get(TEMPLATES_URL, body=b"[]")
+        await client.templates.list()
+
+        mocked.get(TEMPLATES_URL, status=404, body=b"{}")
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client.templates.list()
+
+    await client.close()
+    assert hooks.calls == [
+        ("start", 1, 1),
+        ("retry", 503, 1.0),
+        ("start", 1, 2),
+        ("response", 200, 2),
+        ("start", 2, 1),
+        ("response", 404, 2),
+        ("error", "ClientResponseError"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_hook_does_not_break_requests():
+    class Broken(RequestHooks):
+        def on_response(self, event):
+            raise RuntimeError("boom")
+
+    client = AvomaClient("test-api-key", rate_limit=None, hooks=[Broken()])
+
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, payload=[])
+        assert await client.templates.list() == []
+
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_metrics_collector_aggregates_per_endpoint():
+    metrics = MetricsCollector()
+    client = AvomaClient("test-api-key", rate_limit=None, hooks=[metrics])
+    url = f"https://api.avoma.com/v1/meetings/{MEETING_UUID}/insights/"
+
+    with aioresponses() as mocked:
+        mocked.get(url, body=b"{}", repeat=True)
+        for _ in range(3):
+            # Sequential requests aren't coalesced
+            await client._request("GET", f"meetings/{MEETING_UUID}/insights", raw=True)
+
+    await client.close()
+    key = ("GET", "meetings/{uuid}/insights")
+    assert metrics.responses[key + (200,)] == 3
+    assert metrics.bytes_received[key] == 6
+    summary = metrics.summary()["GET meetings/{uuid}/insights"]
+    assert summary["count"] == 3
+    assert summary["p50"] is not None and summary["p99"] >= summary["p50"]
+
+
+@pytest.mark.asyncio
+async def test_trace_timings_are_recorded():
+    async def templates(request):
+        return web.json_response([])
+
+    app = web.Application()
+    app.router.add_get("/v1/template/", templates)
+    events = []
+
+    class Capture(RequestHooks):
+        def on_response(self, event):
+            events.append((event.connect, event.ttfb, event.elapsed))
+
+    async with TestServer(app) as server:
+        client = AvomaClient(
+            "test-api-key",
+            base_url=str(server.make_url("/v1")),
+            rate_limit=None,
+            hooks=[Capture()],
+        )
+        await client.templates.list()
+        await client.templates.list()
+        await client.close()
+
+    (connect, ttfb, elapsed), (reused, _, _) = events
+    assert 0 <= connect <= ttfb <= elapsed
+    # The second request reuses the kept-alive connection
+    assert reused is None
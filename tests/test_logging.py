@@ -0,0 +1,108 @@
+import logging
+import threading
+import time
+import pytest
+
+from aioresponses import aioresponses
+
+from avoma import AvomaClient
+from avoma.logging import DroppingQueueHandler, Truncated, create_logger
+
+TEMPLATES_URL = "https://api.avoma.com/v1/template/"
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_truncated_is_lazy_and_bounded():
+    assert str(Truncated({"a": 1})) == "{'a': 1}"
+    assert str(Truncated(b'{"a": 1}')) == '{"a": 1}'
+    assert str(Truncated("x" * 20, limit=5)) == "xxxxx... (20 total)"
+    assert str(Truncated(b"x" * 20, limit=5)) == "xxxxx... (20 total)"
+
+
+@pytest.mark.asyncio
+async def test_request_skips_payload_formatting_above_debug(monkeypatch):
+    def explode(self):
+        raise AssertionError("payload was formatted")
+
+    monkeypatch.setattr(Truncated, "__str__", explode)
+    client = AvomaClient("test-api-key", logger_name="avoma.test.info")
+    handler = RecordingHandler()
+    client.logger.addHandler(handler)
+
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL + "?page_size=10", payload=[])
+        await client._request(
+            "GET", "template", params={"page_size": 10}, json={"a": 1}
+        )
+
+    await client.close()
+    assert handler.records == []
+
+
+@pytest.mark.asyncio
+async def test_request_truncates_logged_bodies():
+    client = AvomaClient(
+        "test-api-key", log_level=logging.DEBUG, logger_name="avoma.test.debug"
+    )
+    handler = RecordingHandler()
+    client.logger.addHandler(handler)
+
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, body=b"[" + b'"x",' * 1000 + b'"x"]')
+        await client._request("GET", "template", raw=True)
+
+    await client.close()
+    (message,) = [
+        r.getMessage() for r in handler.records if r.msg.startswith("Response")
+    ]
+    assert message.endswith("... (4005 total)")
+
+
+class BlockedHandler(RecordingHandler):
+    def __init__(self):
+        super().__init__()
+        self.unblock = threading.Event()
+
+    def emit(self, record):
+        self.unblock.wait(5)
+        super().emit(record)
+
+
+def test_queued_logger_does_not_block_and_counts_drops():
+    target = BlockedHandler()
+    logger = create_logger("avoma.test.queue", handler=target, queue_size=2)
+    (handler,) = logger.handlers
+    assert isinstance(handler, DroppingQueueHandler)
+
+    started = time.monotonic()
+    for n in range(10):
+        logger.info("message %s", n)
+    assert time.monotonic() - started < 1
+
+    # One record is held by the listener thread, two wait in the queue
+    assert 7 <= handler.dropped <= 8
+    target.unblock.set()
+    logger.removeHandler(handler)
+    handler.close()
+    assert [r.getMessage() for r in target.records][:2] == ["message 0", "message 1"]
+    assert len(target.records) + handler.dropped == 10
+
+
+def test_client_log_queue_option():
+    client = AvomaClient(
+        "test-api-key", logger_name="avoma.test.client_queue", log_queue_size=100
+    )
+
+    (handler,) = client.logger.handlers
+    assert isinstance(handler, DroppingQueueHandler)
+    assert handler.queue.maxsize == 100
+    client.logger.removeHandler(handler)
+    handler.close()
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from uuid import UUID
@@ -115,6 +116,7 @@ async def test_list_meetings():
             "to_date": to_date,
             "page_size": 100,  # Default page size should be included
         },
+        raw=True,
     )
 
     # Verify first page response
@@ -146,6 +148,7 @@ async def test_list_meetings():
                 "to_date": to_date,
                 "page_size": 100,
             },
+            raw=True,
         ),
         call(
             "GET",
@@ -156,6 +159,7 @@ async def test_list_meetings():
                 "page_size": 100,
                 "page": 2,
             },
+            raw=True,
         ),
         call(
             "GET",
@@ -166,6 +170,7 @@ async def test_list_meetings():
                 "page_size": 100,
                 "page": 3,
             },
+            raw=True,
         ),
     ]
 
@@ -202,6 +207,7 @@ async def test_list_meetings():
                 "page_size": 100,
                 "page": 2,
             },
+            raw=True,
         ),
         call(
             "GET",
@@ -212,6 +218,7 @@ async def test_list_meetings():
                 "page_size": 100,
                 "page": 3,
             },
+            raw=True,
         ),
     ]
 
@@ -252,7 +259,7 @@ async def test_get_meeting():
     meeting = await client.meetings.get(UUID(meeting_uuid))
 
     # Verify the request was made with correct path
-    client._request.assert_called_once_with("GET", f"meetings/{meeting_uuid}")
+    client._request.assert_called_once_with("GET", f"meetings/{meeting_uuid}", raw=True)
 
     # Verify response
     assert meeting.uuid == UUID(meeting_uuid)
@@ -293,7 +300,9 @@ async def test_get_meeting_insights():
     insights = await client.meetings.get_insights(UUID(meeting_uuid))
 
     # Verify the request was made with correct path
-    client._request.assert_called_once_with("GET", f"meetings/{meeting_uuid}/insights")
+    client._request.assert_called_once_with(
+        "GET", f"meetings/{meeting_uuid}/insights", raw=True
+    )
 
     # Verify response
     assert len(insights.ai_notes) == 1
@@ -326,3 +335,144 @@ async def test_get_meeting_sentiments():
     assert sentiments.sentiment == 1
     assert len(sentiments.sentiment_ranges) == 1
     assert sentiments.sentiment_ranges[0].score == 0.8
+
+
+def meeting_page(page, pages, count=None):
+    """Build a page of meetings with one meeting per page."""
+    return {
+        "count": count if count is not None else pages,
+        "next": (
+            f"https://api.avoma.com/v1/meetings/?page={page + 1}"
+            if page < pages
+            else None
+        ),
+        "previous": (
+            f"https://api.avoma.com/v1/meetings/?page={page - 1}" if page > 1 else None
+        ),
+        "results": [
+            {
+                "uuid": f"{page:08d}-e89b-12d3-a456-426614174000",
+                "subject": f"Test Meeting {page}",
+                "created": "2024-02-14T12:00:00Z",
+                "modified": "2024-02-14T12:00:00Z",
+                "is_private": False,
+                "is_internal": True,
+                "organizer_email": "test@example.com",
+                "state": "completed",
+                "attendees": [],
+                "audio_ready": True,
+                "video_ready": True,
+                "is_call": False,
+                "notes_ready": True,
+                "transcript_ready": True,
+            }
+        ],
+    }
+
+
+@pytest.mark.asyncio
+async def test_iter_meetings():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(side_effect=[meeting_page(n, 3) for n in (1, 2, 3)])
+
+    meetings = client.meetings.iter(
+        from_date="2024-02-14T00:00:00Z", to_date="2024-02-14T23:59:59Z"
+    )
+
+    # Pages are only fetched as the iterator is consumed
+    first = await anext(meetings)
+    assert first.subject == "Test Meeting 1"
+    assert client._request.call_count == 1
+
+    rest = [meeting.subject async for meeting in meetings]
+    assert rest == ["Test Meeting 2", "Test Meeting 3"]
+    assert client._request.call_count == 3
+    assert client._request.call_args.kwargs["params"]["page"] == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_meeting_pages_with_range():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(side_effect=[meeting_page(n, 5) for n in (2, 3)])
+
+    pages = [
+        page
+        async for page in client.meetings.iter_pages(
+            from_date="2024-02-14T00:00:00Z",
+            to_date="2024-02-14T23:59:59Z",
+            page_size=1,
+            from_page=2,
+            to_page=3,
+        )
+    ]
+
+    assert [page.results[0].subject for page in pages] == [
+        "Test Meeting 2",
+        "Test Meeting 3",
+    ]
+    assert [c.kwargs["params"]["page"] for c in client._request.call_args_list] == [
+        2,
+        3,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_list_meetings_concurrently():
+    pages = {n: meeting_page(n, 5) for n in range(1, 6)}
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_request(method, path, params, raw=False):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        page = params.get("page", 1)
+        # Later pages complete first to check that order is preserved
+        await asyncio.sleep(0.001 * (6 - page))
+        in_flight -= 1
+        return pages[page]
+
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(side_effect=fake_request)
+
+    meetings = await client.meetings.list(
+        from_date="2024-02-14T00:00:00Z",
+        to_date="2024-02-14T23:59:59Z",
+        page_size=1,
+        follow_pagination=True,
+        concurrency=3,
+    )
+
+    assert [m.subject for m in meetings.results] == [
+        f"Test Meeting {n}" for n in range(1, 6)
+    ]
+    assert meetings.count == 5
+    assert meetings.next is None
+    assert client._request.call_count == 5
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_iter_meeting_pages_concurrently_respects_to_page():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(
+        side_effect=lambda method, path, params, raw=False: meeting_page(
+            params.get("page", 1), 10
+        )
+    )
+
+    pages = [
+        page
+        async for page in client.meetings.iter_pages(
+            from_date="2024-02-14T00:00:00Z",
+            to_date="2024-02-14T23:59:59Z",
+            page_size=1,
+            to_page=4,
+            concurrency=8,
+        )
+    ]
+
+    assert [page.results[0].subject for page in pages] == [
+        f"Test Meeting {n}" for n in range(1, 5)
+    ]
+    assert client._request.call_count == 4
@@ -0,0 +1,244 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+
+from avoma import AvomaClient
+from avoma.incremental import IncrementalSync, MemoryWatermarkStore
+from avoma.mirror import SQLiteMirror
+from avoma.models.calls import Call
+from avoma.models.meetings import Meeting, MeetingInsights
+from avoma.models.notes import Note
+from avoma.models.transcriptions import Transcription
+
+MEETING_UUID = "123e4567-e89b-12d3-a456-426614174000"
+TRANSCRIPTION_UUID = "123e4567-e89b-12d3-a456-426614174001"
+
+MEETING = {
+    "uuid": MEETING_UUID,
+    "subject": "Test Meeting",
+    "created": "2024-02-14T12:00:00Z",
+    "modified": "2024-02-14T12:00:00Z",
+    "start_at": "2024-02-14T13:00:00Z",
+    "is_private": False,
+    "is_internal": True,
+    "organizer_email": "organizer@example.com",
+    "state": "completed",
+    "attendees": [
+        {
+            "email": "attendee@example.com",
+            "name": "Attendee",
+            "response_status": "accepted",
+            "uuid": "123e4567-e89b-12d3-a456-426614174005",
+        }
+    ],
+    "audio_ready": True,
+    "video_ready": True,
+    "is_call": False,
+    "notes_ready": True,
+    "transcript_ready": True,
+    "transcription_uuid": TRANSCRIPTION_UUID,
+}
+
+TRANSCRIPTION = {
+    "uuid": TRANSCRIPTION_UUID,
+    "transcript": [
+        {"transcript": "Hello there", "timestamps": [0.5, 1.0], "speaker_id": 1},
+        {"transcript": "Hi", "timestamps": [2.0], "speaker_id": 2},
+    ],
+    "speakers": [
+        {"email": "rep@example.com", "id": 1, "is_rep": True, "name": "Rep"},
+        {"email": "lead@example.com", "id": 2, "is_rep": False},
+    ],
+    "transcription_vtt_url": "https://example.com/transcript.vtt",
+}
+
+INSIGHTS = {
+    "ai_notes": [
+        {
+            "note_type": "action_item",
+            "uuid": "123e4567-e89b-12d3-a456-426614174002",
+            "start": 10.5,
+            "end": 15.2,
+            "text": "Schedule follow-up meeting",
+            "speaker_id": 1,
+        }
+    ],
+    "keywords": {"popular": ["pricing"]},
+    "speakers": [
+        {"email": "speaker@example.com", "id": 1, "is_rep": True, "name": "Speaker"}
+    ],
+}
+
+
+CALL = {
+    "uuid": "123e4567-e89b-12d3-a456-426614174003",
+    "title": "Weekly Team Sync",
+    "created": "2024-02-14T12:00:00Z",
+    "modified": "2024-02-14T12:00:00Z",
+    "scheduled_start": "2024-02-14T15:00:00Z",
+    "scheduled_duration": 30,
+    "status": {"state": "scheduled"},
+    "participants": [],
+    "host": {
+        "uuid": "123e4567-e89b-12d3-a456-426614174004",
+        "email": "host@example.com",
+        "name": "Meeting Host",
+        "role": "host",
+    },
+    "recording_available": False,
+    "transcription_available": False,
+}
+
+NOTE = {
+    "created": "2024-02-14T12:00:00Z",
+    "modified": "2024-02-14T12:30:00Z",
+    "data": {"summary": "Discussed pricing"},
+}
+
+
+@pytest.fixture
+def mirror():
+    with SQLiteMirror() as mirror:
+        yield mirror
+
+
+def test_meetings_round_trip_and_queries(mirror):
+    meeting = Meeting.model_validate(MEETING)
+    assert mirror.save_meetings([meeting]) == 1
+    # Saving again replaces the stored copy
+    mirror.save("meetings", meeting)
+
+    assert mirror.get_meeting(MEETING_UUID) == meeting
+    assert mirror.meetings(organizer_email="organizer@example.com") == [meeting]
+    assert mirror.meetings(attendee_email="attendee@example.com") == [meeting]
+    assert mirror.meetings(from_date=datetime(2024, 2, 15, tzinfo=timezone.utc)) == []
+    (count,) = mirror.connection.execute("SELECT COUNT(*) FROM attendees").fetchone()
+    assert count == 1
+
+
+def test_meeting_times_are_compared_in_utc(mirror):
+    # 15:00 UTC, later than 14:00 UTC although "10:00-05:00" sorts before it
+    meeting = Meeting.model_validate(
+        {**MEETING, "start_at": "2024-02-14T10:00:00-05:00"}
+    )
+    mirror.save_meetings([meeting])
+    paris = timezone(timedelta(hours=1))
+
+    assert mirror.meetings(to_date=datetime(2024, 2, 14, 14, tzinfo=timezone.utc)) == []
+    assert mirror.meetings(from_date=datetime(2024, 2, 14, 15, 30, tzinfo=paris)) == [
+        meeting
+    ]
+
+
+def test_transcription_and_insights_round_trip(mirror):
+    transcription = Transcription.model_validate(TRANSCRIPTION)
+    insights = MeetingInsights.model_validate(INSIGHTS)
+
+    mirror.save_transcription(transcription)
+    mirror.save_insights(MEETING_UUID, insights)
+
+    assert mirror.get_transcription(TRANSCRIPTION_UUID) == transcription
+    assert mirror.get_insights(MEETING_UUID) == insights
+    assert mirror.connection.execute(
+        "SELECT text FROM ai_notes WHERE note_type = 'action_item'"
+    ).fetchall() == [("Schedule follow-up meeting",)]
+
+
+def test_notes_round_trip(mirror):
+    note = Note(
+        created="2024-02-14T12:00:00Z",
+        modified="2024-02-14T12:30:00Z",
+        data={"summary": "Discussed pricing"},
+    )
+
+    mirror.save_notes([note], meeting_uuid=MEETING_UUID)
+    mirror.save_notes([note], meeting_uuid=MEETING_UUID)
+
+    assert mirror.notes(MEETING_UUID) == [note]
+    assert mirror.notes("other") == []
+
+
+def test_notes_created_at_the_same_time_are_kept_apart(mirror):
+    notes = [
+        Note(created=NOTE["created"], modified=NOTE["modified"], data={"n": n})
+        for n in (1, 2)
+    ]
+    for note in notes + notes:
+        mirror.save("notes", note)
+
+    assert sorted(note.data["n"] for note in mirror.notes()) == [1, 2]
+
+
+def test_stale_records_are_not_served():
+    now = 1000.0
+    with SQLiteMirror(max_age=60, clock=lambda: now) as mirror:
+        mirror.save_meetings([Meeting.model_validate(MEETING)])
+        assert mirror.get_meeting(MEETING_UUID) is not None
+
+        now += 61
+        assert mirror.get_meeting(MEETING_UUID) is None
+        assert mirror.get_meeting(MEETING_UUID, max_age=3600) is not None
+
+
+def test_meetings_expire_by_default_but_transcriptions_dont():
+    now = 1000.0
+    with SQLiteMirror(clock=lambda: now) as mirror:
+        mirror.save_meetings([Meeting.model_validate(MEETING)])
+        mirror.save_insights(MEETING_UUID, MeetingInsights.model_validate(INSIGHTS))
+        mirror.save_transcription(Transcription.model_validate(TRANSCRIPTION))
+
+        now += 301
+        assert mirror.get_meeting(MEETING_UUID) is None
+        assert mirror.get_insights(MEETING_UUID) is None
+        assert mirror.get_transcription(TRANSCRIPTION_UUID) is not None
+
+
+@pytest.mark.asyncio
+async def test_client_reads_through_mirror(mirror):
+    client = AvomaClient("test-api-key", mirror=mirror)
+    client._request = AsyncMock(side_effect=[MEETING, TRANSCRIPTION, INSIGHTS])
+
+    for _ in range(2):
+        meeting = await client.meetings.get(MEETING_UUID)
+        transcription = await client.transcriptions.get(TRANSCRIPTION_UUID)
+        insights = await client.meetings.get_insights(MEETING_UUID)
+
+    assert client._request.call_count == 3
+    assert meeting.subject == "Test Meeting"
+    assert len(transcription.transcript) == 2
+    assert insights.ai_notes[0].speaker_id == 1
+
+    compact = await client.transcriptions.get(TRANSCRIPTION_UUID, compact=True)
+    assert [segment.transcript for segment in compact] == ["Hello there", "Hi"]
+
+
+def test_calls_round_trip(mirror):
+    call = Call.model_validate(CALL)
+    assert mirror.save_calls([call, call]) == 2
+
+    assert mirror.get_call(call.uuid) == call
+    assert mirror.get_call(MEETING_UUID) is None
+
+
+@pytest.mark.asyncio
+async def test_mirror_as_incremental_sync_sink(mirror):
+    client = AvomaClient("test-api-key")
+    results = {"meetings": MEETING, "notes": NOTE, "calls": CALL}
+
+    async def request(method, path, params=None, raw=False):
+        page = {"count": 1, "next": None, "previous": None}
+        return {**page, "results": [results[path.strip("/")]]}
+
+    client._request = request
+    sync = IncrementalSync(client, MemoryWatermarkStore(), mirror.save)
+    now = datetime(2024, 2, 15, tzinfo=timezone.utc)
+    synced = await sync.sync_all(now=now)
+
+    assert {resource: result.upserts for resource, result in synced.items()} == {
+        "meetings": 1,
+        "notes": 1,
+        "calls": 1,
+    }
+    assert [m.subject for m in mirror.meetings()] == ["Test Meeting"]
+    assert mirror.notes() == [Note.model_validate(NOTE)]
+    assert mirror.get_call(CALL["uuid"]).title == "Weekly Team Sync"
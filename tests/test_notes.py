@@ -47,6 +47,7 @@ async def test_list_notes_json():
         "GET",
         "notes",
         params={"from_date": from_date, "to_date": to_date, "output_format": "json"},
+        raw=True,
     )
 
     # Verify response
@@ -94,6 +95,7 @@ async def test_list_notes_markdown():
             "to_date": to_date,
             "output_format": output_format,
         },
+        raw=True,
     )
 
     # Verify response
@@ -142,6 +144,7 @@ async def test_list_notes_by_meeting():
             "meeting_uuid": str(meeting_id),
             "output_format": "json",
         },
+        raw=True,
     )
 
     # Verify response
@@ -187,6 +190,7 @@ async def test_list_notes_by_category():
             "custom_category": str(category_id),
             "output_format": "json",
         },
+        raw=True,
     )
 
     # Verify response
@@ -0,0 +1,153 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from avoma import AvomaClient, Paginator
+from avoma.models.users import UsersList
+
+
+def users_page(page, pages, page_size=2):
+    """Build a page of users."""
+    return {
+        "count": pages * page_size,
+        "next": (
+            f"https://api.avoma.com/v1/users/?page={page + 1}" if page < pages else None
+        ),
+        "previous": None,
+        "results": [
+            {
+                "uuid": f"{page:08d}-e89b-12d3-a456-{n:012d}",
+                "email": f"user{page}.{n}@example.com",
+                "first_name": "Test",
+                "last_name": f"User {page}.{n}",
+                "created": "2024-02-14T12:00:00Z",
+                "modified": "2024-02-14T12:00:00Z",
+                "role": {
+                    "uuid": "123e4567-e89b-12d3-a456-426614174001",
+                    "name": "User",
+                    "permissions": ["read"],
+                },
+                "is_active": True,
+            }
+            for n in range(page_size)
+        ],
+    }
+
+
+def mock_pages(client, pages, page_size=2):
+    client._request = AsyncMock(
+        side_effect=lambda method, path, params, raw=False: users_page(
+            params.get("page", 1), pages, page_size
+        )
+    )
+    return client._request
+
+
+@pytest.mark.asyncio
+async def test_paginator_follows_next():
+    client = AvomaClient("test-api-key")
+    request = mock_pages(client, 3)
+
+    emails = [user.email async for user in client.users.paginate(page_size=2)]
+
+    assert len(emails) == 6
+    assert emails[0] == "user1.0@example.com"
+    assert emails[-1] == "user3.1@example.com"
+    assert [c.kwargs["params"] for c in request.call_args_list] == [
+        {"page_size": 2},
+        {"page_size": 2, "page": 2},
+        {"page_size": 2, "page": 3},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_paginator_page_range_and_collect():
+    client = AvomaClient("test-api-key")
+    request = mock_pages(client, 5)
+
+    users = await client.users.paginate(from_page=2, to_page=4).collect()
+
+    assert isinstance(users, UsersList)
+    assert users.count == 10
+    assert users.next is None
+    assert [u.email for u in users.results][::2] == [
+        "user2.0@example.com",
+        "user3.0@example.com",
+        "user4.0@example.com",
+    ]
+    assert request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_paginator_prefetches_next_page():
+    client = AvomaClient("test-api-key")
+    request = mock_pages(client, 3)
+
+    pages = client.users.paginate(prefetch=True).pages()
+    await anext(pages)
+    # Let the prefetch task run while the first page is "being consumed"
+    await asyncio.sleep(0)
+    assert request.call_count == 2
+
+    rest = [page async for page in pages]
+    assert len(rest) == 2
+    assert request.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_paginator_concurrent_pages_in_order():
+    client = AvomaClient("test-api-key")
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fake_request(method, path, params, raw=False):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        page = params.get("page", 1)
+        await asyncio.sleep(0.001 * (10 - page))
+        in_flight -= 1
+        return users_page(page, 6)
+
+    client._request = AsyncMock(side_effect=fake_request)
+
+    paginator = Paginator(
+        client, "/users", UsersList, params={"page_size": 2}, concurrency=4
+    )
+    pages = [page async for page in paginator.pages()]
+
+    assert [p.results[0].email for p in pages] == [
+        f"user{n}.0@example.com" for n in range(1, 7)
+    ]
+    assert max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_paginator_cancels_pending_pages_on_close():
+    client = AvomaClient("test-api-key")
+    mock_pages(client, 10)
+
+    pages = client.users.paginate(concurrency=3).pages()
+    await anext(pages)
+    await pages.aclose()
+
+    await asyncio.sleep(0)
+    pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+    assert all(t.cancelled() or t.done() for t in pending)
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_expose_paginators():
+    client = AvomaClient("test-api-key")
+
+    calls = client.calls.paginate(from_date="2024-02-14", to_date="2024-02-15")
+    notes = client.notes.paginate(from_date="2024-02-14", to_date="2024-02-15")
+    sentiments = client.sentiments.paginate(status="completed")
+
+    assert (calls.path, calls.params) == (
+        "/calls",
+        {"from_date": "2024-02-14", "to_date": "2024-02-15"},
+    )
+    assert notes.path == "notes"
+    assert notes.params["output_format"] == "json"
+    assert sentiments.path == "/sentiments"
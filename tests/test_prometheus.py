@@ -0,0 +1,74 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from aioresponses import aioresponses
+
+from avoma import AvomaClient, RetryPolicy
+from avoma.prometheus import CONTENT_TYPE, metrics_handler, render
+
+TEMPLATES_URL = "https://api.avoma.com/v1/template/"
+
+
+@pytest.fixture
+async def client(monkeypatch):
+    monkeypatch.setattr("avoma.client.asyncio.sleep", AsyncMock())
+    client = AvomaClient(
+        "test-api-key",
+        retry_policy=RetryPolicy(jitter=False),
+        rate_limit=None,
+        collect_metrics=True,
+    )
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, status=429)
+        mocked.get(TEMPLATES_URL, body=b"[]")
+        await client.templates.list()
+    yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_render_prometheus_text(client):
+    text = render(client.metrics)
+    lines = text.splitlines()
+
+    assert "# TYPE avoma_requests_total counter" in lines
+    assert 'avoma_requests_total{method="GET",endpoint="template",status="200"} 1' in (
+        lines
+    )
+    assert (
+        'avoma_request_retries_total{method="GET",endpoint="template",reason="429"} 1'
+        in lines
+    )
+    assert (
+        'avoma_rate_limited_responses_total{method="GET",endpoint="template"} 1'
+        in lines
+    )
+    assert 'avoma_response_bytes_total{method="GET",endpoint="template"} 2' in lines
+    assert (
+        'avoma_request_duration_seconds_bucket{method="GET",endpoint="template",'
+        'le="+Inf"} 1' in lines
+    )
+    assert "avoma_rate_limiter_wait_seconds_count 2" in lines
+    assert 'avoma_validation_duration_seconds_count{model="List[Template]"} 1' in lines
+    assert text.endswith("\n")
+
+
+def test_render_escapes_label_values():
+    client = AvomaClient("test-api-key", collect_metrics=True)
+    client.metrics.errors[("GET", 'a"b\\c', "Error")] += 1
+
+    assert 'endpoint="a\\"b\\\\c"' in render(client.metrics, namespace="test")
+
+
+@pytest.mark.asyncio
+async def test_metrics_handler(client):
+    app = web.Application()
+    app.router.add_get("/metrics", metrics_handler(client.metrics))
+
+    async with TestClient(TestServer(app)) as http:
+        response = await http.get("/metrics")
+        assert response.status == 200
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        assert "avoma_requests_total" in await response.text()
@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from aioresponses import aioresponses
+
+from avoma import AvomaClient, TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_reserve():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=2, clock=clock)
+
+    # A full bucket serves the burst without waiting
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+
+    # Further reservations queue up behind each other
+    assert bucket.reserve() == pytest.approx(1.0)
+    assert bucket.reserve() == pytest.approx(2.0)
+    assert bucket.tokens == pytest.approx(-2.0)
+    assert bucket.throttled == 2
+    assert bucket.total_wait == pytest.approx(3.0)
+    assert bucket.max_wait == pytest.approx(2.0)
+
+    # Tokens refill over time but never above capacity
+    clock.now = 10.0
+    assert bucket.tokens == pytest.approx(2.0)
+    assert bucket.wait_time == 0
+
+
+def test_token_bucket_per_minute():
+    bucket = TokenBucket.per_minute(60)
+    assert bucket.rate == pytest.approx(1.0)
+    assert bucket.capacity == 1
+
+    with pytest.raises(ValueError):
+        bucket.reserve(2)
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_acquire(monkeypatch):
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=1, clock=clock)
+    sleep = AsyncMock()
+    monkeypatch.setattr("avoma.ratelimit.asyncio.sleep", sleep)
+
+    waits = await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+
+    assert waits == pytest.approx([0.0, 0.5, 1.0, 1.5])
+    assert sleep.await_count == 3
+    assert bucket.acquired == 4
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_cancel_returns_tokens():
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    await bucket.acquire()
+
+    task = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert bucket.tokens > -0.5
+    assert bucket.acquired == 1
+
+
+@pytest.mark.asyncio
+async def test_client_requests_go_through_rate_limiter():
+    bucket = TokenBucket(rate=1000.0, capacity=5)
+    client = AvomaClient("test-api-key", rate_limiter=bucket, coalesce_requests=False)
+
+    with aioresponses() as mocked:
+        mocked.get("https://api.avoma.com/v1/template/", payload=[], repeat=True)
+        await asyncio.gather(*(client.templates.list() for _ in range(3)))
+
+    await client.close()
+    assert bucket.acquired == 3
+
+
+def test_client_rate_limit_configuration():
+    client = AvomaClient("test-api-key")
+    assert client.rate_limiter.rate == pytest.approx(1.0)
+
+    client = AvomaClient("test-api-key", rate_limit=None)
+    assert client.rate_limiter is None
@@ -0,0 +1,252 @@
+import asyncio
+import json
+import pytest
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from avoma import AvomaClient
+from avoma.mirror import SQLiteMirror
+from avoma.models.meetings import Meeting
+from avoma.readiness import ReadinessWaiter
+
+START = datetime(2024, 1, 1, 9, tzinfo=timezone.utc)
+
+
+def make_uuid(n):
+    return UUID(f"{n:08x}-e89b-12d3-a456-426614174000")
+
+
+def make_meeting(n, start_at, ready):
+    return {
+        "uuid": str(make_uuid(n)),
+        "subject": f"Meeting {n}",
+        "created": "2024-01-01T00:00:00Z",
+        "modified": "2024-01-01T00:00:00Z",
+        "start_at": start_at.isoformat(),
+        "is_private": False,
+        "is_internal": True,
+        "organizer_email": "test@example.com",
+        "state": "completed",
+        "attendees": [],
+        "audio_ready": ready,
+        "video_ready": ready,
+        "is_call": False,
+        "notes_ready": ready,
+        "transcript_ready": ready,
+    }
+
+
+class FakeAPI:
+    """Meetings that become ready after a number of polls."""
+
+    def __init__(self, client, meetings):
+        # n -> (start_at, polls until ready)
+        self.meetings = meetings
+        self.polls = {n: 0 for n in meetings}
+        self.requests = []
+        client._request = self.request
+
+    def record(self, n):
+        start_at, ready_after = self.meetings[n]
+        self.polls[n] += 1
+        return make_meeting(n, start_at, self.polls[n] > ready_after)
+
+    async def request(self, method, path, params=None, raw=False):
+        self.requests.append(path)
+        if path != "meetings":
+            n = int(path.split("/")[1][:8], 16)
+            return json.dumps(self.record(n))
+        lower = datetime.fromisoformat(params["from_date"])
+        upper = datetime.fromisoformat(params["to_date"])
+        matching = sorted(
+            n
+            for n, (start_at, _) in self.meetings.items()
+            if lower <= start_at <= upper
+        )
+        size = params["page_size"]
+        page = params.get("page", 1)
+        results = matching[(page - 1) * size : page * size]
+        return json.dumps(
+            {
+                "count": len(matching),
+                "next": "next" if page * size < len(matching) else None,
+                "previous": None,
+                "results": [self.record(n) for n in results],
+            }
+        )
+
+
+@pytest.fixture
+def client():
+    return AvomaClient("test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_waits_with_batched_list_requests(client):
+    api = FakeAPI(
+        client,
+        {
+            1: (START, 0),
+            2: (START + timedelta(minutes=30), 1),
+            3: (START + timedelta(hours=2), 2),
+        },
+    )
+    waiter = ReadinessWaiter(client, interval=0.01, backoff=1)
+    futures = waiter.wait_until_ready([make_uuid(1), make_uuid(2), str(make_uuid(3))])
+    meetings = await asyncio.wait_for(asyncio.gather(*futures.values()), 1)
+
+    assert [meeting.uuid for meeting in meetings] == [make_uuid(n) for n in (1, 2, 3)]
+    assert all(meeting.transcript_ready for meeting in meetings)
+    # Start times are looked up once, then meetings 2 and 3 share a list request
+    assert sorted(api.requests[:3]) == [f"meetings/{make_uuid(n)}" for n in (1, 2, 3)]
+    assert api.requests[3:] == ["meetings", f"meetings/{make_uuid(3)}"]
+    assert len(waiter) == 0
+
+
+@pytest.mark.asyncio
+async def test_resolves_ready_meetings_without_requests(client):
+    api = FakeAPI(client, {})
+    meeting = Meeting.model_validate(make_meeting(1, START, True))
+    waiter = ReadinessWaiter(client)
+    futures = waiter.wait_until_ready([meeting])
+
+    assert await futures[meeting.uuid] is meeting
+    assert api.requests == []
+
+
+@pytest.mark.asyncio
+async def test_far_apart_meetings_are_polled_separately(client):
+    api = FakeAPI(
+        client,
+        {
+            1: (START, 0),
+            2: (START + timedelta(minutes=10), 0),
+            3: (START + timedelta(days=30), 0),
+        },
+    )
+    meetings = [
+        Meeting.model_validate(make_meeting(n, start_at, False))
+        for n, (start_at, _) in api.meetings.items()
+    ]
+    waiter = ReadinessWaiter(client, interval=0.01)
+    futures = waiter.wait_until_ready(meetings, flags=["transcript_ready"])
+    await asyncio.wait_for(asyncio.gather(*futures.values()), 1)
+
+    assert sorted(api.requests) == ["meetings", f"meetings/{make_uuid(3)}"]
+
+
+@pytest.mark.asyncio
+async def test_crowded_window_falls_back_to_single_requests(client):
+    meetings = {n: (START + timedelta(seconds=n), 100) for n in range(250)}
+    meetings[1] = (START + timedelta(seconds=1), 0)
+    meetings[2] = (START + timedelta(seconds=2), 1)
+    api = FakeAPI(client, meetings)
+    waiter = ReadinessWaiter(client, interval=0.01)
+    futures = waiter.wait_until_ready(
+        [
+            Meeting.model_validate(make_meeting(n, START + timedelta(seconds=n), False))
+            for n in (1, 2)
+        ]
+    )
+    await asyncio.wait_for(asyncio.gather(*futures.values()), 1)
+
+    # The first page holds both meetings: only meeting 2 is polled again, alone
+    assert api.requests == ["meetings", f"meetings/{make_uuid(2)}"]
+
+
+@pytest.mark.asyncio
+async def test_timeout(client):
+    FakeAPI(client, {1: (START, 100)})
+    waiter = ReadinessWaiter(client, interval=0.01)
+    futures = waiter.wait_until_ready([make_uuid(1)], timeout=0.05)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await futures[make_uuid(1)]
+    assert len(waiter) == 0
+
+
+@pytest.mark.asyncio
+async def test_backoff(client):
+    api = FakeAPI(client, {1: (START, 100)})
+    waiter = ReadinessWaiter(client, interval=0.01, backoff=3, max_interval=0.1)
+    futures = waiter.wait_until_ready([make_uuid(1)])
+    await asyncio.sleep(0.3)
+    await waiter.close()
+
+    # Polls at 0, 0.01, 0.04, 0.13, 0.23: without backoff there would be 30
+    assert 4 <= len(api.requests) <= 6
+    assert futures[make_uuid(1)].cancelled()
+
+
+@pytest.mark.asyncio
+async def test_unknown_flags(client):
+    waiter = ReadinessWaiter(client)
+    with pytest.raises(ValueError):
+        waiter.wait_until_ready([make_uuid(1)], flags=["subject"])
+
+
+@pytest.mark.asyncio
+async def test_meetings_api_wait_until_ready(client):
+    FakeAPI(client, {1: (START, 0)})
+    futures = client.meetings.wait_until_ready([make_uuid(1)])
+    meeting = await asyncio.wait_for(futures[make_uuid(1)], 1)
+    assert meeting.audio_ready
+
+
+@pytest.mark.asyncio
+async def test_non_http_poll_errors_are_retried(client):
+    api = FakeAPI(client, {1: (START, 0), 2: (START + timedelta(minutes=1), 0)})
+    request = api.request
+    failures = {"meetings": 1, f"meetings/{make_uuid(1)}": 1}
+
+    async def flaky(method, path, params=None, raw=False):
+        if failures.get(path):
+            failures[path] -= 1
+            raise asyncio.TimeoutError()
+        return await request(method, path, params, raw)
+
+    client._request = flaky
+    waiter = ReadinessWaiter(client, interval=0.01, backoff=1)
+    futures = waiter.wait_until_ready([make_uuid(1)])
+    meeting = await asyncio.wait_for(futures[make_uuid(1)], 1)
+    assert meeting.uuid == make_uuid(1)
+
+    meetings = [
+        Meeting.model_validate(make_meeting(n, start_at, False))
+        for n, (start_at, _) in api.meetings.items()
+    ]
+    futures = waiter.wait_until_ready(meetings)
+    await asyncio.wait_for(asyncio.gather(*futures.values()), 1)
+    assert failures == {"meetings": 0, f"meetings/{make_uuid(1)}": 0}
+
+
+@pytest.mark.asyncio
+async def test_restarts_after_poll_task_died(client):
+    FakeAPI(client, {1: (START, 100), 2: (START, 0)})
+    waiter = ReadinessWaiter(client, interval=0.01)
+    waiter.wait_until_ready([make_uuid(1)])
+    waiter._task.cancel()
+    await asyncio.sleep(0)
+    assert waiter._task.done()
+
+    futures = waiter.wait_until_ready([make_uuid(2)], timeout=1)
+    assert (await futures[make_uuid(2)]).uuid == make_uuid(2)
+
+
+@pytest.mark.asyncio
+async def test_polled_meetings_refresh_the_mirror():
+    client = AvomaClient("test-api-key", mirror=SQLiteMirror())
+    api = FakeAPI(client, {1: (START, 1), 2: (START + timedelta(minutes=10), 0)})
+    stale = await client.meetings.get(make_uuid(1))
+    assert not stale.transcript_ready
+
+    waiter = ReadinessWaiter(client, interval=0.01)
+    other = Meeting.model_validate(make_meeting(2, api.meetings[2][0], False))
+    futures = waiter.wait_until_ready([stale, other])
+    await asyncio.wait_for(asyncio.gather(*futures.values()), 1)
+    assert api.requests == [f"meetings/{make_uuid(1)}", "meetings"]
+
+    # Served from the mirror, which the list poll updated
+    meeting = await client.meetings.get(make_uuid(1))
+    assert meeting.transcript_ready
+    assert len(api.requests) == 2
@@ -32,7 +32,7 @@ async def test_get_recording_by_meeting():
 
     # Verify request
     client._request.assert_called_once_with(
-        "GET", "/recordings", params={"meeting_uuid": str(meeting_id)}
+        "GET", "/recordings", params={"meeting_uuid": str(meeting_id)}, raw=True
     )
 
     # Verify response
@@ -62,7 +62,9 @@ async def test_get_recording():
     recording = await client.recordings.get(recording_id)
 
     # Verify request
-    client._request.assert_called_once_with("GET", f"/recordings/{recording_id}")
+    client._request.assert_called_once_with(
+        "GET", f"/recordings/{recording_id}", raw=True
+    )
 
     # Verify response
     assert recording.uuid == UUID(recording_uuid)
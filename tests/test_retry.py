@@ -0,0 +1,113 @@
+import pytest
+from unittest.mock import AsyncMock
+
+import aiohttp
+from aioresponses import aioresponses
+
+from avoma import AvomaClient, RetryPolicy
+from avoma.retry import parse_retry_after
+
+TEMPLATES_URL = "https://api.avoma.com/v1/template/"
+CALLS_URL = "https://api.avoma.com/v1/calls/"
+
+
+@pytest.fixture
+def sleep(monkeypatch):
+    sleep = AsyncMock()
+    monkeypatch.setattr("avoma.client.asyncio.sleep", sleep)
+    return sleep
+
+
+@pytest.fixture
+async def client():
+    client = AvomaClient(
+        "test-api-key",
+        rate_limit=None,
+        retry_policy=RetryPolicy(max_attempts=3, base_delay=1.0, jitter=False),
+    )
+    yield client
+    await client.close()
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert all(0 <= policy.backoff(3) <= 4.0 for _ in range(20))
+
+
+def test_retry_decisions():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry_status("GET", 503, 1)
+    assert not policy.should_retry_status("GET", 503, 3)
+    assert not policy.should_retry_status("GET", 404, 1)
+
+    # POSTs are only retried when the server did not process them
+    assert policy.should_retry_status("POST", 429, 1)
+    assert not policy.should_retry_status("POST", 503, 1)
+    assert not policy.should_retry_exception(
+        "POST", aiohttp.ServerDisconnectedError(), 1
+    )
+    assert policy.should_retry_exception("GET", aiohttp.ServerDisconnectedError(), 1)
+    assert not policy.should_retry_exception("GET", ValueError(), 1)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+    policy = RetryPolicy(jitter=False)
+    assert policy.delay(1, "7") == 7.0
+    assert policy.delay(1, "soon") == policy.base_delay
+    # A far-off Retry-After doesn't block longer than max_delay
+    assert policy.delay(1, "86400") == policy.max_delay
+
+
+@pytest.mark.asyncio
+async def test_request_retries_transient_errors(client, sleep):
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, status=503)
+        mocked.get(TEMPLATES_URL, status=429, headers={"Retry-After": "3"})
+        mocked.get(TEMPLATES_URL, payload=[])
+
+        templates = await client.templates.list()
+
+    assert templates == []
+    assert [c.args[0] for c in sleep.await_args_list] == [1.0, 3.0]
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_attempts(client, sleep):
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, status=502, repeat=True, payload={})
+
+        with pytest.raises(aiohttp.ClientResponseError) as exc_info:
+            await client.templates.list()
+
+    assert exc_info.value.status == 502
+    assert sleep.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_request_retries_connection_errors(client, sleep):
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, exception=aiohttp.ServerDisconnectedError())
+        mocked.get(TEMPLATES_URL, payload=[])
+
+        assert await client.templates.list() == []
+
+    assert sleep.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_on_server_error(client, sleep):
+    with aioresponses() as mocked:
+        mocked.post(CALLS_URL, status=503, payload={})
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            await client._request("POST", "/calls", json={"subject": "Test"})
+
+    sleep.assert_not_awaited()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import pytest
+from datetime import datetime, timezone
+from uuid import UUID
+
+from avoma import AvomaClient
+from avoma.sentiment_jobs import SentimentJobs
+
+
+def make_uuid(n):
+    return str(UUID(f"{n:08x}-e89b-12d3-a456-426614174000"))
+
+
+def make_sentiment(n, status, updated_at=None):
+    updated_at = updated_at or datetime.now(timezone.utc).isoformat()
+    return {
+        "uuid": make_uuid(1000 + n),
+        "meeting_uuid": make_uuid(n),
+        "sentiment_score": 0.5,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+        "overall_scores": {"positive": 0.5, "neutral": 0.3, "negative": 0.2},
+        "status": status,
+    }
+
+
+class FakeAPI:
+    """Analyses that finish after a number of list polls."""
+
+    def __init__(self, client, finish_after, statuses=None, errors=(), stale=()):
+        self.finish_after = finish_after
+        self.statuses = statuses or {}
+        self.errors = set(errors)
+        # Completed analyses of earlier runs, listed along with the new ones
+        self.stale = [
+            make_sentiment(n, "completed", "2024-02-14T12:00:00Z") for n in stale
+        ]
+        self.polls = 0
+        self.requests = []
+        client._request = self.request
+
+    def status(self, n):
+        if self.polls > self.finish_after.get(n, 0):
+            return self.statuses.get(n, "completed")
+        return "pending"
+
+    async def request(self, method, path, params=None, raw=False):
+        self.requests.append((method, path, params))
+        if method == "POST":
+            n = int(path.split("/")[2][:8], 16)
+            if n in self.errors:
+                raise RuntimeError("analyze failed")
+            return json.dumps(make_sentiment(n, self.status(n)))
+
+        if params["status"] == "completed" and params.get("page", 1) == 1:
+            self.polls += 1
+        matching = [
+            n for n in sorted(self.finish_after) if self.status(n) == params["status"]
+        ]
+        matching = [make_sentiment(n, params["status"]) for n in matching]
+        if params["status"] == "completed":
+            matching = self.stale + matching
+        size = params.get("page_size", 20)
+        page = params.get("page", 1)
+        return json.dumps(
+            {
+                "count": len(matching),
+                "next": "next" if page * size < len(matching) else None,
+                "previous": None,
+                "results": matching[(page - 1) * size : page * size],
+            }
+        )
+
+
+@pytest.fixture
+def client():
+    return AvomaClient("test-api-key")
+
+
+@pytest.mark.asyncio
+async def test_jobs_are_tracked_by_paging(client):
+    # 30 meetings finishing over three polls, two of them failing
+    finish_after = {n: n % 3 for n in range(1, 31)}
+    api = FakeAPI(client, finish_after, statuses={4: "failed", 5: "failed"})
+    jobs = SentimentJobs(client, interval=0, page_size=20)
+
+    assert await jobs.submit([make_uuid(n) for n in finish_after]) == {}
+    assert len(jobs) == 30
+
+    results = [sentiment async for sentiment in jobs.results()]
+
+    assert sorted(s.meeting_uuid for s in results) == sorted(
+        make_uuid(n) for n in finish_after
+    )
+    assert {s.meeting_uuid for s in results if s.status == "failed"} == {
+        make_uuid(4),
+        make_uuid(5),
+    }
+    assert len(jobs) == 0
+    gets = [request for request in api.requests if request[0] == "GET"]
+    # A few pages per poll instead of one request per meeting and poll
+    assert jobs.polls == 3
+    assert len(gets) <= 3 * 2 * 2
+    assert all(params["from_date"].endswith("Z") for _, _, params in gets)
+
+
+@pytest.mark.asyncio
+async def test_finished_on_submit_are_yielded_without_polling(client):
+    api = FakeAPI(client, {1: -1})
+    jobs = SentimentJobs(client)
+    await jobs.submit([make_uuid(1), make_uuid(1)])
+
+    results = [sentiment async for sentiment in jobs.results()]
+    assert [s.meeting_uuid for s in results] == [make_uuid(1)]
+    assert [method for method, _, _ in api.requests] == ["POST"]
+
+
+@pytest.mark.asyncio
+async def test_submit_errors_are_returned(client):
+    FakeAPI(client, {1: 0, 2: 0}, errors={2})
+    jobs = SentimentJobs(client, interval=0)
+    errors = await jobs.submit([make_uuid(1), make_uuid(2)])
+
+    assert list(errors) == [make_uuid(2)]
+    assert isinstance(errors[make_uuid(2)], RuntimeError)
+    assert [s.meeting_uuid async for s in jobs.results()] == [make_uuid(1)]
+
+
+@pytest.mark.asyncio
+async def test_analyses_of_earlier_runs_are_ignored(client):
+    api = FakeAPI(client, {1: 2}, stale=[1])
+    jobs = SentimentJobs(client, interval=0, backoff=1)
+    await jobs.submit([make_uuid(1)])
+
+    results = [sentiment async for sentiment in jobs.results()]
+
+    assert [s.meeting_uuid for s in results] == [make_uuid(1)]
+    assert results[0].updated_at.year > 2024
+    assert jobs.polls == 3
+    assert api.polls == 3
+
+
+@pytest.mark.asyncio
+async def test_results_timeout(client):
+    FakeAPI(client, {1: 1000})
+    jobs = SentimentJobs(client, interval=0.01, backoff=1)
+    await jobs.submit([make_uuid(1)])
+
+    with pytest.raises(asyncio.TimeoutError):
+        async for _ in jobs.results(timeout=0.05):
+            pass
+    assert len(jobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_sends_status_filter(client):
+    api = FakeAPI(client, {})
+    await client.sentiments.list(from_date="2024-02-14T00:00:00Z", status="pending")
+    _, _, params = api.requests[0]
+    assert params["status"] == "pending"
+    assert params["from_date"] == "2024-02-14T00:00:00Z"
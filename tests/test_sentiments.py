@@ -140,7 +140,9 @@ async def test_get_sentiment():
     sentiment = await client.sentiments.get(meeting_id)
 
     # Verify request
-    client._request.assert_called_once_with("GET", f"/sentiments/{meeting_id}")
+    client._request.assert_called_once_with(
+        "GET", f"/sentiments/{meeting_id}", raw=True
+    )
 
     # Verify response
     assert sentiment.meeting_uuid == meeting_uuid
@@ -182,7 +184,9 @@ async def test_analyze_meeting():
     sentiment = await client.sentiments.analyze(meeting_id)
 
     # Verify request
-    client._request.assert_called_once_with("POST", f"/sentiments/{meeting_id}/analyze")
+    client._request.assert_called_once_with(
+        "POST", f"/sentiments/{meeting_id}/analyze", raw=True
+    )
 
     # Verify response
     assert sentiment.meeting_uuid == meeting_uuid
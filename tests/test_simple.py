@@ -52,6 +52,7 @@ async def test_simple_mock():
         "GET",
         "/transcriptions",
         params={"from_date": "2024-02-14T00:00:00Z", "to_date": "2024-02-14T23:59:59Z"},
+        raw=True,
     )
 
     # Check that we got the expected result
@@ -0,0 +1,142 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock
+
+from aioresponses import aioresponses
+
+from avoma import AvomaClient
+from avoma.singleflight import SingleFlight
+
+TEMPLATES_URL = "https://api.avoma.com/v1/template/"
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_in_flight_call():
+    flight = SingleFlight()
+
+    async def slow():
+        await asyncio.sleep(0.01)
+        return "done"
+
+    fn = AsyncMock(side_effect=slow)
+
+    results = await asyncio.gather(*(flight.do("key", fn) for _ in range(5)))
+
+    assert results == ["done"] * 5
+    assert fn.call_count == 1
+    assert (flight.calls, flight.shared) == (1, 4)
+    assert len(flight) == 0
+
+    # Once finished, the next call for the key starts a new one
+    await flight.do("key", fn)
+    assert fn.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_propagates_errors_to_every_waiter():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(
+        flight.do("key", fail), flight.do("key", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelling_one_waiter_keeps_the_call():
+    flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(0.01)
+        return "done"
+
+    first = asyncio.ensure_future(flight.do("key", slow))
+    second = asyncio.ensure_future(flight.do("key", slow))
+    await started.wait()
+
+    first.cancel()
+    assert await second == "done"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_call_without_waiters():
+    flight = SingleFlight()
+    cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    waiters = [asyncio.ensure_future(flight.do("key", slow)) for _ in range(2)]
+    await asyncio.sleep(0)
+    for waiter in waiters:
+        waiter.cancel()
+
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert len(flight) == 0
+
+
+@pytest.mark.asyncio
+async def test_single_flight_new_caller_does_not_join_cancelled_call():
+    flight = SingleFlight()
+
+    async def slow_to_cancel():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.01)
+            raise
+
+    async def fast():
+        return "done"
+
+    waiter = asyncio.ensure_future(flight.do("key", slow_to_cancel))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    await asyncio.sleep(0)
+
+    assert len(flight) == 0
+    assert await flight.do("key", fast) == "done"
+    assert flight.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_identical_gets():
+    client = AvomaClient("test-api-key", rate_limit=None)
+
+    with aioresponses() as mocked:
+        mocked.get(TEMPLATES_URL, payload=[])
+        # A second request would fail since only one response is mocked
+        results = await asyncio.gather(*(client.templates.list() for _ in range(3)))
+
+    await client.close()
+    assert results == [[], [], []]
+    assert client._inflight.shared == 2
+
+
+@pytest.mark.asyncio
+async def test_client_does_not_coalesce_mutations():
+    client = AvomaClient("test-api-key", rate_limit=None)
+    url = "https://api.avoma.com/v1/calls/"
+
+    with aioresponses() as mocked:
+        mocked.post(url, payload={})
+        mocked.post(url, payload={})
+        await asyncio.gather(
+            client._request("POST", "/calls", json={"subject": "Test"}),
+            client._request("POST", "/calls", json={"subject": "Test"}),
+        )
+
+    await client.close()
+    assert client._inflight.calls == 0
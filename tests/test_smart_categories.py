@@ -62,7 +62,7 @@ async def test_list_smart_categories():
     categories = await client.smart_categories.list()
 
     # Verify request was made with correct parameters
-    client._request.assert_called_once_with("GET", "/smart_categories")
+    client._request.assert_called_once_with("GET", "/smart_categories", raw=True)
 
     # Verify response
     assert len(categories) == 1
@@ -102,7 +102,9 @@ async def test_get_smart_category():
     category = await client.smart_categories.get(UUID(category_uuid))
 
     # Verify request was made with correct parameters
-    client._request.assert_called_once_with("GET", f"/smart_categories/{category_uuid}")
+    client._request.assert_called_once_with(
+        "GET", f"/smart_categories/{category_uuid}", raw=True
+    )
 
     # Verify response
     assert category.uuid == UUID(category_uuid)
@@ -144,7 +146,10 @@ async def test_create_smart_category():
 
     # Verify request was made with correct parameters
     client._request.assert_called_once_with(
-        "POST", "/smart_categories", json=new_category.model_dump(exclude_none=True)
+        "POST",
+        "/smart_categories",
+        json=new_category.model_dump(exclude_none=True),
+        raw=True,
     )
 
     # Verify response
@@ -189,6 +194,7 @@ async def test_update_smart_category():
         "PATCH",
         f"/smart_categories/{category_uuid}",
         json=update_data.model_dump(exclude_none=True),
+        raw=True,
     )
 
     # Verify response
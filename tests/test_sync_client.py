@@ -0,0 +1,156 @@
+import asyncio
+import concurrent.futures
+import json
+import threading
+import pytest
+from uuid import UUID
+
+from aioresponses import aioresponses
+
+from avoma import SyncAvomaClient
+from avoma.mirror import SQLiteMirror
+from avoma.models.meetings import Meeting
+
+MEETING_UUID = UUID("123e4567-e89b-12d3-a456-426614174000")
+
+
+def make_meeting(n=0, ready=True):
+    return {
+        "uuid": str(MEETING_UUID),
+        "subject": f"Meeting {n}",
+        "created": "2024-01-01T00:00:00Z",
+        "modified": "2024-01-01T00:00:00Z",
+        "start_at": "2024-01-01T09:00:00Z",
+        "is_private": False,
+        "is_internal": True,
+        "organizer_email": "test@example.com",
+        "state": "completed",
+        "attendees": [],
+        "audio_ready": ready,
+        "video_ready": ready,
+        "is_call": False,
+        "notes_ready": ready,
+        "transcript_ready": ready,
+    }
+
+
+def make_page(page, pages):
+    return {
+        "count": pages * 2,
+        "next": "next" if page < pages else None,
+        "previous": None,
+        "results": [make_meeting(page * 10 + n) for n in range(2)],
+    }
+
+
+@pytest.fixture
+def client():
+    client = SyncAvomaClient("test-api-key")
+    yield client
+    client.close()
+
+
+def fake_request(client, handler):
+    threads = []
+
+    async def request(method, path, params=None, raw=False):
+        threads.append(threading.current_thread())
+        return json.dumps(handler(method, path, params or {}))
+
+    client.client._request = request
+    return threads
+
+
+def test_blocking_calls_run_on_the_loop_thread(client):
+    threads = fake_request(client, lambda method, path, params: make_meeting())
+
+    meeting = client.meetings.get(MEETING_UUID)
+
+    assert isinstance(meeting, Meeting)
+    assert threads == [client._thread]
+    assert client.meetings.get.__doc__ == client.client.meetings.get.__doc__
+
+
+def test_mirror_created_on_another_thread():
+    mirror = SQLiteMirror(":memory:")
+    with SyncAvomaClient("test-api-key", mirror=mirror) as client:
+        threads = fake_request(client, lambda method, path, params: make_meeting())
+
+        assert client.meetings.get(MEETING_UUID).subject == "Meeting 0"
+        assert client.meetings.get(MEETING_UUID).subject == "Meeting 0"
+
+    # The second read was served by the mirror, from the loop thread
+    assert len(threads) == 1
+    assert mirror.get_meeting(MEETING_UUID).subject == "Meeting 0"
+
+
+def test_async_iterators_become_iterators(client):
+    fake_request(
+        client,
+        lambda method, path, params: make_page(params.get("page", 1), 3),
+    )
+
+    subjects = [m.subject for m in client.meetings.iter("2024-01-01", "2024-01-31")]
+    assert subjects == [f"Meeting {n}" for n in (10, 11, 20, 21, 30, 31)]
+
+    paginator = client.meetings.paginate("2024-01-01", "2024-01-31")
+    assert len(paginator.collect().results) == 6
+    assert len(list(paginator)) == 6
+
+    # Stopping early closes the async generator on the loop
+    pages = client.meetings.iter_pages("2024-01-01", "2024-01-31")
+    assert next(pages).results[0].subject == "Meeting 10"
+    pages.close()
+
+
+def test_futures_become_concurrent_futures(client):
+    fake_request(client, lambda method, path, params: make_meeting())
+
+    futures = client.meetings.wait_until_ready([MEETING_UUID])
+
+    assert isinstance(futures[MEETING_UUID], concurrent.futures.Future)
+    assert futures[MEETING_UUID].result(timeout=1).transcript_ready
+
+
+def test_errors_are_raised_in_the_caller(client):
+    def handler(method, path, params):
+        raise ValueError("boom")
+
+    fake_request(client, handler)
+    with pytest.raises(ValueError):
+        client.meetings.get(MEETING_UUID)
+
+
+def test_threads_share_one_session():
+    with SyncAvomaClient("test-api-key", rate_limit=None) as client:
+        with aioresponses() as mocked:
+            url = f"https://api.avoma.com/v1/meetings/{MEETING_UUID}/"
+            mocked.get(url, payload=make_meeting(), repeat=True)
+
+            with concurrent.futures.ThreadPoolExecutor(8) as pool:
+                meetings = list(
+                    pool.map(lambda _: client.meetings.get(MEETING_UUID), range(16))
+                )
+
+            assert all(m.uuid == MEETING_UUID for m in meetings)
+            session = client.client._session
+            assert session is not None
+            client.meetings.get(MEETING_UUID)
+            assert client.client._session is session
+
+
+def test_run_and_close():
+    client = SyncAvomaClient("test-api-key")
+
+    async def loop_thread():
+        await asyncio.sleep(0)
+        return threading.current_thread()
+
+    assert client.run(loop_thread()) is client._thread
+    assert client.rate_limiter is client.client.rate_limiter
+
+    client.close()
+    assert not client._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        client.meetings.get(MEETING_UUID)
+    client.close()
@@ -6,6 +6,7 @@ import json
 from unittest.mock import AsyncMock
 
 from avoma import AvomaClient
+from avoma.models.transcriptions import CompactTranscription, Transcription
 from yarl import URL
 
 
@@ -52,6 +53,7 @@ async def test_list_transcriptions():
         "GET",
         "/transcriptions",
         params={"from_date": "2024-02-14T00:00:00Z", "to_date": "2024-02-14T23:59:59Z"},
+        raw=True,
     )
 
     # Verify the response was processed correctly
@@ -99,6 +101,7 @@ async def test_list_transcriptions_by_meeting():
             "to_date": "2024-02-14T23:59:59Z",
             "meeting_uuid": meeting_uuid,
         },
+        raw=True,
     )
 
     # Verify the response
@@ -138,7 +141,7 @@ async def test_get_transcription():
 
     # Verify the mock was called with correct URL path
     client._request.assert_called_once_with(
-        "GET", f"/transcriptions/{transcription_uuid}"
+        "GET", f"/transcriptions/{transcription_uuid}", raw=True
     )
 
     # Verify the response
@@ -147,3 +150,155 @@ async def test_get_transcription():
     assert transcription.transcript[0].transcript == "Hello, how are you?"
     assert len(transcription.speakers) == 1
     assert transcription.speakers[0].email == "speaker@example.com"
+
+
+def multi_segment_transcription():
+    return {
+        "uuid": "123e4567-e89b-12d3-a456-426614174000",
+        "transcript": [
+            {
+                "transcript": "Hello, how are you?",
+                "timestamps": [0.0, 0.5, 1.0, 1.5],
+                "speaker_id": 1,
+            },
+            {
+                "transcript": "Great, thanks.",
+                "timestamps": [2.0, 2.4],
+                "speaker_id": 2,
+            },
+            {
+                "transcript": "Let's get started with the demo",
+                "timestamps": [3.0, 3.2, 3.4, 3.6, 3.8, 4.0],
+                "speaker_id": 1,
+            },
+        ],
+        "speakers": [
+            {"email": "rep@example.com", "id": 1, "is_rep": True},
+            {"email": "prospect@example.com", "id": 2, "is_rep": False},
+        ],
+        "transcription_vtt_url": "https://example.com/transcript.vtt",
+    }
+
+
+def test_compact_transcription_round_trip():
+    transcription = Transcription.model_validate(multi_segment_transcription())
+
+    compact = transcription.compact()
+
+    assert len(compact) == 3
+    assert len(compact.timestamps) == 12
+    assert list(compact.word_offsets) == [0, 4, 6, 12]
+    assert list(compact.speaker_ids) == [1, 2, 1]
+    assert compact.uuid == transcription.uuid
+
+    segment = compact.transcript[1]
+    assert segment.transcript == "Great, thanks."
+    assert list(segment.timestamps) == [2.0, 2.4]
+    assert segment.speaker_id == 2
+    assert compact[-1].transcript == "Let's get started with the demo"
+    assert [s.speaker_id for s in compact[:2]] == [1, 2]
+    with pytest.raises(IndexError):
+        compact[3]
+
+    assert compact.to_transcription() == transcription
+
+
+@pytest.mark.asyncio
+async def test_get_compact_transcription():
+    client = AvomaClient("test-api-key")
+    client._request = AsyncMock(return_value=multi_segment_transcription())
+
+    transcription = await client.transcriptions.get(
+        UUID("123e4567-e89b-12d3-a456-426614174000"), compact=True
+    )
+
+    assert isinstance(transcription, CompactTranscription)
+    assert [s.transcript for s in transcription][0] == "Hello, how are you?"
+
+
+def test_transcript_time_index():
+    transcription = Transcription.model_validate(multi_segment_transcription())
+
+    assert transcription.segment_at(-1.0) is None
+    assert transcription.segment_at(0.0).transcript == "Hello, how are you?"
+    # Silence between segments belongs to the segment that was last started
+    assert transcription.segment_at(1.8).speaker_id == 1
+    assert transcription.segment_at(2.4).transcript == "Great, thanks."
+    assert transcription.segment_at(4.0).speaker_id == 1
+    assert transcription.segment_at(4.1) is None
+
+    words = transcription.words_between(1.0, 3.2)
+    assert [(w.time, w.word, w.speaker_id) for w in words] == [
+        (1.0, "are", 1),
+        (1.5, "you?", 1),
+        (2.0, "Great,", 2),
+        (2.4, "thanks.", 2),
+        (3.0, "Let's", 1),
+        (3.2, "get", 1),
+    ]
+    assert transcription.words_between(5.0, 6.0) == []
+
+    segments = transcription.slice(1.2, 3.5)
+    assert [(s.transcript, s.speaker_id) for s in segments] == [
+        ("you?", 1),
+        ("Great, thanks.", 2),
+        ("Let's get started", 1),
+    ]
+    assert segments[2].timestamps == [3.0, 3.2, 3.4]
+
+    # The index is built once and doesn't affect equality
+    assert transcription.index is transcription.index
+    assert transcription == Transcription.model_validate(multi_segment_transcription())
+
+    # Nor does it leak into copies' fields, or outlive a replaced transcript
+    copy = transcription.model_copy(update={"transcript": segments})
+    assert "index" not in copy.__dict__
+    assert copy.index is not transcription.index
+    assert copy.segment_at(0.0) is None
+    assert transcription.model_copy().index is transcription.index
+
+
+def test_compact_transcript_time_index():
+    compact = Transcription.model_validate(multi_segment_transcription()).compact()
+
+    assert compact.segment_at(2.1).transcript == "Great, thanks."
+    assert [w.word for w in compact.words_between(3.3, 3.7)] == ["started", "with"]
+    assert compact.slice(0.0, 0.5)[0].transcript == "Hello, how"
+
+
+def test_transcript_time_index_with_overlapping_speech():
+    transcription = Transcription.model_validate(
+        {
+            **multi_segment_transcription(),
+            "transcript": [
+                {
+                    "transcript": "So as I said",
+                    "timestamps": [0.0, 1.0, 2.0, 10.0],
+                    "speaker_id": 1,
+                },
+                {
+                    "transcript": "Sure, right",
+                    "timestamps": [3.0, 4.0],
+                    "speaker_id": 2,
+                },
+                {"transcript": "Anyway", "timestamps": [11.0], "speaker_id": 1},
+            ],
+        }
+    )
+
+    assert [(w.word, w.segment) for w in transcription.words_between(3, 4)] == [
+        ("Sure,", 1),
+        ("right", 1),
+    ]
+    assert [(w.time, w.word) for w in transcription.words_between(9, 11)] == [
+        (10.0, "said"),
+        (11.0, "Anyway"),
+    ]
+    assert [w.time for w in transcription.words_between(1.5, 10)] == [2, 3, 4, 10]
+    assert [(s.transcript, s.timestamps) for s in transcription.slice(1.5, 3.5)] == [
+        ("I", [2.0]),
+        ("Sure,", [3.0]),
+    ]
+    assert transcription.segment_at(3.5).speaker_id == 2
+    assert transcription.segment_at(11.0).transcript == "Anyway"
+    assert transcription.segment_at(11.5) is None
@@ -0,0 +1,68 @@
+import pytest
+
+import aiohttp
+from aioresponses import aioresponses
+
+from avoma import AvomaClient, TransportConfig
+
+
+@pytest.mark.asyncio
+async def test_session_uses_transport_config():
+    transport = TransportConfig(
+        limit=20,
+        limit_per_host=5,
+        keepalive_timeout=15.0,
+        connect_timeout=3.0,
+        read_timeout=20.0,
+        total_timeout=120.0,
+    )
+    client = AvomaClient("test-api-key", transport=transport)
+
+    session = client.session
+    assert session.connector.limit == 20
+    assert session.connector.limit_per_host == 5
+    assert session.timeout == aiohttp.ClientTimeout(
+        total=120.0, connect=3.0, sock_read=20.0
+    )
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_default_transport_sets_timeouts():
+    client = AvomaClient("test-api-key")
+
+    assert client.session.timeout.connect == 10.0
+    assert client.session.timeout.sock_read == 60.0
+    await client.close()
+
+
+def test_ssl_context_is_shared():
+    transport = TransportConfig()
+    assert transport.ssl_context is transport.ssl_context
+
+
+@pytest.mark.asyncio
+async def test_context_manager_prewarms_connections():
+    transport = TransportConfig(prewarm=3)
+
+    with aioresponses() as mocked:
+        mocked.head("https://api.avoma.com", repeat=True)
+        async with AvomaClient(
+            "test-api-key", transport=transport, rate_limit=None
+        ) as client:
+            pass
+
+    calls = [key for key in mocked.requests if key[0] == "HEAD"]
+    assert len(mocked.requests[calls[0]]) == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_ignores_failures():
+    client = AvomaClient("test-api-key")
+
+    with aioresponses() as mocked:
+        mocked.head("https://api.avoma.com", exception=aiohttp.ClientConnectionError())
+        mocked.head("https://api.avoma.com")
+        assert await client.warm_up(2) == 1
+
+    await client.close()
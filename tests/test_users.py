@@ -47,7 +47,7 @@ async def test_list_users():
     users = await client.users.list()
 
     # Verify request was made with correct parameters
-    client._request.assert_called_once_with("GET", "/users", params={})
+    client._request.assert_called_once_with("GET", "/users", params={}, raw=True)
 
     # Verify response
     assert users.count == 1
@@ -87,7 +87,7 @@ async def test_get_user():
     user = await client.users.get(UUID(user_uuid))
 
     # Verify request was made with correct parameters
-    client._request.assert_called_once_with("GET", f"/users/{user_uuid}")
+    client._request.assert_called_once_with("GET", f"/users/{user_uuid}", raw=True)
 
     # Verify response
     assert str(user.uuid) == user_uuid
@@ -133,7 +133,7 @@ async def test_create_user():
 
     # Verify request was made with correct parameters
     client._request.assert_called_once_with(
-        "POST", "/users", json=user_data.model_dump(exclude_none=True)
+        "POST", "/users", json=user_data.model_dump(exclude_none=True), raw=True
     )
 
     # Verify response
@@ -176,7 +176,10 @@ async def test_update_user():
 
     # Verify request was made with correct parameters
     client._request.assert_called_once_with(
-        "PUT", f"/users/{user_uuid}", json=update_data.model_dump(exclude_none=True)
+        "PUT",
+        f"/users/{user_uuid}",
+        json=update_data.model_dump(exclude_none=True),
+        raw=True,
     )
 
     # Verify response
@@ -224,7 +227,7 @@ async def test_get_current_user():
     user = await client.users.get_current()
 
     # Verify request was made with correct parameters
-    client._request.assert_called_once_with("GET", "/users/me")
+    client._request.assert_called_once_with("GET", "/users/me", raw=True)
 
     # Verify response
     assert user.email == "current.user@example.com"
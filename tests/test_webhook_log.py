@@ -0,0 +1,103 @@
+import json
+import pytest
+from datetime import datetime, timezone
+
+from avoma.models.webhooks import AINoteEvent
+from avoma.webhook_log import WebhookLog, event_key
+from avoma.webhooks import parse_event
+
+MEETING_UUID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def make_body(hour, subject="Weekly sync"):
+    return json.dumps(
+        {
+            "event_type": "AINOTE",
+            "uuid": MEETING_UUID,
+            "subject": subject,
+            "modified": f"2024-01-01T{hour:02d}:00:00Z",
+        }
+    ).encode()
+
+
+def append(log, body, received=None):
+    return log.append(event_key(parse_event(body), body), body, received)
+
+
+def test_event_key():
+    body = make_body(12)
+    assert event_key(parse_event(body), body) == (
+        f"AINOTE:{MEETING_UUID}:2024-01-01T12:00:00+00:00"
+    )
+    # Payload changes without a new modified time are the same event
+    other = make_body(12, subject="Renamed")
+    assert event_key(parse_event(other), other) == event_key(parse_event(body), body)
+
+    scheduler = {
+        "event_type": "MEETING_BOOKED_VIA_SCHEDULER",
+        "uuid": MEETING_UUID,
+        "meeting_uuid": MEETING_UUID,
+    }
+    first = json.dumps(dict(scheduler, subject="a")).encode()
+    second = json.dumps(dict(scheduler, subject="b")).encode()
+    assert event_key(parse_event(first), first) != event_key(
+        parse_event(second), second
+    )
+
+
+def test_log_deduplicates_across_reopen(tmp_path):
+    with WebhookLog(tmp_path) as log:
+        assert append(log, make_body(1))
+        assert not append(log, make_body(1))
+        assert append(log, make_body(2))
+
+    with WebhookLog(tmp_path) as log:
+        assert len(log) == 2
+        assert not append(log, make_body(2))
+        assert [event.modified.hour for event in log.replay()] == [1, 2]
+
+
+def test_log_replays_since(tmp_path):
+    with WebhookLog(tmp_path) as log:
+        for hour in range(4):
+            received = datetime(2024, 1, 1, hour, tzinfo=timezone.utc).timestamp()
+            append(log, make_body(hour), received)
+
+        since = datetime(2024, 1, 1, 2, tzinfo=timezone.utc)
+        events = list(log.replay(since))
+    assert all(isinstance(event, AINoteEvent) for event in events)
+    assert [event.modified.hour for event in events] == [2, 3]
+
+
+def test_log_rotates_and_drops_old_segments(tmp_path):
+    size = len(make_body(0))
+    with WebhookLog(tmp_path, segment_size=size * 2, max_segments=2) as log:
+        for hour in range(10):
+            append(log, make_body(hour))
+
+        assert len(list(tmp_path.glob("*.log"))) == 2
+        replayed = [event.modified.hour for event in log.replay()]
+        assert replayed == [6, 7, 8, 9]
+        assert len(log) == 4
+        # Keys of dropped segments are forgotten
+        assert append(log, make_body(0))
+
+
+def test_log_drops_torn_frame(tmp_path):
+    with WebhookLog(tmp_path) as log:
+        append(log, make_body(1))
+        append(log, make_body(2))
+    segment = next(tmp_path.glob("*.log"))
+    data = segment.read_bytes()
+    segment.write_bytes(data[:-5])
+
+    with WebhookLog(tmp_path) as log:
+        assert [event.modified.hour for event in log.replay()] == [1]
+        assert append(log, make_body(2))
+        assert [event.modified.hour for event in log.replay()] == [1, 2]
+
+
+@pytest.mark.parametrize("max_segments", [0, -1])
+def test_log_rejects_invalid_max_segments(tmp_path, max_segments):
+    with pytest.raises(ValueError):
+        WebhookLog(tmp_path, max_segments=max_segments)
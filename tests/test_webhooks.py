@@ -0,0 +1,218 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import pytest
+from uuid import UUID
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from avoma.models.webhooks import AINoteEvent, MeetingRescheduledEvent
+from avoma.webhook_log import WebhookLog
+from avoma.webhooks import WebhookReceiver, parse_event, verify_signature
+
+MEETING_UUID = "123e4567-e89b-12d3-a456-426614174000"
+
+AINOTE = {
+    "event_type": "AINOTE",
+    "uuid": MEETING_UUID,
+    "subject": "Weekly sync",
+    "created": "2024-01-01T10:00:00Z",
+    "modified": "2024-01-01T12:00:00Z",
+    "start_at": "2024-01-01T10:00:00Z",
+    "end_at": "2024-01-01T11:00:00Z",
+    "duration": 3600.0,
+    "privacy": "organization",
+    "attendees": [
+        {
+            "email": "test@example.com",
+            "name": "Test User",
+            "response_status": "accepted",
+            "uuid": "123e4567-e89b-12d3-a456-426614174001",
+        }
+    ],
+    "insights": {
+        "sentiment": {
+            "sentiment": 0.4,
+            "sentiment_ranges": [{"range": "0-60", "sentiment_value": 0.4}],
+        },
+        "longest_monologue": {"rep": {"segments": [[1.5, 20.0]], "speaker_id": "1"}},
+        "talk_stats": {"talk_percentage": 55.0, "total_talk_time": 1800.0},
+    },
+    "transcript_ready": True,
+    "notes_ready": True,
+    "transcription_vtt_url": "https://example.com/transcript.vtt",
+}
+
+RESCHEDULED = {
+    "event_type": "MEETING_BOOKED_VIA_SCHEDULER_RESCHEDULED",
+    "uuid": "123e4567-e89b-12d3-a456-426614174002",
+    "meeting_uuid": MEETING_UUID,
+    "event_start_time": "2024-01-02T10:00:00Z",
+    "event_end_time": "2024-01-02T10:30:00Z",
+    "invitee_details": {"email": "guest@example.com", "tz": "UTC"},
+    "invitee_responses": [{"question": "Topic?", "response": "Pricing"}],
+    "purpose": None,
+}
+
+
+def sign(secret, body):
+    return hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+
+def test_parse_event_picks_model_by_event_type():
+    event = parse_event(json.dumps(AINOTE).encode())
+    assert isinstance(event, AINoteEvent)
+    assert event.meeting_uuid == UUID(MEETING_UUID)
+    assert event.insights.sentiment.sentiment_ranges[0].sentiment_value == 0.4
+    assert event.insights.longest_monologue.rep.segments == [[1.5, 20.0]]
+
+    event = parse_event(json.dumps(RESCHEDULED).encode())
+    assert isinstance(event, MeetingRescheduledEvent)
+    assert event.meeting_uuid == UUID(MEETING_UUID)
+    assert event.invitee_responses[0].response == "Pricing"
+
+
+def test_verify_signature():
+    body = json.dumps(AINOTE).encode()
+    assert verify_signature("secret", body, sign("secret", body))
+    assert not verify_signature("secret", body, sign("other", body))
+    assert not verify_signature("secret", body, None)
+
+
+@pytest.mark.asyncio
+async def test_receiver_handles_events():
+    handled = []
+
+    async def handler(event):
+        handled.append(event)
+
+    receiver = WebhookReceiver(handler, workers=2)
+    async with TestClient(TestServer(receiver.application())) as client:
+        for payload in (AINOTE, RESCHEDULED):
+            response = await client.post("/webhooks", data=json.dumps(payload))
+            assert response.status == 200
+
+    # Queued events are handled before the workers stop
+    assert [type(event) for event in handled] == [
+        AINoteEvent,
+        MeetingRescheduledEvent,
+    ]
+    assert receiver.stats() == {
+        "received": 2,
+        "rejected": 0,
+        "duplicates": 0,
+        "overloaded": 0,
+        "processed": 2,
+        "failed": 0,
+        "queued": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_receiver_rejects_invalid_requests():
+    handled = []
+    receiver = WebhookReceiver(handled.append, secret="secret")
+    async with TestClient(TestServer(receiver.application())) as client:
+        body = json.dumps(AINOTE).encode()
+        response = await client.post("/webhooks", data=body)
+        assert response.status == 401
+        response = await client.post(
+            "/webhooks", data=body, headers={"X-Avoma-Signature": sign("other", body)}
+        )
+        assert response.status == 401
+
+        body = json.dumps({"event_type": "UNKNOWN", "uuid": MEETING_UUID}).encode()
+        response = await client.post(
+            "/webhooks", data=body, headers={"X-Avoma-Signature": sign("secret", body)}
+        )
+        assert response.status == 400
+
+        body = json.dumps(AINOTE).encode()
+        response = await client.post(
+            "/webhooks", data=body, headers={"X-Avoma-Signature": sign("secret", body)}
+        )
+        assert response.status == 200
+
+    assert len(handled) == 1
+    assert receiver.rejected == 3
+
+
+@pytest.mark.asyncio
+async def test_receiver_applies_backpressure():
+    unblock = asyncio.Event()
+
+    async def handler(event):
+        await unblock.wait()
+
+    receiver = WebhookReceiver(handler, workers=1, queue_size=1, enqueue_timeout=0.05)
+    async with TestClient(TestServer(receiver.application())) as client:
+        body = json.dumps(AINOTE)
+        # One event is being handled, one waits in the queue
+        assert (await client.post("/webhooks", data=body)).status == 200
+        await asyncio.sleep(0)
+        assert (await client.post("/webhooks", data=body)).status == 200
+
+        response = await client.post("/webhooks", data=body)
+        assert response.status == 503
+        assert "Retry-After" in response.headers
+        unblock.set()
+
+    assert receiver.received == 2
+    assert receiver.overloaded == 1
+    assert receiver.processed == 2
+
+
+@pytest.mark.asyncio
+async def test_handler_failures_are_counted():
+    def handler(event):
+        raise RuntimeError("boom")
+
+    receiver = WebhookReceiver(handler)
+    async with TestClient(TestServer(receiver.application())) as client:
+        response = await client.post("/webhooks", data=json.dumps(AINOTE))
+        assert response.status == 200
+
+    assert receiver.failed == 1
+    assert receiver.processed == 0
+
+
+@pytest.mark.asyncio
+async def test_receiver_skips_redelivered_events(tmp_path):
+    handled = []
+    log = WebhookLog(tmp_path)
+    receiver = WebhookReceiver(handled.append, log=log)
+    async with TestClient(TestServer(receiver.application())) as client:
+        body = json.dumps(AINOTE)
+        for _ in range(3):
+            assert (await client.post("/webhooks", data=body)).status == 200
+        # A new version of the meeting is a new event
+        updated = dict(AINOTE, modified="2024-01-01T13:00:00Z")
+        assert (await client.post("/webhooks", data=json.dumps(updated))).status == 200
+
+    assert [event.modified.hour for event in handled] == [12, 13]
+    assert receiver.duplicates == 2
+    assert len(log) == 2
+    log.close()
+
+
+@pytest.mark.asyncio
+async def test_receiver_replays_logged_events(tmp_path):
+    with WebhookLog(tmp_path) as log:
+        receiver = WebhookReceiver(lambda event: None, log=log)
+        async with TestClient(TestServer(receiver.application())) as client:
+            for payload in (AINOTE, RESCHEDULED):
+                await client.post("/webhooks", data=json.dumps(payload))
+
+    # After a consumer outage, a new process replays the log
+    handled = []
+    with WebhookLog(tmp_path) as log:
+        receiver = WebhookReceiver(handled.append, log=log)
+        await receiver.start()
+        assert await receiver.replay() == 2
+        await receiver.stop()
+
+    assert [type(event) for event in handled] == [
+        AINoteEvent,
+        MeetingRescheduledEvent,
+    ]